@@ -22,7 +22,7 @@ def cli():
               help='Data sources to scrape')
 @click.option('--max-companies', '-m', default=10, help='Max companies per source')
 @click.option('--output', '-o', default='leads', help='Output filename')
-@click.option('--format', '-f', default='csv', type=click.Choice(['csv', 'json', 'excel']), help='Output format')
+@click.option('--format', '-f', default='csv', type=click.Choice(['csv', 'json', 'jsonl', 'excel']), help='Output format')
 def scrape(sources, max_companies, output, format):
     """Run the scraping pipeline."""
     # We can reconstruct the args expectation of main.py or refactor main.py to be importable logic
@@ -10,5 +10,7 @@ __all__ = [
     "crunchbase",
     "clutch",
     "job_boards",
-    "selenium_scraper"
+    "selenium_scraper",
+    "driver_pool",
+    "playwright_scraper"
 ]
@@ -5,10 +5,14 @@ Scraper for AngelList (now Wellfound) to collect startup data.
 Extracts funding information, team size, job postings, and company details.
 """
 
+import re
 import time
-from typing import Optional, List
+from itertools import islice
+from typing import Optional, Iterator, List
 from urllib.parse import urljoin
 
+import pandas as pd
+
 from collectors.base_scraper import BaseScraper
 from models.schemas import (
     Company, CompanyEnrichment, FundingInfo, HiringIntent,
@@ -16,10 +20,27 @@ from models.schemas import (
     FundingStage
 )
 from utils.logger import get_logger
-from utils.helpers import extract_domain, clean_text, clean_company_name
+from utils.helpers import extract_domain, clean_text, clean_company_name, clean_company_names
 
 logger = get_logger(__name__)
 
+# Wellfound size ranges -> (CompanySize, representative employee count)
+_SIZE_MAP = [
+    ('1-10', CompanySize.STARTUP, 5),
+    ('11-50', CompanySize.SMALL, 30),
+    ('51-200', CompanySize.MEDIUM, 125),
+    ('201-1000', CompanySize.LARGE, 600),
+    ('1000+', CompanySize.ENTERPRISE, 2000),
+]
+_SIZE_LOOKUP = {label: (size, employees) for label, size, employees in _SIZE_MAP}
+_SIZE_RE = re.compile('|'.join(re.escape(label) for label, _, _ in _SIZE_MAP))
+
+# First number in a job-count label, allowing thousands separators ("1,200 jobs")
+_DIGITS_RE = re.compile(r'\d[\d,]*')
+
+# "City[, Region], Country" -> (city, country); country is None without a comma
+_LOC_RE = re.compile(r'^\s*([^,]*?)\s*(?:,(?:.*,)?\s*([^,]*?))?\s*$')
+
 
 class AngelListScraper(BaseScraper):
     """
@@ -29,8 +50,23 @@ class AngelListScraper(BaseScraper):
     This scraper is for educational purposes. Use official API when possible.
     """
     
+    __slots__ = ()
+    
     BASE_URL = "https://wellfound.com"
     
+    # Listing selectors, defined once per class rather than per card
+    _SEL_CARD = 'div[class*="company" i]'
+    # Name and description: the heading/paragraph wins over the class match,
+    # wherever each appears in the card
+    _SEL_NAME = 'h2'
+    _SEL_NAME_FALLBACK = 'a[class*="name" i]'
+    _SEL_DESC = 'p'
+    _SEL_DESC_FALLBACK = 'div[class*="description" i]'
+    _SEL_LINK = 'a[href]'
+    _SEL_LOC = 'span[class*="location" i]'
+    _SEL_SIZE = 'span[class*="size" i]'
+    _SEL_JOBS = 'span[class*="job" i]'
+    
     def __init__(self, **kwargs):
         """Initialize AngelList scraper."""
         super().__init__(source=DataSource.ANGELLIST, **kwargs)
@@ -71,18 +107,16 @@ class AngelListScraper(BaseScraper):
             
             logger.info(f"Scraping AngelList: {search_url}")
             
-            soup = self.get_soup(search_url)
-            if not soup:
+            tree = self.get_tree(search_url, fallback_selector=self._SEL_CARD)
+            if not tree:
                 result.add_error("Failed to fetch AngelList search page")
                 return result
             
-            # Parse company listings
-            companies_data = self._parse_company_listings(soup)
+            # Parse company listings lazily; stop walking cards at the limit
+            companies_data = list(islice(self._iter_company_listings(tree), max_companies))
             
-            for company_data in companies_data[:max_companies]:
-                company = self.parse_company(company_data)
-                if company:
-                    result.add_company(company)
+            for company in self.parse_companies(companies_data):
+                result.add_unique_company(company)
             
             result.execution_time = time.time() - start_time
             logger.info(
@@ -96,54 +130,49 @@ class AngelListScraper(BaseScraper):
         
         return result
     
-    def _parse_company_listings(self, soup) -> List[dict]:
-        """Parse company listings from search results."""
-        companies = []
-        
+    def _iter_company_listings(self, tree) -> Iterator[dict]:
+        """Yield company listings from search results as cards are parsed."""
         try:
             # Example selectors (adjust based on actual structure)
-            company_cards = soup.find_all('div', class_=lambda x: x and 'company' in str(x).lower())
+            company_cards = tree.css(self._SEL_CARD)
             
             for card in company_cards:
                 try:
                     company_data = {}
                     
                     # Company name
-                    name_elem = card.find('h2') or card.find('a', class_=lambda x: x and 'name' in str(x).lower())
+                    name_elem = card.css_first(self._SEL_NAME) or card.css_first(self._SEL_NAME_FALLBACK)
                     if name_elem:
-                        company_data['name'] = clean_text(name_elem.get_text())
+                        company_data['name'] = clean_text(name_elem.text())
                     
                     # Description
-                    desc_elem = card.find('p') or card.find('div', class_=lambda x: x and 'description' in str(x).lower())
+                    desc_elem = card.css_first(self._SEL_DESC) or card.css_first(self._SEL_DESC_FALLBACK)
                     if desc_elem:
-                        company_data['description'] = clean_text(desc_elem.get_text())
+                        company_data['description'] = clean_text(desc_elem.text())
                     
                     # Company URL
-                    link_elem = card.find('a', href=True)
+                    link_elem = card.css_first(self._SEL_LINK)
                     if link_elem:
-                        company_data['url'] = urljoin(self.BASE_URL, link_elem['href'])
+                        company_data['url'] = urljoin(self.BASE_URL, link_elem.attributes['href'])
                     
                     # Location
-                    location_elem = card.find('span', class_=lambda x: x and 'location' in str(x).lower())
+                    location_elem = card.css_first(self._SEL_LOC)
                     if location_elem:
-                        company_data['location'] = clean_text(location_elem.get_text())
+                        company_data['location'] = clean_text(location_elem.text())
                     
                     # Company size
-                    size_elem = card.find('span', class_=lambda x: x and 'size' in str(x).lower())
+                    size_elem = card.css_first(self._SEL_SIZE)
                     if size_elem:
-                        company_data['size'] = clean_text(size_elem.get_text())
+                        company_data['size'] = clean_text(size_elem.text())
                     
                     # Job count
-                    jobs_elem = card.find('span', class_=lambda x: x and 'job' in str(x).lower())
+                    jobs_elem = card.css_first(self._SEL_JOBS)
                     if jobs_elem:
-                        jobs_text = jobs_elem.get_text()
-                        try:
-                            company_data['job_count'] = int(''.join(filter(str.isdigit, jobs_text)))
-                        except ValueError:
-                            company_data['job_count'] = 0
+                        match = _DIGITS_RE.search(jobs_elem.text())
+                        company_data['job_count'] = int(match.group().replace(',', '')) if match else 0
                     
                     if company_data.get('name'):
-                        companies.append(company_data)
+                        yield company_data
                 
                 except Exception as e:
                     logger.warning(f"Error parsing company card: {e}")
@@ -151,8 +180,6 @@ class AngelListScraper(BaseScraper):
         
         except Exception as e:
             logger.error(f"Error parsing company listings: {e}")
-        
-        return companies
     
     def parse_company(self, data: dict) -> Optional[Company]:
         """Parse company from AngelList data."""
@@ -161,72 +188,115 @@ class AngelListScraper(BaseScraper):
             if not name:
                 return None
             
-            company_name = clean_company_name(name)
-            
             # Parse location
             location_text = data.get('location', '')
-            country = None
-            city = None
-            if location_text:
-                parts = location_text.split(',')
-                if len(parts) >= 2:
-                    city = parts[0].strip()
-                    country = parts[-1].strip()
-                elif len(parts) == 1:
-                    city = parts[0].strip()
+            match = _LOC_RE.match(location_text) if location_text else None
+            city, country = match.groups() if match else (None, None)
             
             # Parse company size
             size_text = data.get('size', '')
-            company_size = CompanySize.UNKNOWN
-            employee_count = None
-            
-            if size_text:
-                if '1-10' in size_text:
-                    company_size = CompanySize.STARTUP
-                    employee_count = 5
-                elif '11-50' in size_text:
-                    company_size = CompanySize.SMALL
-                    employee_count = 30
-                elif '51-200' in size_text:
-                    company_size = CompanySize.MEDIUM
-                    employee_count = 125
-                elif '201-1000' in size_text:
-                    company_size = CompanySize.LARGE
-                    employee_count = 600
-                elif '1000+' in size_text:
-                    company_size = CompanySize.ENTERPRISE
-                    employee_count = 2000
-            
-            # Create enrichment
-            enrichment = CompanyEnrichment(
-                company_size=company_size,
-                employee_count=employee_count,
-                geographic_info=GeographicInfo(
-                    country=country,
-                    city=city
-                ),
-                hiring_intent=HiringIntent(
-                    total_open_positions=data.get('job_count', 0),
-                    is_hiring=data.get('job_count', 0) > 0
-                ),
-                tags=['angellist', 'startup']
+            match = _SIZE_RE.search(size_text) if size_text else None
+            company_size, employee_count = (
+                _SIZE_LOOKUP[match.group()] if match else (CompanySize.UNKNOWN, None)
             )
             
-            company = Company(
-                name=company_name,
+            return self._build_company(
+                name=clean_company_name(name),
                 description=data.get('description'),
-                source=self.source,
-                source_url=data.get('url'),
-                enrichment=enrichment
+                url=data.get('url'),
+                city=city,
+                country=country,
+                company_size=company_size,
+                employee_count=employee_count,
+                job_count=data.get('job_count', 0)
             )
             
-            logger.debug(f"Parsed company: {company_name}")
-            return company
-            
         except Exception as e:
             logger.error(f"Error parsing company from data: {e}")
             return None
-
+    
+    def _parse_companies_batch(self, rows: List[dict]) -> List[Company]:
+        """
+        Normalize a large batch of listings column-wise with pandas.
+        
+        Name cleaning, size mapping and location splitting run once per
+        column instead of once per company; only model construction
+        remains per row.
+        """
+        df = pd.DataFrame(
+            rows, columns=['name', 'description', 'url', 'location', 'size', 'job_count']
+        )
+        df = df[df['name'].fillna('') != '']
+        
+        names = clean_company_names(df['name'])
+        sizes = df['size'].fillna('').str.extract(f"({_SIZE_RE.pattern})", expand=False)
+        sizes = sizes.map(_SIZE_LOOKUP)
+        locations = df['location'].fillna('').str.extract(_LOC_RE)
+        job_counts = df['job_count'].fillna(0).astype(int)
+        
+        # Plain Python values (None instead of NaN) for the pydantic models
+        df = df.astype(object).where(df.notna(), None)
+        
+        companies = []
+        for row, name, size, city, country, job_count in zip(
+            df.itertuples(index=False), names, sizes,
+            locations[0], locations[1], job_counts
+        ):
+            company_size, employee_count = (
+                size if isinstance(size, tuple) else (CompanySize.UNKNOWN, None)
+            )
+            try:
+                companies.append(self._build_company(
+                    name=name,
+                    description=row.description,
+                    url=row.url,
+                    city=city or None,
+                    country=country if isinstance(country, str) else None,
+                    company_size=company_size,
+                    employee_count=employee_count,
+                    job_count=job_count
+                ))
+            except Exception as e:
+                logger.error(f"Error parsing company from data: {e}")
+        
+        return companies
+    
+    def _build_company(
+        self,
+        name: str,
+        description: Optional[str],
+        url: Optional[str],
+        city: Optional[str],
+        country: Optional[str],
+        company_size: CompanySize,
+        employee_count: Optional[int],
+        job_count: int
+    ) -> Company:
+        """Assemble a Company from already-normalized listing fields."""
+        enrichment = CompanyEnrichment(
+            company_size=company_size,
+            employee_count=employee_count,
+            geographic_info=GeographicInfo(
+                country=country,
+                city=city
+            ),
+            hiring_intent=HiringIntent(
+                total_open_positions=job_count,
+                is_hiring=job_count > 0
+            ),
+            tags=['angellist', 'startup']
+        )
+        
+        company = Company(
+            name=name,
+            description=description,
+            source=self.source,
+            source_url=url,
+            enrichment=enrichment
+        )
+        
+        logger.debug("Parsed company: %s", name)
+        return company
 
 if __name__ == "__main__":
     print("AngelList Scraper")
@@ -5,20 +5,229 @@ Abstract base class for all scrapers with built-in retry logic,
 rate limiting, error handling, and robots.txt compliance.
 """
 
+import os
 import time
+import atexit
+import hashlib
+import asyncio
+import functools
+import itertools
+import threading
+import multiprocessing
+import aiohttp
+import diskcache
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry, make_headers
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse, urlencode
+from urllib.robotparser import RobotFileParser
+from typing import List, Optional, Dict, Any, Callable, Union
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from lxml import html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 
-from config import settings
+from config import settings, get_user_agent_source
 from utils.logger import get_logger
-from utils.helpers import retry_on_exception, check_robots_txt, validate_url
+from utils.helpers import validate_url
 from models.schemas import Company, ScrapingResult, DataSource
 
 logger = get_logger(__name__)
 
+# Parsed robots.txt per host, shared by all scrapers in the process;
+# entries older than settings.robots_cache_ttl are fetched again
+_robots_cache: Dict[str, RobotFileParser] = {}
+_robots_lock = threading.Lock()
+
+# Only advertise encodings urllib3 can actually decode (br/zstd need extras)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+# Transient statuses retried at the transport layer (honours Retry-After)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Number of user agents pre-sampled per scraper for rotation
+UA_POOL_SIZE = 32
+
+# Keep-alive connections kept per host; threaded fetchers stay at or below it
+POOL_MAXSIZE = 64
+
+
+# Connection pools shared by every scraper session, keyed by retry budget
+_shared_adapters: Dict[int, HTTPAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+def get_shared_adapter(max_retries: int) -> HTTPAdapter:
+    """
+    Return the process-wide keep-alive adapter for a retry budget.
+    
+    Mounting the same adapter on every scraper's session lets collectors
+    reuse open TCP/TLS connections to a host instead of each paying its own
+    handshakes.
+    """
+    with _adapters_lock:
+        adapter = _shared_adapters.get(max_retries)
+        if adapter is None:
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=1.0,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(['GET', 'POST'])
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+            _shared_adapters[max_retries] = adapter
+        return adapter
+
+
+@atexit.register
+def close_shared_adapters():
+    """Close all pooled connections held by the shared adapters."""
+    with _adapters_lock:
+        for adapter in _shared_adapters.values():
+            adapter.close()
+        _shared_adapters.clear()
+
+
+# On-disk GET response cache shared by all scrapers, opened on first use
+_response_cache: Optional[diskcache.Cache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[diskcache.Cache]:
+    """Return the shared response cache, or None if caching is disabled."""
+    global _response_cache
+    if not settings.enable_response_cache:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = diskcache.Cache(str(settings.response_cache_dir))
+        return _response_cache
+
+
+def _response_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable cache key for a GET of url with query params."""
+    query = urlencode(sorted(params.items()), doseq=True) if params else ''
+    return hashlib.blake2b(f"{url}?{query}".encode(), digest_size=16).hexdigest()
+
+
+def _response_from_cache(url: str, entry: tuple) -> requests.Response:
+    """Rebuild a requests.Response from a cached (status, content_type, body)."""
+    status_code, content_type, content = entry
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response._content = content
+    response.headers = CaseInsensitiveDict({'Content-Type': content_type} if content_type else {})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+# Worker processes for CPU-bound HTML parsing, created on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared process pool used to parse pages off the GIL.
+    
+    The pool is created while scraper threads and the event loop are
+    running, so workers are not forked from this process (a fork could
+    inherit a lock held by another thread); they start from a forkserver,
+    or are spawned where forkserver is unavailable.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            start_method = (
+                "forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context(start_method)
+            )
+        return _parse_pool
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """Charset from the Content-Type header, or None if the server sent none."""
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    # requests falls back to ISO-8859-1 for text/*; let the parser sniff instead
+    return None
+
+
+class SoupNode:
+    """
+    BeautifulSoup tag exposed through the selectolax node API.
+    
+    Covers the subset the listing parsers use (css, css_first, text,
+    attributes), so the same parser runs on either tree type.
+    """
+    
+    __slots__ = ('tag',)
+    
+    def __init__(self, tag):
+        self.tag = tag
+    
+    def css(self, selector: str) -> List['SoupNode']:
+        return [SoupNode(tag) for tag in self.tag.select(selector)]
+    
+    def css_first(self, selector: str) -> Optional['SoupNode']:
+        tag = self.tag.select_one(selector)
+        return SoupNode(tag) if tag is not None else None
+    
+    def text(self) -> str:
+        return self.tag.get_text()
+    
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self.tag.attrs
+
+
+def parse_html(content: bytes, fallback_selector: Optional[str] = None) -> Union[LexborHTMLParser, SoupNode]:
+    """
+    Parse HTML with Lexbor, falling back to BeautifulSoup when needed.
+    
+    Lexbor is the fast path. If ``fallback_selector`` is given and matches
+    nothing in the Lexbor tree, the page is re-parsed with BeautifulSoup
+    (lxml), which recovers more content from badly malformed markup.
+    
+    Args:
+        content: Raw page body
+        fallback_selector: CSS selector the page is expected to contain
+    
+    Returns:
+        LexborHTMLParser, or SoupNode wrapping the BeautifulSoup document
+    """
+    tree = LexborHTMLParser(content)
+    if fallback_selector and tree.css_first(fallback_selector) is None:
+        logger.debug("No '%s' in Lexbor tree, re-parsing with BeautifulSoup", fallback_selector)
+        return SoupNode(BeautifulSoup(content, 'lxml'))
+    return tree
+
+
+def with_bs4_fallback(selector: str) -> Callable:
+    """
+    Decorator turning a tree parser into a page-body parser.
+    
+    The wrapped function receives the tree from parse_html(content, selector)
+    and must only use the node API shared with SoupNode.
+    
+    Args:
+        selector: CSS selector the page is expected to contain
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(content: bytes, *args, **kwargs):
+            return func(parse_html(content, selector), *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class BaseScraper(ABC):
     """
@@ -31,8 +240,22 @@ class BaseScraper(ABC):
     - robots.txt compliance checking
     - Error handling and logging
     - User-agent rotation
+    
+    Use as a context manager (``with ClutchScraper() as scraper:``) or
+    call close() explicitly; sessions are not closed on garbage collection.
     """
     
+    # Scrapers are created per run; slots avoid a per-instance __dict__.
+    # Subclasses declare their own __slots__ (empty unless they add state).
+    __slots__ = (
+        'source', 'respect_robots', 'rate_limit_delay', 'max_retries', 'timeout',
+        'session', 'ua', '_ua_iter', '_rotate_ua', '_base_headers',
+        '_next_allowed', '_rate_lock', '_host_next_request'
+    )
+    
+    # Minimum rows for parse_companies() to take the batch path
+    BATCH_THRESHOLD = 100
+    
     def __init__(
         self,
         source: DataSource = DataSource.OTHER,
@@ -57,32 +280,67 @@ class BaseScraper(ABC):
         self.max_retries = max_retries if max_retries is not None else settings.max_retries
         self.timeout = timeout if timeout is not None else settings.request_timeout
         
-        # Initialize session
+        # Initialize session on the shared keep-alive adapter so requests to
+        # the same host reuse TCP/TLS connections across all scrapers. Retries
+        # with exponential backoff happen inside urllib3, below _make_request.
+        # Headers and cookies stay per scraper.
         self.session = requests.Session()
-        self.ua = UserAgent() if settings.rotate_user_agents else None
+        adapter = get_shared_adapter(self.max_retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Settings read once here rather than on every request
+        self._rotate_ua = bool(settings.rotate_user_agents)
+        self.ua = get_user_agent_source() if self._rotate_ua else None
+        
+        # Pre-sample user agents once; rotation then only swaps one header
+        self._ua_iter = (
+            itertools.cycle([self.ua.random for _ in range(UA_POOL_SIZE)])
+            if self.ua else None
+        )
+        
+        self._base_headers = dict(settings.get_headers())
+        self._base_headers['Connection'] = 'keep-alive'
+        self._base_headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.session.headers.update(self._base_headers)
         self._update_headers()
         
-        # Track last request time for rate limiting
-        self._last_request_time = 0
+        # Earliest monotonic time the next request may start
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
+        
+        # Next allowed request start per host (async fetch path)
+        self._host_next_request: Dict[str, float] = {}
         
         logger.info(f"Initialized {self.__class__.__name__} scraper")
     
     def _update_headers(self):
-        """Update session headers with fresh user agent."""
-        headers = settings.get_headers()
-        if self.ua and settings.rotate_user_agents:
-            headers['User-Agent'] = self.ua.random
-        self.session.headers.update(headers)
+        """Rotate session to the next pre-sampled user agent."""
+        if self._rotate_ua:
+            self.session.headers['User-Agent'] = next(self._ua_iter)
     
     def _apply_rate_limit(self):
-        """Apply rate limiting delay."""
-        if self.rate_limit_delay > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        """
+        Apply rate limiting delay.
+        
+        Works as a single-token bucket: each request reserves the next start
+        slot, rate_limit_delay after the previous one. Time the caller spent
+        parsing since the last request counts toward the gap, so the sleep
+        only covers whatever part of the delay is still outstanding.
+        Reservation is locked so threads sharing a scraper get distinct
+        slots; the sleep itself happens outside the lock.
+        """
+        if self.rate_limit_delay <= 0:
+            return
+        
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self.rate_limit_delay
+        
+        if slot > now:
+            logger.debug("Rate limiting: sleeping for %.2fs", slot - now)
+            time.sleep(slot - now)
     
     def _check_robots_txt(self, url: str) -> bool:
         """
@@ -97,24 +355,66 @@ class BaseScraper(ABC):
         if not self.respect_robots:
             return True
         
-        allowed = check_robots_txt(url, self.session.headers.get('User-Agent', '*'))
+        parsed = urlparse(url)
+        host = parsed.netloc
+        with _robots_lock:
+            rp = _robots_cache.get(host)
+        
+        if rp is None or time.time() - rp.mtime() > settings.robots_cache_ttl:
+            rp = self._fetch_robots_txt(f"{parsed.scheme or 'https'}://{host}/robots.txt")
+            with _robots_lock:
+                _robots_cache[host] = rp
+        
+        allowed = rp.can_fetch(self.session.headers.get('User-Agent', '*'), url)
         if not allowed:
             logger.warning(f"URL blocked by robots.txt: {url}")
         return allowed
     
-    @retry_on_exception(max_retries=3, delay=1.0, backoff=2.0, exceptions=(requests.RequestException,))
+    def _fetch_robots_txt(self, robots_url: str) -> RobotFileParser:
+        """
+        Download and parse a robots.txt file.
+        
+        Mirrors RobotFileParser.read() semantics: 401/403 disallow everything,
+        other errors allow everything. Fetch failures are treated as allowed.
+        """
+        rp = RobotFileParser(robots_url)
+        # Stamp the fetch time for the cache TTL (parse() only stamps on success)
+        rp.modified()
+        try:
+            response = self.session.get(robots_url, timeout=self.timeout)
+            if response.status_code in (401, 403):
+                rp.disallow_all = True
+            elif response.status_code >= 400:
+                rp.allow_all = True
+            else:
+                rp.parse(response.text.splitlines())
+        except requests.RequestException as e:
+            logger.warning(f"Could not check robots.txt at {robots_url}: {e}")
+            # If we can't check, assume it's allowed
+            rp.allow_all = True
+        return rp
+    
     def _make_request(
         self,
         url: str,
         method: str = "GET",
+        refresh: bool = False,
+        cache_permanent: bool = False,
         **kwargs
     ) -> Optional[requests.Response]:
         """
         Make HTTP request with retry logic and error handling.
         
+        Connection errors and transient statuses are retried by the
+        session's urllib3 Retry policy; errors left after that are raised.
+        Successful GETs are stored in the on-disk response cache and served
+        from it until they expire.
+        
         Args:
             url: URL to request
             method: HTTP method (GET, POST, etc.)
+            refresh: Ignore any cached response and fetch again
+            cache_permanent: Cache without expiry (for immutable pages)
             **kwargs: Additional arguments for requests
         
         Returns:
@@ -125,6 +425,14 @@ class BaseScraper(ABC):
             logger.error(f"Invalid URL: {url}")
             return None
         
+        cache = get_response_cache() if method == "GET" else None
+        if cache is not None:
+            cache_key = _response_cache_key(url, kwargs.get('params'))
+            entry = None if refresh else cache.get(cache_key)
+            if entry is not None:
+                logger.debug("Response cache hit: %s", url)
+                return _response_from_cache(url, entry)
+        
         # Check robots.txt
         if not self._check_robots_txt(url):
             return None
@@ -133,11 +441,11 @@ class BaseScraper(ABC):
         self._apply_rate_limit()
         
         # Rotate user agent
-        if self.ua and settings.rotate_user_agents:
+        if self._rotate_ua:
             self._update_headers()
         
         try:
-            logger.debug(f"Making {method} request to: {url}")
+            logger.debug("Making %s request to: %s", method, url)
             
             response = self.session.request(
                 method=method,
@@ -147,7 +455,14 @@ class BaseScraper(ABC):
             )
             
             response.raise_for_status()
-            logger.debug(f"Request successful: {url} (Status: {response.status_code})")
+            logger.debug("Request successful: %s (Status: %s)", url, response.status_code)
+            
+            if cache is not None:
+                cache.set(
+                    cache_key,
+                    (response.status_code, response.headers.get('Content-Type'), response.content),
+                    expire=None if cache_permanent else settings.response_cache_ttl
+                )
             
             return response
             
@@ -164,6 +479,148 @@ class BaseScraper(ABC):
             logger.error(f"Request error for {url}: {e}")
             raise
     
+    def _client_session(self, limit_per_host: int = 8) -> aiohttp.ClientSession:
+        """
+        Create an aiohttp session mirroring this scraper's headers.
+        
+        A session is bound to the event loop it was created in, so one is
+        created per asyncio.run() rather than shared at class level.
+        
+        Args:
+            limit_per_host: Maximum concurrent connections per host
+        
+        Returns:
+            aiohttp ClientSession with keep-alive connection pooling
+        """
+        headers = {
+            key: value for key, value in self.session.headers.items()
+            if key != 'Accept-Encoding'  # let aiohttp advertise what it can decode
+        }
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=limit_per_host, keepalive_timeout=75),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+    
+    async def _apply_rate_limit_async(self, url: str):
+        """
+        Apply per-host rate limiting for concurrent fetches.
+        
+        Each caller reserves the next free slot for its host before sleeping,
+        so request starts stay at least rate_limit_delay apart while
+        responses are still downloaded concurrently.
+        """
+        if self.rate_limit_delay <= 0:
+            return
+        
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        slot = max(now, self._host_next_request.get(host, 0.0))
+        self._host_next_request[host] = slot + self.rate_limit_delay
+        
+        if slot > now:
+            logger.debug("Rate limiting %s: sleeping for %.2fs", host, slot - now)
+            await asyncio.sleep(slot - now)
+    
+    async def _fetch(
+        self,
+        client: aiohttp.ClientSession,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        refresh: bool = False,
+        cache_permanent: bool = False
+    ) -> Optional[bytes]:
+        """
+        Fetch URL body asynchronously with retries and rate limiting.
+        
+        Bodies go through the same on-disk response cache as _make_request().
+        
+        Args:
+            client: aiohttp session from _client_session()
+            url: URL to request
+            semaphore: Bounds the number of in-flight requests
+            refresh: Ignore any cached response and fetch again
+            cache_permanent: Cache without expiry (for immutable pages)
+        
+        Returns:
+            Response body or None if failed
+        """
+        if not validate_url(url):
+            logger.error(f"Invalid URL: {url}")
+            return None
+        
+        cache = get_response_cache()
+        if cache is not None:
+            cache_key = _response_cache_key(url)
+            entry = None if refresh else cache.get(cache_key)
+            if entry is not None:
+                logger.debug("Response cache hit: %s", url)
+                return entry[2]
+        
+        # A robots.txt cache miss downloads it with a blocking read(), which
+        # would stall every other fetch on the event loop
+        if not await asyncio.to_thread(self._check_robots_txt, url):
+            return None
+        
+        delay = 1.0
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._apply_rate_limit_async(url)
+                try:
+                    logger.debug("Making async GET request to: %s", url)
+                    async with client.get(url) as response:
+                        response.raise_for_status()
+                        content = await response.read()
+                    logger.debug("Request successful: %s (Status: %s)", url, response.status)
+                    if cache is not None:
+                        cache.set(
+                            cache_key,
+                            (response.status, response.headers.get('Content-Type'), content),
+                            expire=None if cache_permanent else settings.response_cache_ttl
+                        )
+                    return content
+                except aiohttp.ClientResponseError as e:
+                    # Only transient statuses are worth retrying, as in the sync path
+                    if e.status in RETRY_STATUSES and attempt < self.max_retries:
+                        logger.warning(
+                            f"Attempt {attempt + 1}/{self.max_retries} failed for {url}: {e}. "
+                            f"Retrying in {delay:.1f}s..."
+                        )
+                        await asyncio.sleep(delay)
+                        delay *= 2.0
+                    else:
+                        logger.error(f"HTTP error for {url}: {e}")
+                        return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt < self.max_retries:
+                        logger.warning(
+                            f"Attempt {attempt + 1}/{self.max_retries} failed for {url}: {e}. "
+                            f"Retrying in {delay:.1f}s..."
+                        )
+                        await asyncio.sleep(delay)
+                        delay *= 2.0
+                    else:
+                        logger.error(f"Request error for {url}: {e}")
+        return None
+    
+    async def _parse_in_pool(self, func: Callable[..., Any], content: bytes, *args) -> Any:
+        """
+        Run a page parser in the shared process pool.
+        
+        Lets CPU-bound extraction of one page proceed on another core while
+        the event loop keeps other fetches in flight.
+        
+        Args:
+            func: Picklable module-level function taking the page bytes
+            content: Raw page body
+            *args: Extra picklable arguments passed to func after content
+        
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_parse_pool(), func, content, *args)
+    
     def get_soup(self, url: str, parser: str = "lxml") -> Optional[BeautifulSoup]:
         """
         Get BeautifulSoup object from URL.
@@ -178,12 +635,65 @@ class BaseScraper(ABC):
         try:
             response = self._make_request(url)
             if response:
-                return BeautifulSoup(response.content, parser)
+                # A known encoding skips BeautifulSoup's charset sniffing of the buffer
+                return BeautifulSoup(
+                    response.content, parser, from_encoding=_declared_encoding(response)
+                )
             return None
         except Exception as e:
             logger.error(f"Error creating soup from {url}: {e}")
             return None
     
+    def get_tree(
+        self,
+        url: str,
+        fallback_selector: Optional[str] = None
+    ) -> Optional[Union[LexborHTMLParser, SoupNode]]:
+        """
+        Get a Lexbor HTML tree from URL.
+        
+        Faster alternative to get_soup() for callers that only need
+        CSS-selector extraction; matching runs in the C Lexbor engine.
+        
+        Args:
+            url: URL to scrape
+            fallback_selector: If set and absent from the Lexbor tree, re-parse
+                with BeautifulSoup (see parse_html)
+        
+        Returns:
+            LexborHTMLParser (or SoupNode on fallback) or None if failed
+        """
+        try:
+            response = self._make_request(url)
+            if response:
+                return parse_html(response.content, fallback_selector)
+            return None
+        except Exception as e:
+            logger.error(f"Error creating tree from {url}: {e}")
+            return None
+    
+    def get_lxml(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """
+        Get an lxml HTML document from URL.
+        
+        Skips the BeautifulSoup wrapper layer for callers that extract with
+        XPath or cssselect directly on the libxml2 tree.
+        
+        Args:
+            url: URL to scrape
+        
+        Returns:
+            lxml HtmlElement (document root) or None if failed
+        """
+        try:
+            response = self._make_request(url)
+            if response:
+                return lxml_html.fromstring(response.content)
+            return None
+        except Exception as e:
+            logger.error(f"Error creating lxml document from {url}: {e}")
+            return None
+    
     def get_json(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get JSON data from URL.
@@ -197,7 +707,7 @@ class BaseScraper(ABC):
         try:
             response = self._make_request(url)
             if response:
-                return response.json()
+                return orjson.loads(response.content)
             return None
         except Exception as e:
             logger.error(f"Error parsing JSON from {url}: {e}")
@@ -229,10 +739,43 @@ class BaseScraper(ABC):
         """
         pass
     
+    def parse_companies(self, rows: List[Any]) -> List[Company]:
+        """
+        Parse many scraped rows into companies.
+        
+        Batches of at least BATCH_THRESHOLD rows go through
+        _parse_companies_batch() when the subclass implements it;
+        otherwise each row is passed to parse_company().
+        
+        Args:
+            rows: Raw data items as accepted by parse_company()
+        
+        Returns:
+            Successfully parsed companies, in input order
+        """
+        if len(rows) >= self.BATCH_THRESHOLD:
+            companies = self._parse_companies_batch(rows)
+            if companies is not None:
+                return companies
+        return [company for company in map(self.parse_company, rows) if company]
+    
+    def _parse_companies_batch(self, rows: List[Any]) -> Optional[List[Company]]:
+        """
+        Column-wise parsing hook for large batches.
+        
+        Returns:
+            Parsed companies, or None to fall back to per-row parsing
+        """
+        return None
+    
     def close(self):
-        """Close session and cleanup resources."""
-        if self.session:
+        """Close session and cleanup resources. Safe to call more than once."""
+        if self.session is not None:
+            # Detach the shared adapters so closing this session leaves the
+            # pooled connections open for other scrapers
+            self.session.adapters.clear()
             self.session.close()
+            self.session = None
             logger.debug(f"Closed session for {self.__class__.__name__}")
     
     def __enter__(self):
@@ -242,10 +785,6 @@ class BaseScraper(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
-    
-    def __del__(self):
-        """Destructor to ensure session is closed."""
-        self.close()
 
 
 if __name__ == "__main__":
@@ -254,6 +793,8 @@ if __name__ == "__main__":
     print("Available methods:")
     print("- _make_request(url): Make HTTP request with retry logic")
     print("- get_soup(url): Get BeautifulSoup object")
+    print("- get_tree(url): Get Lexbor HTML tree (CSS selectors)")
+    print("- get_lxml(url): Get lxml document (XPath)")
     print("- get_json(url): Get JSON data")
     print("- scrape(**kwargs): Main scraping method (must be implemented)")
     print("- parse_company(data): Parse company data (must be implemented)")
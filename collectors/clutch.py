@@ -5,28 +5,55 @@ Scraper for Clutch.co to collect B2B service provider data.
 Extracts reviews, ratings, services, and company details.
 """
 
+import re
 import time
+import asyncio
 from typing import Optional, List
 from urllib.parse import urljoin
 
-from collectors.base_scraper import BaseScraper
+import pandas as pd
+
+from collectors.base_scraper import BaseScraper, with_bs4_fallback
 from models.schemas import (
     Company, CompanyEnrichment, ScrapingResult, 
     DataSource, CompanySize, GeographicInfo
 )
 from utils.logger import get_logger
-from utils.helpers import clean_text, clean_company_name
+from utils.helpers import clean_text, clean_company_name, clean_company_names
 
 logger = get_logger(__name__)
 
+# Clutch employee ranges -> CompanySize
+_SIZE_LOOKUP = {
+    '10,000+': CompanySize.ENTERPRISE,
+    '1,000 - 9,999': CompanySize.ENTERPRISE,
+    '250 - 999': CompanySize.LARGE,
+    '50 - 249': CompanySize.MEDIUM,
+    '10 - 49': CompanySize.SMALL,
+    '2 - 9': CompanySize.STARTUP,
+}
+_SIZE_RE = re.compile('|'.join(re.escape(label) for label in _SIZE_LOOKUP))
+
 
 class ClutchScraper(BaseScraper):
     """
     Scraper for Clutch.co B2B directory.
     """
     
+    __slots__ = ()
+    
     BASE_URL = "https://clutch.co"
     
+    # Listing selectors, defined once per class rather than per row
+    _SEL_ROW = 'li.provider-row'
+    _SEL_NAME = 'h3.company_info'
+    _SEL_WEBSITE = 'a.website-link'
+    _SEL_TAGLINE = 'p.tagline'
+    _SEL_LOC = 'span.locality'
+    _SEL_RATING = 'span.rating'
+    _SEL_RATE = 'div.hourly-rate'
+    _SEL_EMPLOYEES = 'div.employees'
+    
     def __init__(self, **kwargs):
         """Initialize Clutch scraper."""
         super().__init__(source=DataSource.CLUTCH, **kwargs)
@@ -34,7 +61,8 @@ class ClutchScraper(BaseScraper):
     def scrape(
         self, 
         category: str = "web-developers", 
-        max_pages: int = 1
+        max_pages: int = 1,
+        concurrency: int = 4
     ) -> ScrapingResult:
         """
         Scrape Clutch companies by category.
@@ -42,39 +70,57 @@ class ClutchScraper(BaseScraper):
         Args:
             category: Clutch category slug (e.g., 'web-developers', 'app-developers')
             max_pages: Number of pagination pages to scrape
+            concurrency: Maximum number of pages fetched in parallel
         
         Returns:
             ScrapingResult
         """
+        return asyncio.run(
+            self.scrape_async(category=category, max_pages=max_pages, concurrency=concurrency)
+        )
+    
+    async def scrape_async(
+        self,
+        category: str = "web-developers",
+        max_pages: int = 1,
+        concurrency: int = 4
+    ) -> ScrapingResult:
+        """
+        Scrape Clutch category pages concurrently.
+        
+        All pagination pages are fetched in parallel (bounded by
+        ``concurrency`` and per-host rate limiting), then processed in page
+        order so results match a sequential crawl. With more than one page,
+        HTML parsing runs in a process pool so it overlaps with fetching.
+        """
         start_time = time.time()
         result = ScrapingResult(source=self.source)
         
         try:
-            current_page = 1
+            urls = [f"{self.BASE_URL}/{category}?page={page}" for page in range(1, max_pages + 1)]
+            logger.info(f"Scraping {len(urls)} Clutch pages for category: {category}")
             
-            while current_page <= max_pages:
-                url = f"{self.BASE_URL}/{category}?page={current_page}"
-                logger.info(f"Scraping Clutch page {current_page}: {url}")
-                
-                soup = self.get_soup(url)
-                if not soup:
+            semaphore = asyncio.Semaphore(concurrency)
+            in_pool = len(urls) > 1
+            async with self._client_session() as client:
+                pages = await asyncio.gather(
+                    *(self._fetch_and_parse(client, url, semaphore, in_pool) for url in urls)
+                )
+            
+            companies_data = []
+            for current_page, companies_list in enumerate(pages, 1):
+                if companies_list is None:
                     result.add_error(f"Failed to fetch page {current_page}")
                     break
                 
-                companies_list = self._parse_listings(soup)
-                
                 if not companies_list:
                     logger.warning(f"No companies found on page {current_page}")
                     break
-                    
-                for company_data in companies_list:
-                    company = self.parse_company(company_data)
-                    if company:
-                        result.add_company(company)
                 
-                current_page += 1
-                # Politeness delay
-                time.sleep(self.rate_limit_delay)
+                companies_data.extend(companies_list)
+            
+            for company in self.parse_companies(companies_data):
+                result.add_unique_company(company)
             
             result.execution_time = time.time() - start_time
             logger.info(f"Clutch scrape completed: {result.total_scraped} companies")
@@ -84,61 +130,77 @@ class ClutchScraper(BaseScraper):
             result.add_error(str(e))
             
         return result
+    
+    async def _fetch_and_parse(
+        self,
+        client,
+        url: str,
+        semaphore,
+        in_pool: bool = False
+    ) -> Optional[List[dict]]:
+        """Fetch a category page and parse its listings (None if fetch failed)."""
+        content = await self._fetch(client, url, semaphore)
+        if content is None:
+            return None
+        if in_pool:
+            return await self._parse_in_pool(parse_listings_html, content)
+        return parse_listings_html(content)
 
-    def _parse_listings(self, soup) -> List[dict]:
+    @classmethod
+    def _parse_listings(cls, tree) -> List[dict]:
         """Parse company listings from a category page."""
         companies = []
         try:
             # Clutch HTML structure varies, standard list items usually have class 'provider-row'
-            rows = soup.find_all('li', class_='provider-row')
+            rows = tree.css(cls._SEL_ROW)
             
             for row in rows:
                 try:
                     data = {}
                     
                     # Name
-                    name_elem = row.find('h3', class_='company_info')
+                    name_elem = row.css_first(cls._SEL_NAME)
                     if name_elem:
-                        data['name'] = clean_text(name_elem.get_text())
+                        data['name'] = clean_text(name_elem.text())
                     
                     # Website (encoded usually, scrape the profile link)
-                    profile_link = row.find('a', class_='website-link')
-                    if profile_link and profile_link.get('href'):
-                        data['url'] = profile_link['href'] # This assumes direct link or redirect
+                    profile_link = row.css_first(cls._SEL_WEBSITE)
+                    if profile_link and profile_link.attributes.get('href'):
+                        data['url'] = profile_link.attributes['href'] # This assumes direct link or redirect
                         
                     # Tagline
-                    tagline = row.find('p', class_='tagline')
+                    tagline = row.css_first(cls._SEL_TAGLINE)
                     if tagline:
-                        data['description'] = clean_text(tagline.get_text())
+                        data['description'] = clean_text(tagline.text())
                         
                     # Location
-                    loc_elem = row.find('span', class_='locality')
+                    loc_elem = row.css_first(cls._SEL_LOC)
                     if loc_elem:
-                        data['location'] = clean_text(loc_elem.get_text())
+                        data['location'] = clean_text(loc_elem.text())
                         
                     # Rating
-                    rating_elem = row.find('span', class_='rating')
+                    rating_elem = row.css_first(cls._SEL_RATING)
                     if rating_elem:
                         try:
-                            data['rating'] = float(rating_elem.get_text())
+                            data['rating'] = float(rating_elem.text())
                         except ValueError:
                             pass
                             
                     # Hourly Rate
-                    rate_elem = row.find('div', class_='hourly-rate')
+                    rate_elem = row.css_first(cls._SEL_RATE)
                     if rate_elem:
-                        data['hourly_rate'] = clean_text(rate_elem.get_text())
+                        data['hourly_rate'] = clean_text(rate_elem.text())
                         
                     # Employee Count (often presented as range, e.g., '10 - 49')
-                    emp_elem = row.find('div', class_='employees')
+                    emp_elem = row.css_first(cls._SEL_EMPLOYEES)
                     if emp_elem:
-                        data['employees'] = clean_text(emp_elem.get_text())
+                        data['employees'] = clean_text(emp_elem.text())
 
                     if data.get('name'):
                         companies.append(data)
                         
                 except Exception as e:
-                    logger.debug(f"Error parsing clutch row: {e}")
+                    logger.debug("Error parsing clutch row: %s", e)
                     continue
                     
         except Exception as e:
@@ -154,46 +216,73 @@ class ClutchScraper(BaseScraper):
                 return None
             
             # Map employee range to CompanySize
-            size_str = data.get('employees', '')
-            size_enum = CompanySize.UNKNOWN
-            if '10,000+' in size_str:
-                size_enum = CompanySize.ENTERPRISE
-            elif '1,000 - 9,999' in size_str:
-                size_enum = CompanySize.ENTERPRISE
-            elif '250 - 999' in size_str:
-                size_enum = CompanySize.LARGE
-            elif '50 - 249' in size_str:
-                size_enum = CompanySize.MEDIUM
-            elif '10 - 49' in size_str:
-                size_enum = CompanySize.SMALL
-            elif '2 - 9' in size_str:
-                size_enum = CompanySize.STARTUP
-            
-            # Enrichment
-            enrichment = CompanyEnrichment(
-                company_size=size_enum,
-                geographic_info=GeographicInfo(
-                    city=data.get('location')  # Clutch typically gives "City, Country"
-                ),
-                tags=['agency', 'b2b-service']
-            )
-            
-            # Extra data
-            extra = {
-                'rating': data.get('rating'),
-                'hourly_rate': data.get('hourly_rate')
-            }
+            match = _SIZE_RE.search(data.get('employees', ''))
+            size_enum = _SIZE_LOOKUP[match.group()] if match else CompanySize.UNKNOWN
             
-            company = Company(
-                name=clean_company_name(name),
-                description=data.get('description'),
-                source=self.source,
-                source_url=data.get('url'), # Usually points to Clutch profile
-                enrichment=enrichment,
-                extra_data=extra
-            )
-            return company
+            return self._build_company(clean_company_name(name), size_enum, data)
             
         except Exception as e:
             logger.error(f"Error creating Company object for {data.get('name')}: {e}")
             return None
+    
+    def _parse_companies_batch(self, rows: List[dict]) -> List[Company]:
+        """
+        Normalize a large batch of listings column-wise with pandas.
+        
+        Name cleaning and size mapping run once per column instead of once
+        per company; only model construction remains per row.
+        """
+        df = pd.DataFrame(rows, columns=['name', 'employees'])
+        df = df[df['name'].fillna('') != '']
+        
+        names = clean_company_names(df['name'])
+        sizes = df['employees'].fillna('').str.extract(f"({_SIZE_RE.pattern})", expand=False)
+        sizes = sizes.map(_SIZE_LOOKUP).fillna(CompanySize.UNKNOWN)
+        
+        companies = []
+        for index, name, size_enum in zip(df.index, names, sizes):
+            data = rows[index]
+            try:
+                companies.append(self._build_company(name, size_enum, data))
+            except Exception as e:
+                logger.error(f"Error creating Company object for {data.get('name')}: {e}")
+        
+        return companies
+    
+    def _build_company(self, name: str, size_enum: CompanySize, data: dict) -> Company:
+        """Assemble a Company from a cleaned name, mapped size and raw row."""
+        # Enrichment
+        enrichment = CompanyEnrichment(
+            company_size=size_enum,
+            geographic_info=GeographicInfo(
+                city=data.get('location')  # Clutch typically gives "City, Country"
+            ),
+            tags=['agency', 'b2b-service']
+        )
+        
+        # Extra data
+        extra = {
+            'rating': data.get('rating'),
+            'hourly_rate': data.get('hourly_rate')
+        }
+        
+        return Company(
+            name=name,
+            description=data.get('description'),
+            source=self.source,
+            source_url=data.get('url'), # Usually points to Clutch profile
+            enrichment=enrichment,
+            extra_data=extra
+        )
+
+
+@with_bs4_fallback(ClutchScraper._SEL_ROW)
+def parse_listings_html(tree) -> List[dict]:
+    """
+    Parse a Clutch category page body into listing dicts.
+    
+    Called with the raw page bytes; the decorator parses them with Lexbor,
+    or BeautifulSoup if no listing rows are found. Module-level (and
+    therefore picklable) so it can run in a worker process.
+    """
+    return ClutchScraper._parse_listings(tree)
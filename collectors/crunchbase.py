@@ -6,6 +6,8 @@ Supports both public page scraping and API usage.
 """
 
 import time
+import orjson
+from itertools import islice
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
 
@@ -16,6 +18,7 @@ from models.schemas import (
 )
 from utils.logger import get_logger
 from utils.helpers import clean_text, clean_company_name
+from utils.geo import normalize_country
 from config import settings
 
 logger = get_logger(__name__)
@@ -30,6 +33,8 @@ class CrunchbaseScraper(BaseScraper):
     otherwise falls back to basic scraping techniques or advises user.
     """
     
+    __slots__ = ('api_key',)
+    
     BASE_URL = "https://www.crunchbase.com"
     API_URL = "https://api.crunchbase.com/v3.1"
     
@@ -98,10 +103,12 @@ class CrunchbaseScraper(BaseScraper):
             response = self._make_request(url, params=params)
             
             if response and response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 items = data.get('data', {}).get('items', [])
                 
-                for item in items:
+                # The API may return more than requested; stop building
+                # companies once the limit is reached
+                for item in islice(items, limit):
                     props = item.get('properties', {})
                     companies.append(self._parse_api_data(props))
                     
@@ -138,7 +145,8 @@ class CrunchbaseScraper(BaseScraper):
         geo_info = GeographicInfo(
             city=props.get('city_name'),
             region=props.get('region_name'),
-            country=props.get('country_code')
+            country=props.get('country_code'),
+            country_code=normalize_country(props.get('country_code'), iso_alpha2=True)
         )
         
         enrichment = CompanyEnrichment(
@@ -0,0 +1,368 @@
+# OpenLead Intelligence - Browser Instance Pool
+
+"""
+Pool of warm Chrome WebDriver instances shared by Selenium scrapers.
+Starting Chrome and handshaking with ChromeDriver takes seconds, so
+drivers are reused across scrapers and recycled after a number of uses.
+"""
+
+import time
+import queue
+import atexit
+import threading
+from typing import Optional, Dict
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+from config import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sub-resources the HTML extractors never read. CSS stays loaded: layout
+# drives lazy loading and infinite scroll, and bot checks notice it missing.
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+]
+
+# Connections to ChromeDriver per browser; urllib3's default of 1 makes
+# commands from different threads queue behind each other
+WEBDRIVER_POOL_MAXSIZE = 20
+
+# Seconds a blocked acquire() waits before checking for a freed slot (a
+# failed replacement launch frees one without putting a browser back)
+ACQUIRE_POLL_INTERVAL = 1.0
+
+# Arguments shared by every scraping browser: stability, then anti-detection
+_BASE_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--disable-blink-features=AutomationControlled",
+)
+
+_BASE_EXPERIMENTAL_OPTIONS = {
+    "excludeSwitches": ["enable-automation"],
+    "useAutomationExtension": False,
+}
+
+
+def build_chrome_options(headless: bool, block_images: bool = False) -> Options:
+    """
+    Build the Chrome options used for every scraping browser.
+    
+    Args:
+        headless: Run browser in headless mode
+        block_images: Disable image loading for the whole browser
+    
+    Returns:
+        Chrome Options
+    """
+    chrome_options = Options()
+    
+    if headless:
+        chrome_options.add_argument("--headless")
+    
+    for argument in _BASE_ARGS:
+        chrome_options.add_argument(argument)
+    for name, value in _BASE_EXPERIMENTAL_OPTIONS.items():
+        chrome_options.add_experimental_option(name, value)
+    
+    # Return from get() at DOMContentLoaded instead of waiting for every
+    # tracker and ad to finish; callers wait for the element they need
+    chrome_options.page_load_strategy = "eager"
+    
+    # User agent (picked per browser, so rotation still applies)
+    user_agent = settings.get_headers()['User-Agent']
+    chrome_options.add_argument(f'user-agent={user_agent}')
+    
+    if block_images:
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    
+    return chrome_options
+
+
+def create_driver(headless: bool, timeout: int, block_images: bool = False) -> webdriver.Chrome:
+    """
+    Launch a configured Chrome WebDriver.
+    
+    Args:
+        headless: Run browser in headless mode
+        timeout: Page load timeout in seconds
+        block_images: Disable image loading for the whole browser
+    
+    Returns:
+        Chrome WebDriver
+    """
+    driver = webdriver.Chrome(options=build_chrome_options(headless, block_images))
+    _widen_command_pool(driver)
+    driver.set_page_load_timeout(timeout)
+    
+    # Execute script to hide webdriver property
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    
+    return driver
+
+
+def _widen_command_pool(driver: webdriver.Chrome):
+    """
+    Rebuild the driver's ChromeDriver connection pool with more connections.
+    
+    Local Chrome drivers do not accept a ClientConfig, so the pool manager
+    is rebuilt from the connection's own config with a larger maxsize.
+    """
+    executor = driver.command_executor
+    try:
+        pool_args = dict(executor._client_config.init_args_for_pool_manager or {})
+        pool_args.setdefault("init_args_for_pool_manager", {})["maxsize"] = WEBDRIVER_POOL_MAXSIZE
+        executor._client_config.init_args_for_pool_manager = pool_args
+        old_conn = executor._conn
+        executor._conn = executor._get_connection_manager()
+        old_conn.clear()
+    except AttributeError as e:
+        # Private Selenium API; keep the default pool if it changes
+        logger.debug(f"Could not resize WebDriver connection pool: {e}")
+
+
+def set_resource_blocking(driver: webdriver.Chrome, enabled: bool):
+    """
+    Block (or unblock) heavy sub-resources through the DevTools protocol.
+    
+    Unlike the image preference this can be switched per session, so
+    pooled browsers can serve sources that need images as well.
+    
+    Args:
+        driver: Chrome WebDriver
+        enabled: Block BLOCKED_RESOURCE_PATTERNS when True, nothing when False
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": BLOCKED_RESOURCE_PATTERNS if enabled else []}
+        )
+    except WebDriverException as e:
+        logger.warning(f"Could not set resource blocking: {e}")
+
+
+class SeleniumDriverPool:
+    """
+    Fixed-size pool of Chrome WebDriver instances.
+    
+    Drivers are launched on demand up to ``size`` (or all at once with
+    warm()), handed out with acquire() and returned with release(). A
+    returned driver is reset to a blank page with no cookies; once it has
+    served ``max_uses`` scrapers it is quit and replaced in a background
+    thread.
+    """
+    
+    def __init__(
+        self,
+        size: int = None,
+        max_uses: int = None,
+        headless: bool = None,
+        timeout: int = None
+    ):
+        """
+        Initialize driver pool.
+        
+        Args:
+            size: Maximum number of live browsers (default from config)
+            max_uses: Uses before a browser is recycled (default from config)
+            headless: Run browsers in headless mode (default from config)
+            timeout: Page load timeout in seconds (default from config)
+        """
+        self.size = size if size is not None else settings.browser_pool_size
+        self.max_uses = max_uses if max_uses is not None else settings.browser_max_uses
+        self.headless = headless if headless is not None else settings.headless_browser
+        self.timeout = timeout if timeout is not None else settings.browser_timeout
+        
+        self._idle: queue.Queue = queue.Queue(maxsize=self.size)
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def _launch(self) -> webdriver.Chrome:
+        """Start a new browser, giving its slot back if startup fails."""
+        try:
+            driver = create_driver(self.headless, self.timeout)
+        except WebDriverException:
+            with self._lock:
+                self._created -= 1
+            raise
+        
+        with self._lock:
+            self._uses[id(driver)] = 0
+        logger.info("Chrome WebDriver started for pool")
+        return driver
+    
+    def _reserve_slot(self) -> bool:
+        """Claim capacity for one more browser if the pool is not full."""
+        with self._lock:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+    
+    def warm(self):
+        """Launch browsers until the pool holds ``size`` instances."""
+        while self._reserve_slot():
+            self._idle.put(self._launch())
+    
+    def acquire(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Take a browser from the pool.
+        
+        An idle browser is returned immediately; otherwise a new one is
+        launched if the pool is below ``size``, else this blocks until
+        another scraper releases one or a slot frees up.
+        
+        Args:
+            timeout: Seconds to wait for a free browser (None waits forever)
+        
+        Returns:
+            Chrome WebDriver
+        
+        Raises:
+            queue.Empty: If no browser became free within ``timeout``
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if self._reserve_slot():
+            return self._launch()
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = ACQUIRE_POLL_INTERVAL
+            if deadline is not None:
+                wait = max(min(wait, deadline - time.monotonic()), 0)
+            try:
+                return self._idle.get(timeout=wait)
+            except queue.Empty:
+                if self._reserve_slot():
+                    return self._launch()
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+    
+    def release(self, driver: webdriver.Chrome):
+        """
+        Return a browser to the pool.
+        
+        Args:
+            driver: Browser previously obtained from acquire()
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        
+        if self._closed or uses >= self.max_uses:
+            self._retire(driver, replace=not self._closed)
+            return
+        
+        try:
+            # Isolate the next scraper from this one's session state
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException as e:
+            logger.warning(f"Discarding broken WebDriver: {e}")
+            self._retire(driver, replace=True)
+            return
+        
+        self._idle.put(driver)
+    
+    def _retire(self, driver: webdriver.Chrome, replace: bool):
+        """Quit a browser and, optionally, start its replacement in the background."""
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        
+        def recycle():
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Error closing WebDriver: {e}")
+            
+            if not replace:
+                with self._lock:
+                    self._created -= 1
+                return
+            
+            try:
+                new_driver = self._launch()
+            except WebDriverException as e:
+                # _launch() already freed the slot; a waiting acquire() claims it
+                logger.error(f"Failed to replace pooled WebDriver: {e}")
+                return
+            
+            # Checked under the lock close() sets the flag with, so the
+            # browser is either queued before close() drains the queue or
+            # quit here; otherwise nothing would ever quit it
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self._idle.put(new_driver)
+            if closed:
+                self._discard(new_driver)
+        
+        threading.Thread(target=recycle, daemon=True).start()
+    
+    def close(self):
+        """Quit all idle browsers; browsers still in use are quit on release."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+        logger.info("WebDriver pool closed")
+    
+    def _discard(self, driver: webdriver.Chrome):
+        """Quit a browser and free its slot."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing WebDriver: {e}")
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
+
+
+_driver_pool: Optional[SeleniumDriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> SeleniumDriverPool:
+    """Return the process-wide driver pool, creating it on first use."""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = SeleniumDriverPool()
+        return _driver_pool
+
+
+@atexit.register
+def close_driver_pool():
+    """Quit pooled browsers at interpreter exit."""
+    if _driver_pool is not None:
+        _driver_pool.close()
+
+
+if __name__ == "__main__":
+    print("Selenium Driver Pool")
+    print("\nExample usage:")
+    print("  pool = get_driver_pool()")
+    print("  with SeleniumScraper(pool=pool) as scraper:")
+    print("      scraper.get_page('https://example.com')")
+    print("\nNote: Requires Chrome and ChromeDriver to be installed")
@@ -7,23 +7,52 @@ Useful for ad-hoc testing and scraping arbitrary lists of leads.
 
 import time
 from typing import Optional, List
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit, SplitResult
 
 from collectors.base_scraper import BaseScraper
 from models.schemas import (
-    Company, CompanyEnrichment, ScrapingResult, DataSource
+    Company, CompanyEnrichment, ScrapingResult, DataSource, parse_http_url
 )
 from utils.logger import get_logger
 from utils.helpers import clean_text, extract_domain
 
 logger = get_logger(__name__)
 
+
+def _absolutize(base_url: str, base_parts: SplitResult, href: str) -> str:
+    """
+    Resolve href against a page URL whose parts were split once up front.
+    
+    Absolute and root-relative links (the bulk of listing pages) are built
+    directly; anything else, or paths needing dot-segment cleanup, goes
+    through urljoin().
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+        return f"{base_parts.scheme}://{base_parts.netloc}{href}"
+    return urljoin(base_url, href)
+
 class GenericScraper(BaseScraper):
     """
     Scrapes a user-provided URL and tries to extract listing items.
     Best used on pages that list companies (directories, top 10 lists, etc.).
     """
     
+    __slots__ = ()
+    
+    HEADING_TAGS = ('h2', 'h3', 'h4')
+    ITEM_LIMIT = 20   # Strategy 2: item/card containers examined
+    ROW_LIMIT = 50    # Strategy 3: table rows examined
+    
+    # Everything any strategy looks at, so the tree is walked only once
+    _SEL_NODES = ', '.join(
+        ['h2', 'h3', 'h4', 'p', 'tr'] + [
+            f'{tag}[class*="{word}"]'
+            for tag in ('div', 'li') for word in ('item', 'card', 'row', 'listing')
+        ]
+    )
+    
     def __init__(self, **kwargs):
         super().__init__(source=DataSource.OTHER, **kwargs)
         
@@ -35,92 +64,55 @@ class GenericScraper(BaseScraper):
         start_time = time.time()
         
         try:
-            logger.info(f"Generic scraping starting for: {url}")
-            soup = self.get_soup(url)
+            logger.info("Generic scraping starting for: %s", url)
+            tree = self.get_tree(url)
             
-            if not soup:
+            if not tree:
                 result.add_error(f"Could not load {url}")
                 return result
                 
-            # Heuristic: Find repetitive elements that might be listings
-            # We look for common patterns: <h2> or <h3> with links inside
-            
-            candidates = []
-            
-            # Strategy 1: Look for Headings with Links (Common in directories)
-            for tag in ['h2', 'h3', 'h4']:
-                headers = soup.find_all(tag)
-                for header in headers:
-                    link = header.find('a')
-                    if link and link.get('href'):
-                        name = clean_text(header.get_text())
-                        if len(name) > 2 and len(name) < 50:
-                            candidates.append({
-                                'name': name,
-                                'url': urljoin(url, link.get('href')),
-                                'desc_elem': header.find_next('p')
-                            })
-            
-            logger.info(f"Found {len(candidates)} potential leads using Header strategy")
-            
-            if not candidates:
-                # Strategy 2: Look for list items with classes indicating "item" or "card"
-                possible_items = soup.find_all(lambda tag: tag.name in ['div', 'li'] and 
-                                             tag.get('class') and 
-                                             any(x in str(tag.get('class')) for x in ['item', 'card', 'row', 'listing']))
-                
-                for item in possible_items[:20]: # Limit to avoid junk
-                     # Try to find a title/link inside
-                    link = item.find('a')
-                    if link and link.get('href'):
-                         text = clean_text(link.get_text())
-                         if text:
-                             candidates.append({
-                                 'name': text,
-                                 'url': urljoin(url, link.get('href')),
-                                 'desc_elem': item.find('p')
-                             })
-
-            # Strategy 3: Table Rows (Common in old sites like HN)
-            if not candidates:
-                logger.info("Strategies 1-2 failed. Trying Table Rows...")
-                rows = soup.find_all('tr')
-                for row in rows[:50]:
-                    # Heuristic: Row with a link that isn't tiny
-                    link = row.find('a')
-                    if link and link.get('href'):
-                         text = clean_text(link.get_text())
-                         if len(text) > 5: # Basic filter
-                             candidates.append({
-                                 'name': text,
-                                 'url': urljoin(url, link.get('href')),
-                                 'desc_elem': None
-                             })
+            candidates = self._collect_candidates(tree, url)
             
             # Process candidates into Companies
-            logger.info(f"Total candidates found: {len(candidates)}")
+            logger.info("Total candidates found: %d", len(candidates))
+            
+            # Stage plain rows first; links are the only untrusted input,
+            # so they are validated here and the models skip validation
+            staged = []
+            seen_names = set()
             for cand in candidates:
                 # Avoid duplicates in this run
-                if any(c.name == cand['name'] for c in result.companies):
+                if cand['name'] in seen_names:
+                    continue
+                seen_names.add(cand['name'])
+                
+                website = parse_http_url(cand['url'])
+                if website is None:
+                    logger.debug("Skipping candidate with invalid link: %s", cand['url'])
                     continue
                     
                 description = None
                 if cand.get('desc_elem'):
-                    description = clean_text(cand['desc_elem'].get_text())
+                    description = clean_text(cand['desc_elem'].text())
                 
-                company = Company(
-                    name=cand['name'],
-                    website=cand['url'],
-                    domain=extract_domain(cand['url']),
-                    description=description,
+                staged.append({
+                    'name': cand['name'],
+                    'website': website,
+                    'domain': extract_domain(cand['url']),
+                    'description': description
+                })
+            
+            source_url = parse_http_url(url)
+            for row in staged:
+                result.add_company(Company.model_construct(
+                    **row,
                     source=DataSource.MANUAL,
-                    source_url=url,
-                    enrichment=CompanyEnrichment(tags=['generic-scrape'])
-                )
-                result.add_company(company)
+                    source_url=source_url,
+                    enrichment=CompanyEnrichment.model_construct(tags=['generic-scrape'])
+                ))
                 
             result.execution_time = time.time() - start_time
-            logger.info(f"Generic scrape finished. Scraped {result.total_scraped} items.")
+            logger.info("Generic scrape finished. Scraped %d items.", result.total_scraped)
             
         except Exception as e:
             logger.exception(f"Error in generic scraper: {e}")
@@ -128,6 +120,86 @@ class GenericScraper(BaseScraper):
             
         return result
 
+    def _collect_candidates(self, tree, url: str) -> List[dict]:
+        """
+        Find listing candidates in a single pass over the page.
+        
+        Heuristic: look for repetitive elements that might be listings.
+        The three strategies are gathered together and applied in priority
+        order: headings with links, then item/card containers, then table
+        rows; a later strategy is used only when the earlier ones found
+        nothing.
+        """
+        base_parts = urlsplit(url)
+        headers = {tag: [] for tag in self.HEADING_TAGS}
+        pending = []   # heading candidates still waiting for their next <p>
+        items = []
+        rows = []
+        items_seen = rows_seen = 0
+        
+        for node in tree.css(self._SEL_NODES):
+            tag = node.tag
+            
+            if tag == 'p':
+                for entry in pending:
+                    entry['desc_elem'] = node
+                pending = []
+            
+            elif tag in headers:
+                # Strategy 1: Headings with Links (Common in directories)
+                link = node.css_first('a')
+                if link and link.attributes.get('href'):
+                    name = clean_text(node.text())
+                    if len(name) > 2 and len(name) < 50:
+                        entry = {
+                            'name': name,
+                            'url': _absolutize(url, base_parts, link.attributes['href']),
+                            'desc_elem': None
+                        }
+                        headers[tag].append(entry)
+                        pending.append(entry)
+            
+            elif tag == 'tr':
+                # Strategy 3: Table Rows (Common in old sites like HN)
+                if rows_seen >= self.ROW_LIMIT:
+                    continue
+                rows_seen += 1
+                # Heuristic: Row with a link that isn't tiny
+                link = node.css_first('a')
+                if link and link.attributes.get('href'):
+                    text = clean_text(link.text())
+                    if len(text) > 5: # Basic filter
+                        rows.append({
+                            'name': text,
+                            'url': _absolutize(url, base_parts, link.attributes['href']),
+                            'desc_elem': None
+                        })
+            
+            else:
+                # Strategy 2: list items with classes indicating "item" or "card"
+                if items_seen >= self.ITEM_LIMIT: # Limit to avoid junk
+                    continue
+                items_seen += 1
+                link = node.css_first('a')
+                if link and link.attributes.get('href'):
+                    text = clean_text(link.text())
+                    if text:
+                        items.append({
+                            'name': text,
+                            'url': _absolutize(url, base_parts, link.attributes['href']),
+                            'desc_elem': node.css_first('p')
+                        })
+        
+        candidates = [entry for tag in self.HEADING_TAGS for entry in headers[tag]]
+        logger.info("Found %d potential leads using Header strategy", len(candidates))
+        
+        if not candidates:
+            candidates = items
+        if not candidates:
+            logger.info("Strategies 1-2 failed. Trying Table Rows...")
+            candidates = rows
+        return candidates
+
     def parse_company(self, data):
         # Not used in this implementation as logic is inside scrape()
         pass
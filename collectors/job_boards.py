@@ -7,26 +7,43 @@ Targets 'Who is Hiring' threads and 'Show HN'.
 
 import time
 import re
+from itertools import islice
 from typing import List, Optional
 
+from lxml import etree
+
 from collectors.base_scraper import BaseScraper
 from models.schemas import (
     Company, CompanyEnrichment, HiringIntent,
-    ScrapingResult, DataSource, CompanySize, TechStack
+    ScrapingResult, DataSource, CompanySize, TechStack, parse_http_url
 )
 from utils.logger import get_logger
 from utils.helpers import clean_text, extract_domain
 
 logger = get_logger(__name__)
 
+# "Show HN: Name - description"; the description separator needs spaces so
+# hyphenated names ("Open-Source Foo") stay intact
+SHOW_HN_RE = re.compile(
+    r'^\s*show\s*hn\b\s*[:\-\u2013\u2014]?\s*(?P<name>.+?)(?:\s+[-\u2013\u2014]\s+(?P<desc>.*?))?\s*$',
+    re.IGNORECASE
+)
+
 class HackerNewsScraper(BaseScraper):
     """
     Scraper for Hacker News (news.ycombinator.com).
     API is available but this demonstrates resilient scraping.
     """
     
+    __slots__ = ()
+    
     BASE_URL = "https://news.ycombinator.com"
     
+    MAX_ITEMS = 20  # Limit for demo
+    
+    # Class tests match one token of a multi-class attribute ("athing submission")
+    _XPATH_TITLELINE = etree.XPath('.//span[contains(concat(" ", normalize-space(@class), " "), " titleline ")]')
+    
     def __init__(self, **kwargs):
         super().__init__(source=DataSource.JOB_BOARDS, **kwargs)
         
@@ -45,22 +62,26 @@ class HackerNewsScraper(BaseScraper):
         try:
             # We'll scrape "Show HN" (https://news.ycombinator.com/show)
             url = f"{self.BASE_URL}/show"
-            logger.info(f"Scraping Hacker News: {url}")
+            logger.info("Scraping Hacker News: %s", url)
             
-            soup = self.get_soup(url)
-            if not soup:
+            tree = self.get_lxml(url)
+            if tree is None:
                 result.add_error("Failed to fetch Hacker News")
                 return result
                 
-            items = soup.find_all('tr', class_='athing')
+            # Lazy walk over <tr> elements that stops after MAX_ITEMS story rows
+            items = islice(
+                (row for row in tree.iter('tr') if 'athing' in (row.get('class') or '').split()),
+                self.MAX_ITEMS
+            )
             
-            for item in items[:20]: # Limit for demo
-                company = self._parse_item(item)
+            for item in items:
+                company = self.parse_company(item)
                 if company:
                     result.add_company(company)
                     
             result.execution_time = time.time() - start_time
-            logger.info(f"Hacker News scrape completed: {result.total_scraped} companies")
+            logger.info("Hacker News scrape completed: %d companies", result.total_scraped)
             
         except Exception as e:
             logger.exception(f"Error scraping HN: {e}")
@@ -71,65 +92,61 @@ class HackerNewsScraper(BaseScraper):
     def parse_company(self, item) -> Optional[Company]:
         try:
             # Title line
-            title_line = item.find('span', class_='titleline')
-            if not title_line:
+            titles = self._XPATH_TITLELINE(item)
+            if not titles:
                 logger.debug("Skipping: no titleline")
                 return None
+            title_line = titles[0]
                 
-            link = title_line.find('a')
-            if not link:
+            links = title_line.xpath('(.//a)[1]')
+            if not links:
                 logger.debug("Skipping: no link")
                 return None
+            link = links[0]
                 
-            title_text = clean_text(link.get_text())
+            title_text = clean_text(link.text_content())
             if not title_text:
                 # Fallback: get text from the span
-                title_text = clean_text(title_line.get_text())
+                title_text = clean_text(title_line.text_content())
             
-            url = link['href']
+            url = link.get('href')
             
             # Filter out internal HN links
             if url.startswith('item?id='):
-                logger.debug(f"Skipping internal link: {url}")
+                logger.debug("Skipping internal link: %s", url)
                 return None
                 
-            logger.debug(f"Processing: {title_text}")
+            logger.debug("Processing: %s", title_text)
             
             # Clean title "Show HN: My Company - Description"
-            company_name = title_text
-            description = ""
+            match = SHOW_HN_RE.match(title_text)
+            if match:
+                company_name = match.group('name')
+                description = match.group('desc') or ""
+            else:
+                company_name = title_text
+                description = ""
             
-            # Case insensitive check
-            if "show hn" in title_text.lower():
-                # Try to split by colon first
-                if ":" in title_text:
-                    parts = title_text.split(":", 1)
-                    # Use the part after colon
-                    rest = parts[1].strip()
-                    # Try to split by dash for description
-                    if "-" in rest:
-                        name_parts = rest.split("-", 1)
-                        company_name = name_parts[0].strip()
-                        description = name_parts[1].strip()
-                    else:
-                        company_name = rest
-                else:
-                    # just remove Show HN
-                    company_name = re.sub(r'show hn', '', title_text, flags=re.IGNORECASE).strip()
+            # Only the name and the story link need checking; the models
+            # below are built without re-validating the rest
+            company_name = company_name.strip()
+            website = parse_http_url(url)
+            if not company_name or website is None:
+                return None
             
             # Try to enrich tech stack via simple keyword matching on description
-            enrichment = CompanyEnrichment(
+            enrichment = CompanyEnrichment.model_construct(
                 tags=['hacker-news', 'show-hn'],
-                hiring_intent=HiringIntent(is_hiring=True) # Startups usually hiring
+                hiring_intent=HiringIntent.model_construct(is_hiring=True) # Startups usually hiring
             )
             
-            return Company(
+            return Company.model_construct(
                 name=company_name,
                 domain=extract_domain(url),
-                website=url,
+                website=website,
                 description=description,
                 source=self.source,
-                source_url=f"{self.BASE_URL}/item?id={item['id']}",
+                source_url=parse_http_url(f"{self.BASE_URL}/item?id={item.get('id')}"),
                 enrichment=enrichment
             )
             
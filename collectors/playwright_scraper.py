@@ -0,0 +1,346 @@
+# OpenLead Intelligence - Playwright-based Scraper
+
+"""
+Playwright-based scraper for JavaScript-heavy websites.
+Drives Chromium over a direct CDP connection instead of going through
+ChromeDriver, and mirrors SeleniumScraper's API so either can be used.
+"""
+
+from typing import Optional, List, Dict
+
+from config import settings
+from utils.logger import get_logger
+from models.schemas import DataSource
+
+logger = get_logger(__name__)
+
+# Resource types aborted when heavy resources are blocked
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Scroll until the page height stops changing or max scrolls is reached;
+# resolves with the number of scrolls that loaded more content
+SCROLL_TO_BOTTOM_JS = """
+async ([maxScrolls, pauseMs]) => {
+    let lastHeight = document.body.scrollHeight;
+    let scrolls = 0;
+    while (scrolls < maxScrolls) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise(resolve => setTimeout(resolve, pauseMs));
+        const newHeight = document.body.scrollHeight;
+        if (newHeight === lastHeight) break;
+        lastHeight = newHeight;
+        scrolls++;
+    }
+    return scrolls;
+}
+"""
+
+# Read text and link for every selector in one evaluation
+EXTRACT_TEXTS_JS = """
+selectors => {
+    const out = {};
+    for (const selector of selectors) {
+        out[selector] = Array.from(document.querySelectorAll(selector), el => ({
+            text: (el.innerText || '').trim(),
+            href: el.href || el.getAttribute('href')
+        }));
+    }
+    return out;
+}
+"""
+
+# Flags shared with the Selenium launcher
+_CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-blink-features=AutomationControlled",
+]
+
+
+class PlaywrightScraper:
+    """
+    Playwright-based scraper for dynamic websites.
+    
+    Offers the same page API as SeleniumScraper (get_page, scroll_to_bottom,
+    find_elements, get_page_source, ...). Resource blocking uses request
+    interception, so it applies to every request type, not only URL patterns.
+    """
+    
+    def __init__(
+        self,
+        headless: bool = None,
+        timeout: int = None,
+        source: DataSource = DataSource.OTHER,
+        block_resources: bool = None
+    ):
+        """
+        Initialize Playwright scraper.
+        
+        Args:
+            headless: Run browser in headless mode
+            timeout: Page load timeout in seconds
+            source: Data source identifier
+            block_resources: Skip images, fonts and media (default from config,
+                off for sources listed in resource_blocking_exempt_sources)
+        """
+        self.headless = headless if headless is not None else settings.headless_browser
+        self.timeout = timeout if timeout is not None else settings.browser_timeout
+        self.source = source
+        
+        if block_resources is None:
+            block_resources = (
+                settings.block_heavy_resources
+                and source.value not in settings.resource_blocking_exempt_sources
+            )
+        self.block_resources = block_resources
+        
+        self._playwright = None
+        self.context = None
+        self.page = None
+        
+        logger.info("Initializing Playwright scraper")
+    
+    def _init_browser(self):
+        """Launch Chromium with a persistent context and open a page."""
+        if self.page:
+            return
+        
+        from playwright.sync_api import sync_playwright, Error as PlaywrightError
+        
+        try:
+            self._playwright = sync_playwright().start()
+            
+            user_data_dir = settings.browser_user_data_dir
+            self.context = self._playwright.chromium.launch_persistent_context(
+                # An empty path gives a throwaway profile
+                user_data_dir=str(user_data_dir) if user_data_dir else "",
+                headless=self.headless,
+                args=_CHROMIUM_ARGS,
+                user_agent=settings.get_headers()['User-Agent'],
+                viewport={"width": 1920, "height": 1080},
+            )
+            self.context.set_default_timeout(self.timeout * 1000)
+            
+            # Hide webdriver property before any page script runs
+            self.context.add_init_script(
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            )
+            
+            if self.block_resources:
+                self.context.route("**/*", self._route_request)
+            
+            self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+            
+            logger.info("Playwright Chromium initialized successfully")
+        
+        except PlaywrightError as e:
+            logger.error(f"Failed to initialize Playwright: {e}")
+            logger.error("Make sure browsers are installed (playwright install chromium)")
+            self.close()
+            raise
+    
+    @staticmethod
+    def _route_request(route):
+        """Abort heavy sub-resources, let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def get_page(self, url: str, wait_for: Optional[str] = None, wait_time: int = 10) -> bool:
+        """
+        Load a page and optionally wait for an element.
+        
+        Args:
+            url: URL to load
+            wait_for: CSS selector to wait for (optional)
+            wait_time: Maximum wait time in seconds
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
+        try:
+            self._init_browser()
+            
+            logger.info(f"Loading page: {url}")
+            # Same early return as the Selenium driver's eager load strategy
+            self.page.goto(url, wait_until="domcontentloaded", timeout=self.timeout * 1000)
+            
+            if wait_for:
+                logger.debug("Waiting for element: %s", wait_for)
+                self.page.wait_for_selector(wait_for, state="attached", timeout=wait_time * 1000)
+            
+            return True
+        
+        except PlaywrightTimeoutError:
+            logger.error(f"Timeout waiting for page or element: {url}")
+            return False
+        except Exception as e:
+            logger.error(f"Error loading page {url}: {e}")
+            return False
+    
+    def scroll_to_bottom(self, pause_time: float = 1.0, max_scrolls: int = 10):
+        """
+        Scroll to bottom of page to load dynamic content.
+        
+        Args:
+            pause_time: Pause between scrolls in seconds
+            max_scrolls: Maximum number of scroll attempts
+        """
+        try:
+            scrolls = self.page.evaluate(SCROLL_TO_BOTTOM_JS, [max_scrolls, int(pause_time * 1000)])
+            logger.debug("Scrolled %s times", scrolls)
+        
+        except Exception as e:
+            logger.error(f"Error scrolling page: {e}")
+    
+    def find_elements(self, selector: str) -> List:
+        """
+        Find elements by selector.
+        
+        Args:
+            selector: CSS selector (or any Playwright selector, e.g. "xpath=...")
+        
+        Returns:
+            List of ElementHandles
+        """
+        try:
+            return self.page.query_selector_all(selector)
+        except Exception as e:
+            logger.error(f"Error finding elements with selector '{selector}': {e}")
+            return []
+    
+    def find_element(self, selector: str):
+        """
+        Find single element by selector.
+        
+        Args:
+            selector: CSS selector (or any Playwright selector)
+        
+        Returns:
+            ElementHandle or None
+        """
+        try:
+            return self.page.query_selector(selector)
+        except Exception as e:
+            logger.debug("Element not found with selector '%s': %s", selector, e)
+            return None
+    
+    def find_many(self, selectors: List[str]) -> Dict[str, List]:
+        """
+        Find elements for several selectors.
+        
+        Args:
+            selectors: CSS selectors
+        
+        Returns:
+            Dictionary mapping each selector to its list of ElementHandles
+        """
+        return {selector: self.find_elements(selector) for selector in selectors}
+    
+    def extract_texts(self, selectors: List[str]) -> Dict[str, List[dict]]:
+        """
+        Read text and links for several CSS selectors in one evaluation.
+        
+        Args:
+            selectors: CSS selectors
+        
+        Returns:
+            Dictionary mapping each selector to a list of
+            {'text': ..., 'href': ...} dicts (href is None without a link)
+        """
+        try:
+            return self.page.evaluate(EXTRACT_TEXTS_JS, list(selectors))
+        except Exception as e:
+            logger.error(f"Error extracting texts with selectors {selectors}: {e}")
+            return {selector: [] for selector in selectors}
+    
+    def get_page_source(self) -> str:
+        """Get current page source."""
+        try:
+            return self.page.content()
+        except Exception as e:
+            logger.error(f"Error getting page source: {e}")
+            return ""
+    
+    def take_screenshot(self, filepath: str):
+        """
+        Take screenshot of current page.
+        
+        Args:
+            filepath: Path to save screenshot
+        """
+        try:
+            self.page.screenshot(path=filepath)
+            logger.info(f"Screenshot saved to: {filepath}")
+        except Exception as e:
+            logger.error(f"Error taking screenshot: {e}")
+    
+    def execute_script(self, script: str):
+        """
+        Execute JavaScript in the browser.
+        
+        Args:
+            script: JavaScript expression or function to evaluate
+        
+        Returns:
+            Script return value
+        """
+        try:
+            return self.page.evaluate(script)
+        except Exception as e:
+            logger.error(f"Error executing script: {e}")
+            return None
+    
+    def close(self):
+        """Close browser and cleanup."""
+        try:
+            if self.context:
+                self.context.close()
+            if self._playwright:
+                self._playwright.stop()
+            if self.context or self._playwright:
+                logger.info("Playwright browser closed")
+        except Exception as e:
+            logger.error(f"Error closing Playwright browser: {e}")
+        finally:
+            self.page = None
+            self.context = None
+            self._playwright = None
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def create_browser_scraper(**kwargs):
+    """
+    Create the browser scraper selected by settings.browser_engine.
+    
+    Args:
+        **kwargs: Arguments for the scraper (headless, timeout, source, ...)
+    
+    Returns:
+        PlaywrightScraper or SeleniumScraper
+    """
+    if settings.browser_engine == "selenium":
+        from collectors.selenium_scraper import SeleniumScraper
+        return SeleniumScraper(**kwargs)
+    return PlaywrightScraper(**kwargs)
+
+
+if __name__ == "__main__":
+    print("Playwright Scraper")
+    print("\nExample usage:")
+    print("  with create_browser_scraper() as scraper:")
+    print("      scraper.get_page('https://example.com')")
+    print("      scraper.scroll_to_bottom()")
+    print("      texts = scraper.extract_texts(['.company-card h3', '.company-card a'])")
+    print("\nNote: Requires Playwright browsers (playwright install chromium)")
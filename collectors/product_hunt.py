@@ -5,20 +5,31 @@ Scraper for Product Hunt to collect newly launched products and companies.
 Extracts company information, product details, and launch metrics.
 """
 
+import re
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from datetime import datetime, timedelta
 
-from collectors.base_scraper import BaseScraper
+from bs4 import BeautifulSoup
+
+from collectors.base_scraper import BaseScraper, POOL_MAXSIZE
 from models.schemas import (
     Company, CompanyEnrichment, ScrapingResult,
-    DataSource, CompanySize, TechStack
+    DataSource, CompanySize, TechStack, parse_http_url
 )
 from utils.logger import get_logger
 from utils.helpers import extract_domain, clean_text, clean_company_name
 
 logger = get_logger(__name__)
 
+# Upvote count in a button label, allowing thousands separators ("1,204")
+_UPVOTE_RE = re.compile(r'\d[\d,]*')
+
+# Fallback match for a product's website link by its label
+_WEBSITE_TEXT_RE = re.compile('website', re.IGNORECASE)
+
 
 class ProductHuntScraper(BaseScraper):
     """
@@ -28,8 +39,26 @@ class ProductHuntScraper(BaseScraper):
     web scraping approach, but using the API is recommended for production.
     """
     
+    __slots__ = ()
+    
     BASE_URL = "https://www.producthunt.com"
     
+    MAX_CARDS_PER_PAGE = 20
+    
+    # Threads fetching product pages; capped by the shared connection pool
+    DETAIL_WORKERS = min(10, POOL_MAXSIZE)
+    
+    # Daily page selectors; class matches are case-insensitive substrings
+    _SEL_CARDS = ('div[data-test="post-item"]', 'article', 'div[class*="post" i]')
+    _SEL_NAME_LINK = 'a[class*="name" i]'
+    _SEL_TAGLINE = 'div[class*="tagline" i]'
+    _SEL_UPVOTE = 'button[class*="vote" i]'
+    
+    # Product page selectors
+    _SEL_WEBSITE_LINK = 'a[data-test="website-link"]'
+    _SEL_MAKER_LINK = 'a[data-test="maker-link"]'
+    _SEL_TOPIC_LINK = 'a[data-test="topic-link"]'
+    
     def __init__(self, **kwargs):
         """Initialize Product Hunt scraper."""
         super().__init__(source=DataSource.PRODUCT_HUNT, **kwargs)
@@ -38,7 +67,9 @@ class ProductHuntScraper(BaseScraper):
         self,
         days_back: int = 7,
         max_products: int = 50,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        concurrency: int = 4,
+        fetch_details: bool = False
     ) -> ScrapingResult:
         """
         Scrape Product Hunt for recent product launches.
@@ -47,39 +78,77 @@ class ProductHuntScraper(BaseScraper):
             days_back: Number of days to look back
             max_products: Maximum number of products to scrape
             category: Filter by category (optional)
+            concurrency: Maximum number of daily pages fetched in parallel
+            fetch_details: Also visit each product page for website, makers and topics
         
         Returns:
             ScrapingResult with scraped companies
         """
+        return asyncio.run(
+            self.scrape_async(
+                days_back=days_back,
+                max_products=max_products,
+                category=category,
+                concurrency=concurrency,
+                fetch_details=fetch_details
+            )
+        )
+    
+    async def scrape_async(
+        self,
+        days_back: int = 7,
+        max_products: int = 50,
+        category: Optional[str] = None,
+        concurrency: int = 4,
+        fetch_details: bool = False
+    ) -> ScrapingResult:
+        """
+        Scrape Product Hunt daily pages concurrently.
+        
+        All daily pages are downloaded in parallel (bounded by
+        ``concurrency`` and per-host rate limiting), then processed
+        newest-first so results match a sequential crawl. With more than
+        one page, parsing runs in the shared process pool so pages are
+        parsed on several cores; a single page is parsed in a thread.
+        With ``fetch_details``, product pages are then fetched through
+        enrich_with_details().
+        """
         start_time = time.time()
         result = ScrapingResult(source=self.source)
         
-        logger.info(f"Starting Product Hunt scrape (days_back={days_back}, max={max_products})")
+        logger.info("Starting Product Hunt scrape (days_back=%s, max=%s)", days_back, max_products)
         
         try:
+            # Every day's date string and URL is built before any I/O
+            current_date = datetime.now()
+            settled_before = current_date.date() - timedelta(days=1)
+            dates = [current_date - timedelta(days=day_offset) for day_offset in range(days_back)]
+            date_strs = [target_date.strftime("%Y/%m/%d") for target_date in dates]
+            urls = [f"{self.BASE_URL}/posts/{date_str}" for date_str in date_strs]
+            
+            semaphore = asyncio.Semaphore(concurrency)
+            in_pool = len(dates) > 1
+            async with self._client_session() as client:
+                pages = await asyncio.gather(*(
+                    self._fetch_and_parse(
+                        client, url, target_date, semaphore, in_pool,
+                        # A day's listing no longer changes once that day has passed
+                        settled=target_date.date() < settled_before
+                    )
+                    for url, target_date in zip(urls, dates)
+                ))
+            
             # Scrape daily pages
             products_scraped = 0
-            current_date = datetime.now()
             
-            for day_offset in range(days_back):
+            for date_str, products in zip(date_strs, pages):
                 if products_scraped >= max_products:
                     break
                 
-                target_date = current_date - timedelta(days=day_offset)
-                date_str = target_date.strftime("%Y/%m/%d")
-                
-                url = f"{self.BASE_URL}/posts/{date_str}"
-                logger.info(f"Scraping Product Hunt for date: {date_str}")
-                
-                soup = self.get_soup(url)
-                if not soup:
+                if products is None:
                     result.add_warning(f"Failed to fetch page for {date_str}")
                     continue
                 
-                # Parse products from the page
-                # Note: This is a simplified example. Actual selectors may vary.
-                products = self._parse_products_page(soup, target_date)
-                
                 for product_data in products:
                     if products_scraped >= max_products:
                         break
@@ -89,12 +158,15 @@ class ProductHuntScraper(BaseScraper):
                         result.add_company(company)
                         products_scraped += 1
                 
-                logger.info(f"Scraped {len(products)} products from {date_str}")
+                logger.info("Scraped %d products from %s", len(products), date_str)
+            
+            if fetch_details and result.companies:
+                await asyncio.to_thread(self.enrich_with_details, result.companies)
             
             result.execution_time = time.time() - start_time
             logger.info(
-                f"Product Hunt scrape completed: {result.total_scraped} companies "
-                f"in {result.execution_time:.2f}s"
+                "Product Hunt scrape completed: %d companies in %.2fs",
+                result.total_scraped, result.execution_time
             )
             
         except Exception as e:
@@ -103,7 +175,31 @@ class ProductHuntScraper(BaseScraper):
         
         return result
     
-    def _parse_products_page(self, soup, date) -> List[dict]:
+    async def _fetch_and_parse(
+        self,
+        client,
+        url: str,
+        date: datetime,
+        semaphore,
+        in_pool: bool = False,
+        settled: bool = False
+    ) -> Optional[List[dict]]:
+        """Fetch one daily page and parse its products (None if fetch failed)."""
+        logger.info("Scraping Product Hunt: %s", url)
+        
+        content = await self._fetch(client, url, semaphore, cache_permanent=settled)
+        if content is None:
+            return None
+        
+        # Parse products from the page
+        # Note: This is a simplified example. Actual selectors may vary.
+        if in_pool:
+            return await self._parse_in_pool(parse_products_html, content, date)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_products_html, content, date)
+    
+    @classmethod
+    def _parse_products_page(cls, soup, date) -> List[dict]:
         """
         Parse products from a daily page.
         
@@ -120,46 +216,49 @@ class ProductHuntScraper(BaseScraper):
             # Example selectors (may need adjustment based on actual HTML structure)
             # Product Hunt's structure changes frequently, so this is illustrative
             
-            product_cards = soup.find_all('div', {'data-test': 'post-item'}) or \
-                           soup.find_all('article') or \
-                           soup.find_all('div', class_=lambda x: x and 'post' in x.lower())
+            # First selector that matches anything wins
+            product_cards = []
+            for selector in cls._SEL_CARDS:
+                product_cards = soup.select(selector, limit=cls.MAX_CARDS_PER_PAGE)
+                if product_cards:
+                    break
             
-            for card in product_cards[:20]:  # Limit per page
+            for card in product_cards:
                 try:
+                    # Extract product name first; nameless cards are skipped
+                    # before any other subtree is walked
+                    name_elem = card.select_one('h3') or card.select_one(cls._SEL_NAME_LINK)
+                    if not name_elem:
+                        continue
+                    name = clean_text(name_elem.get_text())
+                    if not name:
+                        continue
+                    
                     product_data = {
                         'launch_date': date,
-                        'card': card
+                        'name': name
                     }
                     
-                    # Extract product name
-                    name_elem = card.find('h3') or card.find('a', class_=lambda x: x and 'name' in str(x).lower())
-                    if name_elem:
-                        product_data['name'] = clean_text(name_elem.get_text())
-                    
                     # Extract tagline/description
-                    desc_elem = card.find('p') or card.find('div', class_=lambda x: x and 'tagline' in str(x).lower())
+                    desc_elem = card.select_one('p') or card.select_one(cls._SEL_TAGLINE)
                     if desc_elem:
                         product_data['description'] = clean_text(desc_elem.get_text())
                     
                     # Extract link
-                    link_elem = card.find('a', href=True)
+                    link_elem = card.select_one('a[href]')
                     if link_elem:
-                        product_data['product_url'] = self.BASE_URL + link_elem['href'] if link_elem['href'].startswith('/') else link_elem['href']
+                        product_data['product_url'] = cls.BASE_URL + link_elem['href'] if link_elem['href'].startswith('/') else link_elem['href']
                     
                     # Extract upvotes (popularity metric)
-                    upvote_elem = card.find('button', class_=lambda x: x and 'vote' in str(x).lower())
+                    upvote_elem = card.select_one(cls._SEL_UPVOTE)
                     if upvote_elem:
-                        upvote_text = upvote_elem.get_text()
-                        try:
-                            product_data['upvotes'] = int(''.join(filter(str.isdigit, upvote_text)))
-                        except ValueError:
-                            product_data['upvotes'] = 0
+                        match = _UPVOTE_RE.search(upvote_elem.get_text())
+                        product_data['upvotes'] = int(match.group().replace(',', '')) if match else 0
                     
-                    if product_data.get('name'):
-                        products.append(product_data)
+                    products.append(product_data)
                 
                 except Exception as e:
-                    logger.warning(f"Error parsing product card: {e}")
+                    logger.warning("Error parsing product card: %s", e)
                     continue
         
         except Exception as e:
@@ -184,6 +283,8 @@ class ProductHuntScraper(BaseScraper):
             
             # Clean company name
             company_name = clean_company_name(name)
+            if not company_name:
+                return None
             
             # Try to extract website/domain
             website = None
@@ -193,15 +294,16 @@ class ProductHuntScraper(BaseScraper):
             # For now, we'll use the Product Hunt URL
             product_url = data.get('product_url')
             
-            # Create company object
-            company = Company(
+            # Create company object; the product link is the only untrusted
+            # field, so it alone is validated and the models skip validation
+            company = Company.model_construct(
                 name=company_name,
                 domain=domain,
                 website=website,
                 description=data.get('description'),
                 source=self.source,
-                source_url=product_url,
-                enrichment=CompanyEnrichment(
+                source_url=parse_http_url(product_url),
+                enrichment=CompanyEnrichment.model_construct(
                     company_size=CompanySize.STARTUP,  # Assumption for PH launches
                     tags=['product-hunt', 'new-launch'],
                 ),
@@ -212,13 +314,62 @@ class ProductHuntScraper(BaseScraper):
                 }
             )
             
-            logger.debug(f"Parsed company: {company_name}")
+            logger.debug("Parsed company: %s", company_name)
             return company
             
         except Exception as e:
             logger.error(f"Error parsing company from data: {e}")
             return None
     
+    def enrich_with_details(self, companies: List[Company]) -> None:
+        """
+        Fetch product pages in a bounded thread pool and merge their details.
+        
+        Requests go through the shared session, so workers reuse pooled
+        connections and still honour the scraper's rate limit.
+        
+        Args:
+            companies: Companies parsed from daily pages (updated in place)
+        """
+        urls = [str(company.source_url) for company in companies if company.source_url]
+        if not urls:
+            return
+        
+        logger.info("Fetching details for %d Product Hunt products", len(urls))
+        
+        with ThreadPoolExecutor(max_workers=min(self.DETAIL_WORKERS, len(urls))) as ex:
+            details = dict(zip(urls, ex.map(self.scrape_product_details, urls)))
+        
+        for company in companies:
+            if company.source_url:
+                self._merge_details(company, details.get(str(company.source_url)))
+    
+    @staticmethod
+    def _merge_details(company: Company, details: Optional[dict]) -> None:
+        """Merge scrape_product_details() output into a company."""
+        if not details:
+            return
+        
+        website = details.get('website')
+        if website and not company.website:
+            url = parse_http_url(website)
+            if url is None:
+                logger.debug("Ignoring invalid website for %s: %s", company.name, website)
+            else:
+                company.website = url
+                company.domain = details.get('domain') or company.domain
+        
+        topics = details.get('topics')
+        if topics:
+            tags = company.enrichment.tags
+            for topic in topics:
+                tag = topic.lower()
+                if tag and tag not in tags:
+                    tags.append(tag)
+        
+        if details.get('makers'):
+            company.extra_data['makers'] = details['makers']
+    
     def scrape_product_details(self, product_url: str) -> Optional[dict]:
         """
         Scrape detailed information from a product page.
@@ -237,19 +388,19 @@ class ProductHuntScraper(BaseScraper):
             details = {}
             
             # Extract website link
-            website_link = soup.find('a', {'data-test': 'website-link'}) or \
-                          soup.find('a', text=lambda x: x and 'website' in str(x).lower())
+            website_link = soup.select_one(self._SEL_WEBSITE_LINK) or \
+                          soup.find('a', string=_WEBSITE_TEXT_RE)
             if website_link and website_link.get('href'):
                 details['website'] = website_link['href']
                 details['domain'] = extract_domain(website_link['href'])
             
             # Extract maker information
-            makers = soup.find_all('a', {'data-test': 'maker-link'})
+            makers = soup.select(self._SEL_MAKER_LINK)
             if makers:
                 details['makers'] = [clean_text(m.get_text()) for m in makers]
             
             # Extract topics/tags
-            topics = soup.find_all('a', {'data-test': 'topic-link'})
+            topics = soup.select(self._SEL_TOPIC_LINK)
             if topics:
                 details['topics'] = [clean_text(t.get_text()) for t in topics]
             
@@ -260,6 +411,15 @@ class ProductHuntScraper(BaseScraper):
             return None
 
 
+def parse_products_html(content: bytes, date) -> List[dict]:
+    """
+    Parse a Product Hunt daily page body into product dicts.
+    
+    Module-level (and therefore picklable) so it can run in a worker process.
+    """
+    return ProductHuntScraper._parse_products_page(BeautifulSoup(content, "lxml"), date)
+
+
 if __name__ == "__main__":
     # Test scraper
     scraper = ProductHuntScraper()
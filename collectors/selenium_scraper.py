@@ -5,48 +5,123 @@ Selenium-based scraper for JavaScript-heavy websites.
 Provides browser automation capabilities for dynamic content.
 """
 
-import time
-from typing import Optional, List
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException
+import weakref
+from typing import Optional, List, Dict, TYPE_CHECKING
 
 from config import settings
 from utils.logger import get_logger
 from models.schemas import Company, ScrapingResult, DataSource
 
+if TYPE_CHECKING:
+    from collectors.driver_pool import SeleniumDriverPool
+
+# Selenium is imported inside the methods that drive a browser, so
+# importing this module (or the HTTP-only collectors) stays cheap.
+
 logger = get_logger(__name__)
 
 
+def _warn_unclosed(name: str):
+    """Finalizer for scrapers collected with a browser still open."""
+    # Only logs: the driver may belong to a pool, and quitting it during
+    # garbage collection can stall the interpreter
+    logger.warning(f"{name} was garbage collected without close(); its browser was not released")
+
+# Scroll until the page height stops changing or max scrolls is reached;
+# resolves with the number of scrolls that loaded more content
+SCROLL_TO_BOTTOM_JS = """
+const [maxScrolls, pauseMs, done] = arguments;
+let lastHeight = document.body.scrollHeight;
+let scrolls = 0;
+const tick = () => {
+    if (scrolls >= maxScrolls) return done(scrolls);
+    window.scrollTo(0, document.body.scrollHeight);
+    setTimeout(() => {
+        const newHeight = document.body.scrollHeight;
+        if (newHeight === lastHeight) return done(scrolls);
+        lastHeight = newHeight;
+        scrolls++;
+        tick();
+    }, pauseMs);
+};
+tick();
+"""
+
+# Evaluate every selector in one call; DOM nodes come back as WebElements
+FIND_MANY_JS = """
+const out = {};
+for (const selector of arguments[0]) {
+    out[selector] = Array.from(document.querySelectorAll(selector));
+}
+return out;
+"""
+
+# Look up elements by id through the document's id index
+FIND_BY_IDS_JS = """
+const out = {};
+for (const id of arguments[0]) {
+    out[id] = document.getElementById(id);
+}
+return out;
+"""
+
+# Like FIND_MANY_JS, but text and link are read in the page
+EXTRACT_TEXTS_JS = """
+const out = {};
+for (const selector of arguments[0]) {
+    out[selector] = Array.from(document.querySelectorAll(selector), el => ({
+        text: (el.innerText || '').trim(),
+        href: el.href || el.getAttribute('href')
+    }));
+}
+return out;
+"""
+
+
 class SeleniumScraper:
     """
     Selenium-based scraper for dynamic websites.
     
     Use this for sites that require JavaScript execution or
     have anti-bot protection that blocks simple HTTP requests.
+    
+    Pass a SeleniumDriverPool (e.g. get_driver_pool()) to borrow a warm
+    browser instead of launching Chrome for this scraper alone; close()
+    then hands the browser back to the pool.
     """
     
     def __init__(
         self,
         headless: bool = None,
         timeout: int = None,
-        source: DataSource = DataSource.OTHER
+        source: DataSource = DataSource.OTHER,
+        pool: Optional["SeleniumDriverPool"] = None,
+        block_resources: bool = None
     ):
         """
         Initialize Selenium scraper.
         
         Args:
-            headless: Run browser in headless mode
+            headless: Run browser in headless mode (ignored with a pool)
             timeout: Page load timeout in seconds
             source: Data source identifier
+            pool: Driver pool to borrow the browser from (optional)
+            block_resources: Skip images, fonts and media (default from config,
+                off for sources listed in resource_blocking_exempt_sources)
         """
         self.headless = headless if headless is not None else settings.headless_browser
         self.timeout = timeout if timeout is not None else settings.browser_timeout
         self.source = source
+        self.pool = pool
         self.driver = None
+        self._finalizer = None
+        
+        if block_resources is None:
+            block_resources = (
+                settings.block_heavy_resources
+                and source.value not in settings.resource_blocking_exempt_sources
+            )
+        self.block_resources = block_resources
         
         logger.info("Initializing Selenium scraper")
     
@@ -55,35 +130,25 @@ class SeleniumScraper:
         if self.driver:
             return
         
+        from selenium.common.exceptions import WebDriverException
+        from collectors.driver_pool import create_driver, set_resource_blocking
+        
         try:
-            chrome_options = Options()
-            
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            
-            # Common options for stability
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            # Anti-detection options
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # User agent
-            user_agent = settings.get_headers()['User-Agent']
-            chrome_options.add_argument(f'user-agent={user_agent}')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(self.timeout)
-            
-            # Execute script to hide webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            logger.info("Chrome WebDriver initialized successfully")
+            if self.pool:
+                self.driver = self.pool.acquire(timeout=self.timeout)
+                self.driver.set_page_load_timeout(self.timeout)
+                # Always set, so a previous borrower's choice does not carry over
+                set_resource_blocking(self.driver, self.block_resources)
+                logger.info("Chrome WebDriver acquired from pool")
+            else:
+                self.driver = create_driver(self.headless, self.timeout, block_images=self.block_resources)
+                if self.block_resources:
+                    set_resource_blocking(self.driver, True)
+                
+                logger.info("Chrome WebDriver initialized successfully")
             
+            self._finalizer = weakref.finalize(self, _warn_unclosed, self.__class__.__name__)
+        
         except WebDriverException as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
             logger.error("Make sure Chrome and ChromeDriver are installed")
@@ -101,6 +166,8 @@ class SeleniumScraper:
         Returns:
             True if successful, False otherwise
         """
+        from selenium.common.exceptions import TimeoutException
+        
         try:
             self._init_driver()
             
@@ -108,13 +175,17 @@ class SeleniumScraper:
             self.driver.get(url)
             
             if wait_for:
-                logger.debug(f"Waiting for element: {wait_for}")
+                from selenium.webdriver.common.by import By
+                from selenium.webdriver.support.ui import WebDriverWait
+                from selenium.webdriver.support import expected_conditions as EC
+                
+                logger.debug("Waiting for element: %s", wait_for)
                 WebDriverWait(self.driver, wait_time).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
                 )
             
             return True
-            
+        
         except TimeoutException:
             logger.error(f"Timeout waiting for page or element: {url}")
             return False
@@ -131,62 +202,111 @@ class SeleniumScraper:
             max_scrolls: Maximum number of scroll attempts
         """
         try:
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            scrolls = 0
-            
-            while scrolls < max_scrolls:
-                # Scroll down
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(pause_time)
-                
-                # Calculate new height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                
-                if new_height == last_height:
-                    break
-                
-                last_height = new_height
-                scrolls += 1
-            
-            logger.debug(f"Scrolled {scrolls} times")
+            # The whole loop runs in the page, so only two WebDriver commands
+            # are sent and the wait ends as soon as the height stops growing
+            self.driver.set_script_timeout(max_scrolls * pause_time + 5)
+            scrolls = self.driver.execute_async_script(
+                SCROLL_TO_BOTTOM_JS, max_scrolls, int(pause_time * 1000)
+            )
             
+            logger.debug("Scrolled %s times", scrolls)
+        
         except Exception as e:
             logger.error(f"Error scrolling page: {e}")
     
-    def find_elements(self, selector: str, by: By = By.CSS_SELECTOR) -> List:
+    def find_elements(self, selector: str, by: Optional[str] = None) -> List:
         """
         Find elements by selector.
         
         Args:
             selector: Element selector
-            by: Selector type (CSS_SELECTOR, XPATH, etc.)
+            by: Selector type (By.CSS_SELECTOR, By.XPATH, etc.; default CSS)
         
         Returns:
             List of WebElements
         """
+        from selenium.webdriver.common.by import By
+        
         try:
-            return self.driver.find_elements(by, selector)
+            return self.driver.find_elements(by or By.CSS_SELECTOR, selector)
         except Exception as e:
             logger.error(f"Error finding elements with selector '{selector}': {e}")
             return []
     
-    def find_element(self, selector: str, by: By = By.CSS_SELECTOR):
+    def find_element(self, selector: str, by: Optional[str] = None):
         """
         Find single element by selector.
         
         Args:
             selector: Element selector
-            by: Selector type
+            by: Selector type (default CSS)
         
         Returns:
             WebElement or None
         """
+        from selenium.webdriver.common.by import By
+        
         try:
-            return self.driver.find_element(by, selector)
+            return self.driver.find_element(by or By.CSS_SELECTOR, selector)
         except Exception as e:
-            logger.debug(f"Element not found with selector '{selector}': {e}")
+            logger.debug("Element not found with selector '%s': %s", selector, e)
             return None
     
+    def find_many(self, selectors: List[str]) -> Dict[str, List]:
+        """
+        Find elements for several CSS selectors in one WebDriver call.
+        
+        Args:
+            selectors: CSS selectors
+        
+        Returns:
+            Dictionary mapping each selector to its list of WebElements
+        """
+        try:
+            return self.driver.execute_script(FIND_MANY_JS, list(selectors))
+        except Exception as e:
+            logger.error(f"Error finding elements with selectors {selectors}: {e}")
+            return {selector: [] for selector in selectors}
+    
+    def find_by_ids(self, ids: List[str]) -> Dict[str, Optional[object]]:
+        """
+        Find elements for several element ids in one WebDriver call.
+        
+        Uses document.getElementById, which is a hash lookup rather than
+        a selector match.
+        
+        Args:
+            ids: Element ids (without '#')
+        
+        Returns:
+            Dictionary mapping each id to its WebElement, or None if absent
+        """
+        try:
+            return self.driver.execute_script(FIND_BY_IDS_JS, list(ids))
+        except Exception as e:
+            logger.error(f"Error finding elements with ids {ids}: {e}")
+            return {element_id: None for element_id in ids}
+    
+    def extract_texts(self, selectors: List[str]) -> Dict[str, List[dict]]:
+        """
+        Read text and links for several CSS selectors in one WebDriver call.
+        
+        Unlike find_many(), nothing is returned as a WebElement, so reading
+        the results costs no further round-trips.
+        
+        Args:
+            selectors: CSS selectors
+        
+        Returns:
+            Dictionary mapping each selector to a list of
+            {'text': ..., 'href': ...} dicts (href is None without a link)
+        """
+        try:
+            return self.driver.execute_script(EXTRACT_TEXTS_JS, list(selectors))
+        except Exception as e:
+            logger.error(f"Error extracting texts with selectors {selectors}: {e}")
+            return {selector: [] for selector in selectors}
+    
     def get_page_source(self) -> str:
         """Get current page source."""
         try:
@@ -225,11 +345,19 @@ class SeleniumScraper:
             return None
     
     def close(self):
-        """Close browser and cleanup."""
+        """Close browser (or return it to the pool) and cleanup."""
+        if self._finalizer:
+            self._finalizer.detach()
+            self._finalizer = None
+        
         if self.driver:
             try:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+                if self.pool:
+                    self.pool.release(self.driver)
+                    logger.info("WebDriver returned to pool")
+                else:
+                    self.driver.quit()
+                    logger.info("WebDriver closed")
             except Exception as e:
                 logger.error(f"Error closing WebDriver: {e}")
             finally:
@@ -242,10 +370,6 @@ class SeleniumScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
-    
-    def __del__(self):
-        """Destructor."""
-        self.close()
 
 
 if __name__ == "__main__":
@@ -255,4 +379,5 @@ if __name__ == "__main__":
     print("      scraper.get_page('https://example.com')")
     print("      scraper.scroll_to_bottom()")
     print("      elements = scraper.find_elements('.company-card')")
+    print("      texts = scraper.extract_texts(['.company-card h3', '.company-card a'])")
     print("\nNote: Requires Chrome and ChromeDriver to be installed")
@@ -6,10 +6,49 @@ Centralized configuration management for the scraping framework.
 Uses environment variables with sensible defaults.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, validator
+from pydantic import Field, field_validator
+
+
+# fake_useragent loads its bundled browser data on construction, so one
+# instance is shared and only created once a random user agent is needed
+_UA_SINGLETON = None
+
+
+def get_user_agent_source():
+    """Return the shared fake_useragent.UserAgent, creating it on first use."""
+    global _UA_SINGLETON
+    if _UA_SINGLETON is None:
+        from fake_useragent import UserAgent
+        _UA_SINGLETON = UserAgent()
+    return _UA_SINGLETON
+
+
+# Default request headers other than the user agent
+_STATIC_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Used when no custom user agent is set and rotation is disabled
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+@lru_cache(maxsize=1)
+def get_static_headers(user_agent: str) -> dict:
+    """
+    Build the full header set for a fixed user agent once.
+    
+    The returned dict is shared; copy it before modifying.
+    """
+    return {"User-Agent": user_agent, **_STATIC_HEADERS}
 
 
 class Settings(BaseSettings):
@@ -33,6 +72,27 @@ class Settings(BaseSettings):
     retry_delay: float = Field(default=1.0, description="Initial retry delay in seconds")
     rate_limit_delay: float = Field(default=2.0, description="Delay between requests in seconds")
     
+    # Response Cache Settings
+    enable_response_cache: bool = Field(default=True, description="Cache GET responses on disk")
+    response_cache_dir: Path = Field(default=Path(".scraper_cache"), description="Response cache directory")
+    response_cache_ttl: int = Field(default=86400, description="Response cache lifetime in seconds")
+    
+    # DNS Cache Settings
+    enable_dns_cache: bool = Field(default=True, description="Cache resolved domain IPs")
+    dns_cache_dir: Path = Field(default=Path("cache/dns"), description="On-disk DNS cache directory")
+    dns_cache_ttl: int = Field(default=3600, description="DNS cache lifetime in seconds")
+    
+    # Tech Stack Cache Settings
+    enable_tech_stack_cache: bool = Field(default=True, description="Cache detected tech stacks per domain")
+    tech_stack_cache_dir: Path = Field(default=Path("cache/tech_stack"), description="On-disk tech stack cache directory")
+    tech_stack_cache_ttl: int = Field(default=7 * 86400, description="Tech stack cache lifetime in seconds")
+    
+    # GeoIP Settings
+    geoip_db_path: Optional[Path] = Field(
+        default=None,
+        description="MaxMind GeoLite2-City .mmdb file for IP geolocation (disabled if unset)"
+    )
+    
     # User Agent Settings
     user_agent: Optional[str] = Field(
         default=None,
@@ -41,8 +101,23 @@ class Settings(BaseSettings):
     rotate_user_agents: bool = Field(default=True, description="Enable user agent rotation")
     
     # Browser Automation Settings
+    browser_engine: Literal["selenium", "playwright"] = Field(
+        default="playwright",
+        description="Engine used by create_browser_scraper()"
+    )
+    browser_user_data_dir: Optional[Path] = Field(
+        default=None,
+        description="Persistent Playwright browser profile (temporary profile if unset)"
+    )
     headless_browser: bool = Field(default=True, description="Run browser in headless mode")
     browser_timeout: int = Field(default=60, description="Browser operation timeout")
+    browser_pool_size: int = Field(default=2, description="Chrome instances kept in the shared driver pool")
+    browser_max_uses: int = Field(default=50, description="Scraper sessions served before a pooled browser is restarted")
+    block_heavy_resources: bool = Field(default=True, description="Block images, fonts and media in browser sessions")
+    resource_blocking_exempt_sources: list[str] = Field(
+        default_factory=lambda: [],
+        description="Data sources (e.g. 'clutch') whose browser sessions load all resources"
+    )
     
     # API Keys (Optional - for platforms with official APIs)
     crunchbase_api_key: Optional[str] = Field(default=None, description="Crunchbase API key")
@@ -51,7 +126,7 @@ class Settings(BaseSettings):
     
     # Output Settings
     output_dir: Path = Field(default=Path("output"), description="Output directory for results")
-    output_format: str = Field(default="csv", description="Default output format (csv, json, excel)")
+    output_format: str = Field(default="csv", description="Default output format (csv, json, jsonl, excel)")
     
     # Logging Settings
     log_level: str = Field(default="INFO", description="Logging level")
@@ -80,16 +155,19 @@ class Settings(BaseSettings):
     
     # Compliance Settings
     respect_robots_txt: bool = Field(default=False, description="Respect robots.txt")
+    robots_cache_ttl: int = Field(default=3600, description="How long a parsed robots.txt is reused, in seconds")
     max_pages_per_site: int = Field(default=100, description="Maximum pages to scrape per site")
     
-    @validator("output_dir", "log_dir", pre=True)
+    @field_validator("output_dir", "log_dir", mode="before")
+    @classmethod
     def create_directories(cls, v):
         """Ensure directories exist."""
         path = Path(v)
         path.mkdir(parents=True, exist_ok=True)
         return path
     
-    @validator("log_level")
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -98,10 +176,11 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level. Must be one of {valid_levels}")
         return v
     
-    @validator("output_format")
+    @field_validator("output_format")
+    @classmethod
     def validate_output_format(cls, v):
         """Validate output format."""
-        valid_formats = ["csv", "json", "excel", "parquet"]
+        valid_formats = ["csv", "json", "jsonl", "excel", "parquet"]
         v = v.lower()
         if v not in valid_formats:
             raise ValueError(f"Invalid output format. Must be one of {valid_formats}")
@@ -109,25 +188,12 @@ class Settings(BaseSettings):
     
     def get_headers(self) -> dict:
         """Get default HTTP headers."""
-        from fake_useragent import UserAgent
-        
         if self.user_agent:
-            user_agent = self.user_agent
-        elif self.rotate_user_agents:
-            ua = UserAgent()
-            user_agent = ua.random
-        else:
-            user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            return dict(get_static_headers(self.user_agent))
+        if not self.rotate_user_agents:
+            return dict(get_static_headers(DEFAULT_USER_AGENT))
         
-        return {
-            "User-Agent": user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        return {"User-Agent": get_user_agent_source().random, **_STATIC_HEADERS}
 
 
 # Global settings instance
@@ -1,30 +1,68 @@
 
-import requests
-from bs4 import BeautifulSoup
+import io
+import asyncio
 
-def debug_clutch():
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    url = "https://clutch.co/web-developers"
-    print(f"Fetching {url}")
-    resp = requests.get(url, headers=headers)
+from lxml import etree
+
+from utils.http_client import get_async_http_client, aclose_async_http_client
+
+def count_provider_markup(content):
+    # Stream the page and drop each element once seen, so multi-MB
+    # listings never build a full tree
+    counts = {'provider_rows': 0, 'articles': 0, 'provider_cards': 0}
+    if not content.strip():
+        return counts
+    for _, element in etree.iterparse(io.BytesIO(content), events=('end',), html=True):
+        classes = element.get('class') or ''
+        if element.tag == 'li' and 'provider-row' in classes.split():
+            counts['provider_rows'] += 1
+        elif element.tag == 'article':
+            counts['articles'] += 1
+        elif element.tag == 'div' and 'provider-card' in classes:
+            counts['provider_cards'] += 1
+        
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    return counts
+
+def report_clutch(url, resp):
+    print(f"\n{url}")
     print(f"Status: {resp.status_code}")
     
-    soup = BeautifulSoup(resp.content, 'lxml')
+    counts = count_provider_markup(resp.content)
     
     # Check for rows
-    rows = soup.find_all('li', class_='provider-row')
-    print(f"Found {len(rows)} provider rows")
+    print(f"Found {counts['provider_rows']} provider rows")
     
-    if not rows:
+    if not counts['provider_rows']:
         # Debug alternative selectors
         print("Checking alternative selectors...")
-        articles = soup.find_all('article')
-        print(f"Found {len(articles)} articles")
-        
-        divs = soup.find_all('div', class_=lambda x: x and 'provider-card' in x)
-        print(f"Found {len(divs)} provider-card divs")
+        print(f"Found {counts['articles']} articles")
+        print(f"Found {counts['provider_cards']} provider-card divs")
+
+async def debug_all(urls):
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    print(f"Fetching {len(urls)} pages")
+    client = get_async_http_client()
+    try:
+        results = await asyncio.gather(
+            *(client.get(url, headers=headers) for url in urls),
+            return_exceptions=True
+        )
+    finally:
+        await aclose_async_http_client()
+    
+    for url, resp in zip(urls, results):
+        if isinstance(resp, Exception):
+            print(f"\n{url}\nFailed: {resp}")
+        else:
+            report_clutch(url, resp)
 
 if __name__ == "__main__":
-    debug_clutch()
+    asyncio.run(debug_all([
+        "https://clutch.co/web-developers",
+        "https://clutch.co/it-services",
+    ]))
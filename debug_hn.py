@@ -1,34 +1,55 @@
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
 
-def debug_hn():
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    url = "https://news.ycombinator.com/show"
-    print(f"Fetching {url}")
-    resp = requests.get(url, headers=headers)
+from selectolax.lexbor import LexborHTMLParser
+
+from utils.http_client import get_async_http_client, aclose_async_http_client
+
+def report_hn(url, resp):
+    print(f"\n{url}")
     print(f"Status: {resp.status_code}")
     
-    soup = BeautifulSoup(resp.content, 'lxml')
+    tree = LexborHTMLParser(resp.content)
     
-    items = soup.find_all('tr', class_='athing')
+    items = tree.css('tr.athing')
     print(f"Found {len(items)} items")
     
     if items:
         item = items[0]
         # titleline check
-        title_line = item.find('span', class_='titleline')
+        title_line = item.css_first('span.titleline')
         print(f"Titleline found: {title_line is not None}")
         if title_line:
-            print(title_line.prettify())
+            print(title_line.html)
         else:
             # Check for alternative 'title' class?
-            title_cell = item.find('td', class_='title')
+            title_cell = item.css_first('td.title')
             print(f"Title cell found: {title_cell is not None}")
             if title_cell:
-                print(title_cell.prettify())
+                print(title_cell.html)
+
+async def debug_all(urls):
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    print(f"Fetching {len(urls)} pages")
+    client = get_async_http_client()
+    try:
+        results = await asyncio.gather(
+            *(client.get(url, headers=headers) for url in urls),
+            return_exceptions=True
+        )
+    finally:
+        await aclose_async_http_client()
+    
+    for url, resp in zip(urls, results):
+        if isinstance(resp, Exception):
+            print(f"\n{url}\nFailed: {resp}")
+        else:
+            report_hn(url, resp)
 
 if __name__ == "__main__":
-    debug_hn()
+    asyncio.run(debug_all([
+        "https://news.ycombinator.com/show",
+        "https://news.ycombinator.com/shownew",
+    ]))
@@ -9,5 +9,6 @@ __all__ = [
     "geographic",
     "company_size",
     "funding",
-    "domain_enrichment"
+    "domain_enrichment",
+    "pipeline"
 ]
@@ -15,6 +15,10 @@ class CompanySizeEstimator:
     Estimates company size based on data from various sources (social, website, etc).
     """
     
+    # Reads hiring intent filled in by other enrichers, so the concurrent
+    # runner applies it after them
+    DERIVED = True
+    
     def enrich_company(self, company: Company) -> Company:
         if not company.enrichment:
             company.enrichment = CompanyEnrichment()
@@ -4,54 +4,251 @@
 Enrichment module to gather domain-level intelligence.
 """
 
+import time
 import socket
-from typing import Optional
+import asyncio
+import threading
+from typing import Optional, List, Dict, Tuple
 from urllib.parse import urlparse
 
+import diskcache
+
+from config import settings
 from models.schemas import Company, CompanyEnrichment, GeographicInfo
 from utils.logger import get_logger
 from utils.helpers import extract_domain
+from utils.geo import normalize_country
 
 logger = get_logger(__name__)
 
+# Resolved IPs in memory: domain -> (expires_at, ip), oldest entry first
+_DNS_CACHE: Dict[str, Tuple[float, str]] = {}
+_DNS_CACHE_MAXSIZE = 50_000
+
+# On-disk copy so reruns skip lookups made by earlier processes
+_dns_disk_cache: Optional[diskcache.Cache] = None
+_dns_disk_cache_lock = threading.Lock()
+
+# Memory-mapped GeoLite2 reader; False once opening has failed
+_geoip_reader = None
+_geoip_lock = threading.Lock()
+
+
+def get_dns_disk_cache() -> Optional[diskcache.Cache]:
+    """Return the persistent DNS cache, or None if DNS caching is disabled."""
+    global _dns_disk_cache
+    if not settings.enable_dns_cache:
+        return None
+    with _dns_disk_cache_lock:
+        if _dns_disk_cache is None:
+            _dns_disk_cache = diskcache.Cache(str(settings.dns_cache_dir))
+        return _dns_disk_cache
+
+
+def get_cached_ip(domain: str) -> Optional[str]:
+    """
+    Look up a previously resolved IP for a domain.
+    
+    Args:
+        domain: Domain name
+    
+    Returns:
+        IP address, or None if not cached or expired
+    """
+    if not settings.enable_dns_cache:
+        return None
+    
+    entry = _DNS_CACHE.get(domain)
+    if entry is not None:
+        expires_at, ip_address = entry
+        if expires_at > time.time():
+            return ip_address
+        _DNS_CACHE.pop(domain, None)
+    
+    disk_cache = get_dns_disk_cache()
+    ip_address, expires_at = disk_cache.get(domain, expire_time=True)
+    if ip_address is None:
+        return None
+    
+    # Entries written by cache_ip() always carry an expiry
+    _remember_ip(domain, ip_address, expires_at or time.time() + settings.dns_cache_ttl)
+    return ip_address
+
+
+def cache_ip(domain: str, ip_address: str):
+    """
+    Store a resolved IP in memory and on disk for settings.dns_cache_ttl.
+    
+    Args:
+        domain: Domain name
+        ip_address: Resolved IP address
+    """
+    if not settings.enable_dns_cache:
+        return
+    
+    ttl = settings.dns_cache_ttl
+    _remember_ip(domain, ip_address, time.time() + ttl)
+    get_dns_disk_cache().set(domain, ip_address, expire=ttl)
+
+
+def get_geoip_reader():
+    """
+    Return the shared GeoLite2 reader, or None if GeoIP is not configured.
+    
+    The database is opened memory-mapped, so lookups allocate almost
+    nothing and worker processes share the same pages.
+    """
+    global _geoip_reader
+    if not settings.geoip_db_path:
+        return None
+    with _geoip_lock:
+        if _geoip_reader is None:
+            try:
+                import maxminddb
+                _geoip_reader = maxminddb.open_database(
+                    str(settings.geoip_db_path), mode=maxminddb.MODE_MMAP
+                )
+            except Exception as e:
+                logger.warning(f"GeoIP lookups disabled, could not open {settings.geoip_db_path}: {e}")
+                _geoip_reader = False
+        return _geoip_reader or None
+
+
+def _remember_ip(domain: str, ip_address: str, expires_at: float):
+    """Put an entry in the in-memory cache, evicting the oldest when full."""
+    if domain not in _DNS_CACHE and len(_DNS_CACHE) >= _DNS_CACHE_MAXSIZE:
+        _DNS_CACHE.pop(next(iter(_DNS_CACHE)), None)
+    _DNS_CACHE[domain] = (expires_at, ip_address)
+
 
 class DomainEnricher:
     """
     Enriches company data using Domain/DNS/WHOIS information.
     """
-
+    
     def __init__(self):
         logger.info("Initialized DomainEnricher")
-
+    
     def enrich_company(self, company: Company) -> Company:
         """
         Add domain-level details like IP location (geo approximation).
         """
-        domain = company.domain
-        if not domain and company.website:
-            domain = extract_domain(str(company.website))
-        
+        domain = self._company_domain(company)
         if not domain:
             return company
-
+        
         try:
             # Resolve IP to get rough location (GeoIP would be better in prod)
-            ip_address = socket.gethostbyname(domain)
-            
-            # Create enrichment if missing
-            if not company.enrichment:
-                company.enrichment = CompanyEnrichment()
-            
-            if not company.enrichment.geographic_info:
-                company.enrichment.geographic_info = GeographicInfo()
-            
-            # Store IP as placeholder for real GeoIP lookup
-            # In a real app, use a MaxMind GeoIP library or API here
-            company.extra_data['ip_address'] = ip_address
-            
-            logger.debug(f"Resolved {domain} to {ip_address}")
-            
+            ip_address = get_cached_ip(domain)
+            if ip_address is None:
+                ip_address = socket.gethostbyname(domain)
+                cache_ip(domain, ip_address)
+            self._apply_ip(company, domain, ip_address)
+        
         except Exception as e:
             logger.warning(f"Domain enrichment failed for {domain}: {e}")
-
+        
         return company
+    
+    async def aenrich_company(self, company: Company) -> Company:
+        """Async variant of enrich_company() for the concurrent enrichment runner."""
+        await self.enrich_batch([company])
+        return company
+    
+    async def enrich_batch(self, companies: List[Company]) -> List[Company]:
+        """
+        Enrich many companies, resolving their domains concurrently.
+        
+        Each distinct domain is looked up once, and all lookups are in
+        flight together, so a batch takes about as long as its slowest
+        lookup rather than the sum of them. Cached domains are not
+        looked up at all.
+        
+        Args:
+            companies: Companies to enrich (updated in place)
+        
+        Returns:
+            The same companies
+        """
+        domains = [self._company_domain(company) for company in companies]
+        resolved = {}
+        for domain in domains:
+            if domain and domain not in resolved:
+                resolved[domain] = get_cached_ip(domain)
+        
+        pending = [domain for domain, ip_address in resolved.items() if ip_address is None]
+        results = await asyncio.gather(
+            *(self._resolve_async(domain) for domain in pending),
+            return_exceptions=True
+        )
+        for domain, ip_address in zip(pending, results):
+            resolved[domain] = ip_address
+            if not isinstance(ip_address, Exception):
+                cache_ip(domain, ip_address)
+        
+        for company, domain in zip(companies, domains):
+            if not domain:
+                continue
+            
+            ip_address = resolved[domain]
+            if isinstance(ip_address, Exception):
+                logger.warning(f"Domain enrichment failed for {domain}: {ip_address}")
+                continue
+            
+            self._apply_ip(company, domain, ip_address)
+        
+        return companies
+    
+    @staticmethod
+    async def _resolve_async(domain: str) -> str:
+        """Resolve a domain to an IPv4 address without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(domain, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+        return infos[0][4][0]
+    
+    @staticmethod
+    def _company_domain(company: Company) -> Optional[str]:
+        """Domain to resolve for a company, falling back to its website."""
+        domain = company.domain
+        if not domain and company.website:
+            domain = extract_domain(str(company.website))
+        return domain
+    
+    @staticmethod
+    def _apply_ip(company: Company, domain: str, ip_address: str):
+        """Record a resolved IP address on the company."""
+        # Create enrichment if missing
+        if not company.enrichment:
+            company.enrichment = CompanyEnrichment()
+        
+        if not company.enrichment.geographic_info:
+            company.enrichment.geographic_info = GeographicInfo()
+        
+        company.extra_data['ip_address'] = ip_address
+        
+        logger.debug("Resolved %s to %s", domain, ip_address)
+        
+        reader = get_geoip_reader()
+        if reader is None:
+            return
+        
+        try:
+            record = reader.get(ip_address)
+        except ValueError as e:
+            logger.debug("GeoIP lookup failed for %s: %s", ip_address, e)
+            return
+        if not record:
+            return
+        
+        # Server location only approximates the company's, so fields that
+        # came from the source itself are kept
+        geo = company.enrichment.geographic_info
+        location = record.get('location', {})
+        if not geo.country:
+            geo.country = record.get('country', {}).get('iso_code')
+            geo.country_code = normalize_country(geo.country, iso_alpha2=True)
+        geo.city = geo.city or record.get('city', {}).get('names', {}).get('en')
+        geo.timezone = geo.timezone or location.get('time_zone')
+        if geo.latitude is None and geo.longitude is None:
+            geo.latitude = location.get('latitude')
+            geo.longitude = location.get('longitude')
@@ -23,3 +23,7 @@ class FundingEnricher:
         # or parse press release data if available
         
         return company
+    
+    async def aenrich_company(self, company: Company) -> Company:
+        """Async variant of enrich_company(); no I/O happens yet, so it runs inline."""
+        return self.enrich_company(company)
@@ -7,15 +7,34 @@ Enrichment module for geographic data normalization and timezones.
 from typing import Optional
 from models.schemas import Company, GeographicInfo
 from utils.logger import get_logger
+from utils.geo import normalize_country
 
 logger = get_logger(__name__)
 
+# ISO 3166-1 numeric country codes per region; utils.geo maps names,
+# alpha-3 codes and (from ISO sources such as GeoIP) alpha-2 codes to them
+_REGION_COUNTRIES = {
+    "North America": (840, 124),
+    "Europe": (826, 276, 250, 528, 724, 380, 372, 752, 616, 756),
+}
+
+# Country code -> region, built once at import
+_COUNTRY_TO_REGION = {
+    country: region
+    for region, countries in _REGION_COUNTRIES.items()
+    for country in countries
+}
+
 
 class GeographicEnricher:
     """
     Normalizes location data (City, Country) and adds region/timezone info.
     """
     
+    # Normalizes location filled in by other enrichers (e.g. GeoIP), so the
+    # concurrent runner applies it after them
+    DERIVED = True
+    
     def __init__(self):
         # In production, load a city/country database here
         pass
@@ -32,10 +51,12 @@ class GeographicEnricher:
             # Try to infer country from city (simplified)
             pass
             
-        # Example region mapping
-        if geo.country in ['USA', 'United States', 'US']:
-            geo.region = "North America"
-        elif geo.country in ['UK', 'United Kingdom', 'Germany', 'France']:
-            geo.region = "Europe"
+        # Country code for integer comparisons (kept if an ISO source set
+        # it), then region mapping
+        if geo.country_code is None:
+            geo.country_code = normalize_country(geo.country)
+        region = _COUNTRY_TO_REGION.get(geo.country_code)
+        if region:
+            geo.region = region
             
         return company
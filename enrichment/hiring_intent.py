@@ -41,6 +41,16 @@ class HiringIntentAnalyzer:
         
         return company
 
+    async def aenrich_company(self, company: Company) -> Company:
+        """
+        Async variant of enrich_company() for the concurrent enrichment runner.
+        
+        Careers pages, once analyzed, should be fetched here with
+        utils.http_client.get_async_http_client(). Until then this runs
+        the placeholder logic inline.
+        """
+        return self.enrich_company(company)
+
     def analyze_careers_page(self, url: str) -> Optional[HiringIntent]:
         """
         Analyze a specific careers page URL.
@@ -0,0 +1,129 @@
+# OpenLead Intelligence - Concurrent Enrichment Runner
+
+"""
+Runs enrichers concurrently, across enrichers for one company and across
+companies. Enrichers are dominated by network waits (DNS, websites, APIs),
+so overlapping them bounds a company's enrichment time by its slowest
+enricher rather than the sum of all of them.
+"""
+
+import asyncio
+from typing import List, Any, Optional, Callable
+
+from models.schemas import Company, CompanyEnrichment
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def aenrich(enricher: Any, company: Company) -> Company:
+    """
+    Run one enricher on a company without blocking the event loop.
+    
+    Uses the enricher's ``aenrich_company`` coroutine when it has one;
+    a sync-only enricher runs in the default thread pool.
+    
+    Args:
+        enricher: Enricher instance
+        company: Company to enrich (updated in place)
+    
+    Returns:
+        The same company
+    """
+    if hasattr(enricher, 'aenrich_company'):
+        return await enricher.aenrich_company(company)
+    return await asyncio.to_thread(enricher.enrich_company, company)
+
+
+async def enrich_all(company: Company, enrichers: List[Any]) -> Company:
+    """
+    Apply enrichers to one company.
+    
+    Independent enrichers run concurrently. Enrichers marked ``DERIVED``
+    build on fields other enrichers fill in (e.g. size from hiring
+    intent), so they run afterwards, one by one in the given order.
+    A failing enricher is logged and does not affect the others.
+    
+    Args:
+        company: Company to enrich (updated in place)
+        enrichers: Enricher instances
+    
+    Returns:
+        The same company
+    """
+    # Create the shared container up front so concurrent enrichers
+    # cannot each replace it with their own
+    created = not company.enrichment
+    if created:
+        company.enrichment = CompanyEnrichment()
+    
+    independent = [e for e in enrichers if not getattr(e, 'DERIVED', False)]
+    derived = [e for e in enrichers if getattr(e, 'DERIVED', False)]
+    
+    results = await asyncio.gather(
+        *(aenrich(enricher, company) for enricher in independent),
+        return_exceptions=True
+    )
+    for enricher, result in zip(independent, results):
+        if isinstance(result, Exception):
+            _log_failure(company, enricher, result)
+    
+    for enricher in derived:
+        try:
+            await aenrich(enricher, company)
+        except Exception as e:
+            _log_failure(company, enricher, e)
+    
+    # Leave unenriched companies as they were: scoring and export treat an
+    # empty container differently from none (e.g. unknown company size)
+    if created and company.enrichment == CompanyEnrichment():
+        company.enrichment = None
+    
+    return company
+
+
+async def enrich_companies(
+    companies: List[Company],
+    enrichers: List[Any],
+    concurrency: int = 10,
+    on_company_done: Optional[Callable[[Company], None]] = None
+) -> List[Company]:
+    """
+    Apply enrichers to many companies concurrently.
+    
+    Args:
+        companies: Companies to enrich (updated in place)
+        enrichers: Enricher instances
+        concurrency: Maximum number of companies enriched at once
+        on_company_done: Called with each company once it is enriched
+    
+    Returns:
+        The same companies, in their original order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def enrich_one(company: Company) -> Company:
+        async with semaphore:
+            await enrich_all(company, enrichers)
+        if on_company_done:
+            on_company_done(company)
+        return company
+    
+    await asyncio.gather(*(enrich_one(company) for company in companies))
+    return companies
+
+
+def _log_failure(company: Company, enricher: Any, error: BaseException):
+    """Log an enricher failure for a company."""
+    logger.error(
+        f"Error enriching {company.name} with "
+        f"{enricher.__class__.__name__}: {error}"
+    )
+
+
+if __name__ == "__main__":
+    print("Concurrent Enrichment Runner")
+    print("\nExample usage:")
+    print("  companies = asyncio.run(enrich_companies(")
+    print("      companies, [DomainEnricher(), TechStackDetector(), CompanySizeEstimator()]")
+    print("  ))")
@@ -6,16 +6,283 @@ Identifies programming languages, frameworks, databases, and tools.
 """
 
 import re
+import time
+import asyncio
+import threading
+import httpx
 import requests
-from typing import Optional, Set, List
-from bs4 import BeautifulSoup
+import ahocorasick
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set, List, Tuple, Mapping, Dict
+from requests.adapters import HTTPAdapter
+from lxml import etree
 
+import diskcache
+
+from config import settings
 from models.schemas import TechStack, Company
 from utils.logger import get_logger
-from utils.helpers import normalize_url
+from utils.helpers import normalize_url, extract_domain
+from utils.http_client import get_async_http_client
 
 logger = get_logger(__name__)
 
+# Detected stacks in memory: domain -> (expires_at, TechStack fields),
+# oldest entry first
+_TECH_CACHE: Dict[str, Tuple[float, dict]] = {}
+_TECH_CACHE_MAXSIZE = 4096
+
+# On-disk copy so reruns skip sites detected by earlier processes
+_tech_disk_cache: Optional[diskcache.Cache] = None
+_tech_disk_cache_lock = threading.Lock()
+
+# A 403 stops fetching from a host for the rest of the process; a 429
+# only for its Retry-After, or RATE_LIMIT_BACKOFF seconds without one
+FORBIDDEN_STATUS = 403
+RATE_LIMITED_STATUS = 429
+RATE_LIMIT_BACKOFF = 60.0
+
+# Hosts that answered 403/429 -> time.monotonic() until which they are skipped
+_BLOCKED_HOSTS: Dict[str, float] = {}
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+# Per-thread Hyperscan scratch space; a scratch cannot be shared by
+# concurrent scans
+_hyperscan_scratch = threading.local()
+
+# Characters that make a pattern more than a plain substring
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]|()\\')
+
+
+def _literal_form(pattern: str) -> Optional[str]:
+    """The substring a pattern matches, or None if it needs a regex engine."""
+    # An escaped dot is still a literal character
+    if _REGEX_METACHARACTERS.isdisjoint(pattern.replace(r'\.', '')):
+        return pattern.replace(r'\.', '.').lower()
+    return None
+
+
+def _drop_redundant_patterns(patterns: dict) -> dict:
+    """
+    Remove literal patterns made redundant by a shorter one of the same technology.
+    
+    If a technology's substring q occurs inside its substring p (e.g.
+    'mongo' in 'mongodb'), every match of p is also a match of q, so p
+    never changes the result and only adds matcher states.
+    
+    Args:
+        patterns: Technology name -> list of regex strings
+    
+    Returns:
+        New dict with the redundant patterns left out
+    """
+    minimal = {}
+    for tech_name, tech_patterns in patterns.items():
+        literals = {pattern: _literal_form(pattern) for pattern in tech_patterns}
+        minimal[tech_name] = [
+            pattern for pattern, literal in literals.items()
+            if literal is None or not any(
+                other != literal and other in literal
+                for other in literals.values() if other is not None
+            )
+        ]
+    return minimal
+
+
+def _split_patterns(patterns: dict) -> tuple:
+    """
+    Split technology patterns into plain substrings and compiled regexes.
+    
+    Args:
+        patterns: Technology name -> list of regex strings
+    
+    Returns:
+        (literals, regexes): technology name -> list of lowercase
+        substrings, and technology name -> list of compiled patterns
+    """
+    literals = {tech_name: [] for tech_name in patterns}
+    regexes = {tech_name: [] for tech_name in patterns}
+    
+    for tech_name, tech_patterns in patterns.items():
+        for pattern in tech_patterns:
+            literal = _literal_form(pattern)
+            if literal is not None:
+                literals[tech_name].append(literal)
+            else:
+                regexes[tech_name].append(re.compile(pattern))
+    
+    return literals, regexes
+
+
+def get_tech_stack_disk_cache() -> Optional[diskcache.Cache]:
+    """Return the persistent tech stack cache, or None if caching is disabled."""
+    global _tech_disk_cache
+    if not settings.enable_tech_stack_cache:
+        return None
+    with _tech_disk_cache_lock:
+        if _tech_disk_cache is None:
+            _tech_disk_cache = diskcache.Cache(str(settings.tech_stack_cache_dir))
+        return _tech_disk_cache
+
+
+def get_cached_tech_stack(domain: str) -> Optional[TechStack]:
+    """
+    Look up a previously detected tech stack for a domain.
+    
+    Args:
+        domain: Domain name
+    
+    Returns:
+        A new TechStack, or None if not cached or expired
+    """
+    if not settings.enable_tech_stack_cache:
+        return None
+    
+    entry = _TECH_CACHE.get(domain)
+    if entry is not None:
+        expires_at, fields = entry
+        if expires_at > time.time():
+            return TechStack(**fields)
+        _TECH_CACHE.pop(domain, None)
+    
+    fields, expires_at = get_tech_stack_disk_cache().get(domain, expire_time=True)
+    if fields is None:
+        return None
+    
+    _remember_tech_stack(domain, fields, expires_at or time.time() + settings.tech_stack_cache_ttl)
+    return TechStack(**fields)
+
+
+def cache_tech_stack(domain: str, tech_stack: TechStack):
+    """
+    Store a detected tech stack in memory and on disk for settings.tech_stack_cache_ttl.
+    
+    Args:
+        domain: Domain name
+        tech_stack: Detected tech stack
+    """
+    if not settings.enable_tech_stack_cache:
+        return
+    
+    ttl = settings.tech_stack_cache_ttl
+    fields = tech_stack.model_dump()
+    _remember_tech_stack(domain, fields, time.time() + ttl)
+    get_tech_stack_disk_cache().set(domain, fields, expire=ttl)
+
+
+def _remember_tech_stack(domain: str, fields: dict, expires_at: float):
+    """Put an entry in the in-memory cache, evicting the oldest when full."""
+    if domain not in _TECH_CACHE and len(_TECH_CACHE) >= _TECH_CACHE_MAXSIZE:
+        _TECH_CACHE.pop(next(iter(_TECH_CACHE)), None)
+    _TECH_CACHE[domain] = (expires_at, fields)
+
+
+def _compile_hyperscan(patterns: dict) -> tuple:
+    """
+    Compile all technology patterns into one Hyperscan database.
+    
+    Hyperscan is optional; without it (or on CPUs it does not support)
+    detection uses the Aho-Corasick automaton and re instead.
+    
+    Args:
+        patterns: Technology name -> list of regex strings
+    
+    Returns:
+        (database, techs) where techs[i] is the technology for pattern id i,
+        or (None, None) if Hyperscan is unavailable
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None, None
+    
+    expressions = []
+    techs = []
+    for tech_name, tech_patterns in patterns.items():
+        for pattern in tech_patterns:
+            expressions.append(pattern.encode())
+            techs.append(tech_name)
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            # Each pattern only needs to report its first match
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+        )
+    except hyperscan.error as e:
+        logger.warning(f"Hyperscan unavailable, using Aho-Corasick: {e}")
+        return None, None
+    
+    return database, techs
+
+
+def _hyperscan_thread_scratch(database):
+    """Return this thread's scratch space for a Hyperscan database."""
+    scratch = getattr(_hyperscan_scratch, 'scratch', None)
+    if scratch is None:
+        import hyperscan
+        scratch = _hyperscan_scratch.scratch = hyperscan.Scratch(database)
+    return scratch
+
+
+class _TagAttributeCollector:
+    """
+    lxml parser target collecting meta name/content and script src values.
+    
+    Used with etree.HTMLParser(target=...), so start tags are reported as
+    they are parsed and no element tree is built at all.
+    """
+    
+    def __init__(self):
+        self.values: List[str] = []
+    
+    def start(self, tag: str, attrib: dict):
+        if tag == 'meta':
+            self.values.append(attrib.get('content', ''))
+            self.values.append(attrib.get('name', ''))
+        elif tag == 'script':
+            src = attrib.get('src')
+            if src is not None:
+                self.values.append(src)
+    
+    def close(self) -> List[str]:
+        return self.values
+
+
+def _build_literal_automaton(literals: dict) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton that finds every literal in one pass.
+    
+    Args:
+        literals: Technology name -> list of substrings
+    
+    Returns:
+        Automaton whose values are tuples of technology names
+    """
+    automaton = ahocorasick.Automaton()
+    for tech_name, tech_literals in literals.items():
+        for literal in tech_literals:
+            # A substring shared by several technologies reports all of them
+            automaton.add_word(literal, automaton.get(literal, ()) + (tech_name,))
+    automaton.make_automaton()
+    return automaton
+
 
 class TechStackDetector:
     """
@@ -159,6 +426,18 @@ class TechStackDetector:
         'material-ui': [r'material-ui', r'mui'],
     }
     
+    # PATTERNS without alternatives that cannot change the result
+    MATCH_PATTERNS = _drop_redundant_patterns(PATTERNS)
+    
+    # Most patterns are plain substrings, all found in one Aho-Corasick
+    # pass; only the rest are compiled. Scanned text is lowercased first,
+    # so neither needs IGNORECASE, which would also slow the regexes.
+    LITERAL_PATTERNS, REGEX_PATTERNS = _split_patterns(MATCH_PATTERNS)
+    LITERAL_AUTOMATON = _build_literal_automaton(LITERAL_PATTERNS)
+    
+    # All patterns in a single SIMD DFA when Hyperscan is installed
+    HYPERSCAN_DATABASE, HYPERSCAN_TECHS = _compile_hyperscan(MATCH_PATTERNS)
+    
     # Category mapping
     CATEGORIES = {
         'languages': [],
@@ -170,6 +449,25 @@ class TechStackDetector:
         'marketing': ['wordpress', 'shopify', 'wix', 'squarespace', 'bootstrap', 'tailwind', 'material-ui'],
     }
     
+    # Technology name -> (TechStack field, display name), in CATEGORIES order
+    TECH_PLACEMENT = {
+        tech_name: (category, tech_name.replace('-', ' ').title())
+        for category, tech_names in CATEGORIES.items()
+        for tech_name in tech_names
+    }
+    
+    # Websites fetched at once by enrich_companies()
+    MAX_WORKERS = 16
+    
+    # Seconds to wait for a connection; unreachable hosts fail fast
+    # instead of holding a worker for the full read timeout
+    CONNECT_TIMEOUT = 3
+    
+    # Bytes of each page downloaded and scanned. Framework, CMS and most
+    # tag-manager markers sit in the head; the cap leaves room for analytics
+    # snippets placed before </body> on typical pages.
+    MAX_HTML_BYTES = 256 * 1024
+    
     def __init__(self, timeout: int = 10):
         """
         Initialize tech stack detector.
@@ -178,6 +476,13 @@ class TechStackDetector:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
+        
+        # One keep-alive session for all fetches, sized for MAX_WORKERS
+        adapter = HTTPAdapter(pool_connections=self.MAX_WORKERS, pool_maxsize=self.MAX_WORKERS * 2)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         logger.info("Initialized TechStackDetector")
     
     def detect(self, company: Company) -> Optional[TechStack]:
@@ -190,82 +495,230 @@ class TechStackDetector:
         Returns:
             TechStack object or None
         """
-        if not company.website and not company.domain:
-            logger.warning(f"No website/domain for company: {company.name}")
+        url = self._company_url(company)
+        if not url:
             return None
         
-        url = str(company.website) if company.website else f"https://{company.domain}"
-        url = normalize_url(url)
-        
-        logger.info(f"Detecting tech stack for: {url}")
+        logger.info("Detecting tech stack for: %s", url)
         
         try:
-            # Fetch website
-            response = requests.get(url, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
+            cached = self._from_cache(url)
+            if cached or self._is_blocked(url):
+                return cached
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'lxml')
+            # Fetch only the start of the website
+            with self.session.get(
+                url,
+                timeout=(self.CONNECT_TIMEOUT, self.timeout),
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                self._note_status(url, response.status_code, response.headers)
+                response.raise_for_status()
+                content = response.raw.read(self.MAX_HTML_BYTES, decode_content=True)
+                
+                return self._analyze(company, url, content, response.headers, response.encoding)
             
-            # Detect technologies
-            detected = self._detect_from_html(soup, response)
-            
-            # Categorize technologies
-            tech_stack = self._categorize_technologies(detected)
-            
-            logger.info(f"Detected {len(detected)} technologies for {company.name}")
-            return tech_stack
+        except Exception as e:
+            logger.error(f"Error detecting tech stack for {url}: {e}")
+            return None
+    
+    async def detect_async(self, company: Company) -> Optional[TechStack]:
+        """
+        Async variant of detect() using the shared HTTP/2 client.
+        
+        Args:
+            company: Company object with website
+        
+        Returns:
+            TechStack object or None
+        """
+        url = self._company_url(company)
+        if not url:
+            return None
+        
+        logger.info("Detecting tech stack for: %s", url)
+        
+        try:
+            cached = self._from_cache(url)
+            if cached or self._is_blocked(url):
+                return cached
             
+            content, headers, encoding = await self._fetch(url)
+            return self._analyze(company, url, content, headers, encoding)
+        
         except Exception as e:
             logger.error(f"Error detecting tech stack for {url}: {e}")
             return None
     
-    def _detect_from_html(self, soup: BeautifulSoup, response: requests.Response) -> Set[str]:
+    async def _fetch(self, url: str) -> Tuple[bytes, httpx.Headers, str]:
+        """
+        Fetch up to MAX_HTML_BYTES of a website.
+        
+        Args:
+            url: Website URL
+        
+        Returns:
+            (content, headers, encoding)
+        
+        Raises:
+            httpx.HTTPError: On connection errors or HTTP error statuses
+        """
+        client = get_async_http_client()
+        timeout = httpx.Timeout(self.timeout, connect=self.CONNECT_TIMEOUT)
+        async with client.stream("GET", url, timeout=timeout, follow_redirects=True) as response:
+            self._note_status(url, response.status_code, response.headers)
+            response.raise_for_status()
+            
+            chunks = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self.MAX_HTML_BYTES:
+                    break
+            
+            return b"".join(chunks)[:self.MAX_HTML_BYTES], response.headers, response.encoding
+    
+    @staticmethod
+    def _company_url(company: Company) -> Optional[str]:
+        """URL to fetch for a company, or None if it has no website or domain."""
+        if not company.website and not company.domain:
+            logger.warning(f"No website/domain for company: {company.name}")
+            return None
+        
+        url = str(company.website) if company.website else f"https://{company.domain}"
+        return normalize_url(url)
+    
+    @staticmethod
+    def _is_blocked(url: str) -> bool:
+        """Whether the URL's host refused or rate-limited us recently enough to skip it."""
+        host = extract_domain(url)
+        blocked_until = _BLOCKED_HOSTS.get(host)
+        if blocked_until is None:
+            return False
+        if time.monotonic() >= blocked_until:
+            _BLOCKED_HOSTS.pop(host, None)
+            return False
+        logger.debug("Skipping %s: %s blocked an earlier request", url, host)
+        return True
+    
+    @staticmethod
+    def _note_status(url: str, status_code: int, headers: Mapping[str, str]):
+        """
+        Remember the URL's host if it refused (403) or rate-limited (429) us.
+        
+        Args:
+            url: Fetched URL
+            status_code: Response status
+            headers: Response headers (for Retry-After)
+        """
+        if status_code == FORBIDDEN_STATUS:
+            blocked_until = float('inf')
+        elif status_code == RATE_LIMITED_STATUS:
+            delay = _retry_after_seconds(headers.get('Retry-After'))
+            blocked_until = time.monotonic() + (RATE_LIMIT_BACKOFF if delay is None else delay)
+        else:
+            return
+        
+        host = extract_domain(url)
+        if host:
+            _BLOCKED_HOSTS[host] = blocked_until
+    
+    @staticmethod
+    def _from_cache(url: str) -> Optional[TechStack]:
+        """Tech stack detected earlier for the URL's domain, if still cached."""
+        domain = extract_domain(url)
+        cached = get_cached_tech_stack(domain) if domain else None
+        if cached:
+            logger.debug("Using cached tech stack for %s", domain)
+        return cached
+    
+    def _analyze(
+        self,
+        company: Company,
+        url: str,
+        content: bytes,
+        headers: Mapping[str, str],
+        encoding: Optional[str]
+    ) -> TechStack:
+        """Detect and categorize technologies in a fetched website."""
+        # Detect technologies
+        detected = self._detect_from_html(content, headers, encoding)
+        
+        # Categorize technologies
+        tech_stack = self._categorize_technologies(detected)
+        
+        logger.info("Detected %s technologies for %s", len(detected), company.name)
+        
+        domain = extract_domain(url)
+        if domain:
+            cache_tech_stack(domain, tech_stack)
+        
+        return tech_stack
+    
+    def _detect_from_html(
+        self,
+        content: bytes,
+        headers: Mapping[str, str],
+        encoding: Optional[str] = None
+    ) -> Set[str]:
         """
         Detect technologies from HTML and headers.
         
         Args:
-            soup: BeautifulSoup object
-            response: Response object
+            content: Raw HTML (possibly truncated to MAX_HTML_BYTES)
+            headers: Response headers
+            encoding: Charset from the response, UTF-8 if not given
         
         Returns:
             Set of detected technology names
         """
         detected = set()
         
-        # Get full HTML as text
-        html_text = str(soup).lower()
+        # Get HTML as text; a multi-byte character cut by the cap is replaced
+        try:
+            html_text = content.decode(encoding or 'utf-8', errors='replace').lower()
+        except LookupError:
+            html_text = content.decode('utf-8', errors='replace').lower()
         
         # Get headers
-        headers_text = str(response.headers).lower()
-        
-        # Check each technology pattern
-        for tech_name, patterns in self.PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, html_text, re.IGNORECASE) or \
-                   re.search(pattern, headers_text, re.IGNORECASE):
-                    detected.add(tech_name)
-                    break
+        headers_text = str(headers).lower()
+        
+        # Meta tag values and script sources, streamed from the parser
+        attribute_values = []
+        try:
+            parser = etree.HTMLParser(target=_TagAttributeCollector())
+            parser.feed(content)
+            attribute_values = [value.lower() for value in parser.close()]
+        except etree.LxmlError as e:
+            logger.debug("Could not parse HTML for meta/script tags: %s", e)
+        
+        # Scan everything as one document, so each pattern runs once
+        # instead of once per source, tag and script. No pattern can match
+        # a newline, so joining on one keeps matches within a single value.
+        text = "\n".join([html_text, headers_text, *attribute_values])
         
-        # Check meta tags
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            content = str(meta.get('content', '')).lower()
-            name = str(meta.get('name', '')).lower()
+        if self.HYPERSCAN_DATABASE is not None:
+            # Every pattern, regexes included, in one Hyperscan pass
+            def on_match(pattern_id, start, end, flags, context):
+                detected.add(self.HYPERSCAN_TECHS[pattern_id])
             
-            for tech_name, patterns in self.PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, content) or re.search(pattern, name):
-                        detected.add(tech_name)
-        
-        # Check script sources
-        scripts = soup.find_all('script', src=True)
-        for script in scripts:
-            src = script['src'].lower()
-            for tech_name, patterns in self.PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, src):
-                        detected.add(tech_name)
+            self.HYPERSCAN_DATABASE.scan(
+                text.encode('utf-8'),
+                match_event_handler=on_match,
+                scratch=_hyperscan_thread_scratch(self.HYPERSCAN_DATABASE)
+            )
+            return detected
+        
+        # Find all plain substrings in a single pass
+        for _, tech_names in self.LITERAL_AUTOMATON.iter(text):
+            detected.update(tech_names)
+        
+        # Regexes only for technologies the substrings did not find
+        for tech_name, patterns in self.REGEX_PATTERNS.items():
+            if tech_name not in detected and any(pattern.search(text) for pattern in patterns):
+                detected.add(tech_name)
         
         return detected
     
@@ -281,14 +734,11 @@ class TechStackDetector:
         """
         tech_stack = TechStack()
         
-        for tech in detected:
-            # Find category
-            for category, techs in self.CATEGORIES.items():
-                if tech in techs:
-                    # Add to appropriate list
-                    tech_list = getattr(tech_stack, category)
-                    tech_list.append(tech.replace('-', ' ').title())
-                    break
+        # Walk the fixed placement table rather than the set, so each
+        # category lists its technologies in the same order on every run
+        for tech_name, (category, display_name) in self.TECH_PLACEMENT.items():
+            if tech_name in detected:
+                getattr(tech_stack, category).append(display_name)
         
         return tech_stack
     
@@ -302,16 +752,53 @@ class TechStackDetector:
         Returns:
             Enriched company object
         """
-        tech_stack = self.detect(company)
-        
+        self._apply_tech_stack(company, self.detect(company))
+        return company
+    
+    async def aenrich_company(self, company: Company) -> Company:
+        """Async variant of enrich_company() for the concurrent enrichment runner."""
+        self._apply_tech_stack(company, await self.detect_async(company))
+        return company
+    
+    @staticmethod
+    def _apply_tech_stack(company: Company, tech_stack: Optional[TechStack]):
+        """Store a detected tech stack on the company."""
         if tech_stack:
             if not company.enrichment:
                 from models.schemas import CompanyEnrichment
                 company.enrichment = CompanyEnrichment()
             
             company.enrichment.tech_stack = tech_stack
+    
+    def enrich_companies(self, companies: List[Company], max_workers: int = None) -> List[Company]:
+        """
+        Enrich many companies, fetching their websites concurrently.
         
-        return company
+        Args:
+            companies: Company objects (updated in place)
+            max_workers: Concurrent fetches (default MAX_WORKERS)
+        
+        Returns:
+            The same companies, in their original order
+        """
+        if not companies:
+            return companies
+        
+        workers = min(max_workers or self.MAX_WORKERS, len(companies))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(self.enrich_company, companies))
+    
+    async def enrich_companies_async(self, companies: List[Company]) -> List[Company]:
+        """
+        Enrich many companies with all website fetches in flight together.
+        
+        Args:
+            companies: Company objects (updated in place)
+        
+        Returns:
+            The same companies, in their original order
+        """
+        return list(await asyncio.gather(*(self.aenrich_company(company) for company in companies)))
 
 
 if __name__ == "__main__":
@@ -17,28 +17,19 @@ Usage:
 """
 
 import sys
+import heapq
 import argparse
 from pathlib import Path
+from collections import Counter
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import settings
 from utils.logger import get_logger
 
-# Collectors
-from collectors.product_hunt import ProductHuntScraper
-from collectors.angellist import AngelListScraper
-
-# Enrichment
-from enrichment.tech_stack import TechStackDetector
-
-# Scoring
-from scoring.lead_scorer import LeadScorer
-
-# Pipeline
-from pipeline.orchestrator import PipelineOrchestrator
-from pipeline.output import DataExporter
+# Settings, collectors, enrichers, the scorer and the pipeline are imported
+# where they are used, so --help and argument errors return without
+# loading pydantic, pandas, lxml, selenium and the rest
 
 logger = get_logger("main")
 
@@ -94,7 +85,7 @@ def parse_arguments():
     
     parser.add_argument(
         "--output-format",
-        choices=["csv", "json", "excel", "all"],
+        choices=["csv", "json", "jsonl", "excel", "all"],
         default="csv",
         help="Output format"
     )
@@ -129,6 +120,7 @@ def main():
     args = parse_arguments()
     
     # Update settings
+    from config import settings
     settings.min_score_threshold = args.min_score
     
     logger.info("=" * 70)
@@ -174,6 +166,7 @@ def main():
         
         if "angellist" in sources:
             logger.info("Initializing AngelList scraper")
+            from collectors.angellist import AngelListScraper
             scrapers.append(AngelListScraper())
             scraper_configs.append({
                 "location": args.location,
@@ -201,15 +194,18 @@ def main():
     enrichers = []
     if args.enable_enrichment:
         logger.info("Initializing enrichers")
+        from enrichment.tech_stack import TechStackDetector
         enrichers.append(TechStackDetector())
     
     # Initialize scorer
     scorer = None
     if args.enable_scoring:
         logger.info("Initializing lead scorer")
+        from scoring.lead_scorer import LeadScorer
         scorer = LeadScorer()
     
     # Initialize pipeline orchestrator
+    from pipeline.orchestrator import PipelineOrchestrator
     orchestrator = PipelineOrchestrator(
         enable_enrichment=args.enable_enrichment,
         enable_scoring=args.enable_scoring,
@@ -235,25 +231,25 @@ def main():
         
         # Print summary
         if args.enable_scoring:
-            high_priority = len([c for c in companies if c.score and c.score.priority == 'high'])
-            medium_priority = len([c for c in companies if c.score and c.score.priority == 'medium'])
-            low_priority = len([c for c in companies if c.score and c.score.priority == 'low'])
+            # Tally all priorities in one pass
+            priorities = Counter(c.score.priority for c in companies if c.score)
             
-            logger.info(f"High priority: {high_priority}")
-            logger.info(f"Medium priority: {medium_priority}")
-            logger.info(f"Low priority: {low_priority}")
+            logger.info(f"High priority: {priorities['high']}")
+            logger.info(f"Medium priority: {priorities['medium']}")
+            logger.info(f"Low priority: {priorities['low']}")
         
         # Export results
+        from pipeline.output import DataExporter
         exporter = DataExporter()
         
         formats = [args.output_format] if args.output_format != "all" else ["csv", "json", "excel"]
         
-        for fmt in formats:
-            filepath = exporter.export(
-                companies=companies,
-                format=fmt,
-                filename=args.output_file
-            )
+        filepaths = exporter.export_many(
+            companies=companies,
+            formats=formats,
+            filename=args.output_file
+        )
+        for fmt, filepath in zip(formats, filepaths):
             logger.info(f"Exported to {fmt.upper()}: {filepath}")
         
         # Print top 5 companies
@@ -261,7 +257,11 @@ def main():
         logger.info("Top 5 Companies:")
         logger.info("=" * 70)
         
-        for i, company in enumerate(companies[:5], 1):
+        # Bounded-heap selection, so this does not rely on the list's order
+        top_companies = heapq.nlargest(
+            5, companies, key=lambda c: c.score.total_score if c.score else 0
+        )
+        for i, company in enumerate(top_companies, 1):
             score_str = f"{company.score.total_score:.1f}" if company.score else "N/A"
             priority_str = company.score.priority.upper() if company.score else "N/A"
             
@@ -6,9 +6,38 @@ Defines schemas for companies, leads, enrichment data, and scoring.
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, HttpUrl, validator, field_validator
+from pydantic import (
+    BaseModel, Field, HttpUrl, PrivateAttr, TypeAdapter, ValidationError,
+    validator, field_validator
+)
+
+from utils.helpers import clean_company_name, extract_domain
+
+
+_http_url_adapter = TypeAdapter(HttpUrl)
+
+
+def parse_http_url(value: Optional[str]) -> Optional[HttpUrl]:
+    """
+    Validate a scraped URL on its own, outside of a model.
+    
+    Used where companies are built with model_construct(): links taken
+    from pages are untrusted, so they are checked here instead.
+    
+    Args:
+        value: URL string
+    
+    Returns:
+        HttpUrl, or None if the value is empty or not a valid http(s) URL
+    """
+    if not value:
+        return None
+    try:
+        return _http_url_adapter.validate_python(value)
+    except ValidationError:
+        return None
 
 
 class CompanySize(str, Enum):
@@ -96,10 +125,13 @@ class FundingInfo(BaseModel):
 class GeographicInfo(BaseModel):
     """Geographic information."""
     country: Optional[str] = None
+    country_code: Optional[int] = Field(default=None, description="ISO 3166-1 numeric country code")
     region: Optional[str] = None
     city: Optional[str] = None
     timezone: Optional[str] = None
     headquarters: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 class SocialProfiles(BaseModel):
@@ -159,6 +191,19 @@ class LeadScore(BaseModel):
         return v.lower()
 
 
+# Flat export columns, grouped by the sub-model that fills them; a company
+# has either all or none of a group's columns
+FLAT_COLUMN_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "company": ("company_name", "domain", "website", "description", "source", "source_url", "scraped_at"),
+    "enrichment": ("employee_count", "company_size", "founded_year", "industry"),
+    "geo": ("country", "city"),
+    "funding": ("funding_stage", "total_funding"),
+    "hiring": ("open_positions", "is_hiring"),
+    "tech_stack": ("technologies",),
+    "score": ("total_score", "priority"),
+}
+
+
 class Company(BaseModel):
     """Core company data model."""
     # Basic Information
@@ -191,53 +236,88 @@ class Company(BaseModel):
         return v.strip()
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with datetime serialization."""
-        data = self.model_dump()
-        # Convert datetime to ISO format
-        data['scraped_at'] = self.scraped_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        return data
+        """Convert to JSON-ready dictionary (datetimes, URLs and enums as strings)."""
+        return self.model_dump(mode='json')
     
     def to_flat_dict(self) -> dict:
         """Convert to flat dictionary for CSV export."""
-        flat = {
-            "company_name": self.name,
-            "domain": self.domain,
-            "website": str(self.website) if self.website else None,
-            "description": self.description,
-            "source": self.source.value,
-            "source_url": str(self.source_url) if self.source_url else None,
-            "scraped_at": self.scraped_at.isoformat(),
-        }
+        return {name: values[0] for name, values in self.to_flat_columns([self]).items()}
+    
+    @classmethod
+    def to_flat_columns(cls, companies: List["Company"]) -> Dict[str, list]:
+        """
+        Column-oriented to_flat_dict() for many companies.
         
-        # Add enrichment data
-        if self.enrichment:
-            flat["employee_count"] = self.enrichment.employee_count
-            flat["company_size"] = self.enrichment.company_size.value
-            flat["founded_year"] = self.enrichment.founded_year
-            flat["industry"] = self.enrichment.industry
-            
-            if self.enrichment.geographic_info:
-                flat["country"] = self.enrichment.geographic_info.country
-                flat["city"] = self.enrichment.geographic_info.city
-            
-            if self.enrichment.funding_info:
-                flat["funding_stage"] = self.enrichment.funding_info.stage.value
-                flat["total_funding"] = self.enrichment.funding_info.total_funding
+        Builds one list per column instead of one dict per company, with
+        the layout pd.DataFrame gives for the flat dicts: columns in
+        first-seen order, None where a company lacks the field.
+        
+        Args:
+            companies: Companies to convert
+        
+        Returns:
+            Dictionary mapping each column name to one value per company
+        """
+        # Group -> one tuple of values per company (None if it lacks the group)
+        groups: Dict[str, list] = {"company": []}
+        
+        def rows(group: str) -> list:
+            group_rows = groups.get(group)
+            if group_rows is None:
+                group_rows = groups[group] = [None] * len(companies)
+            return group_rows
+        
+        company_rows = groups["company"]
+        for i, company in enumerate(companies):
+            company_rows.append((
+                company.name,
+                company.domain,
+                str(company.website) if company.website else None,
+                company.description,
+                company.source.value,
+                str(company.source_url) if company.source_url else None,
+                company.scraped_at.isoformat(),
+            ))
             
-            if self.enrichment.hiring_intent:
-                flat["open_positions"] = self.enrichment.hiring_intent.total_open_positions
-                flat["is_hiring"] = self.enrichment.hiring_intent.is_hiring
+            # Add enrichment data (sub-models read once into locals)
+            enrichment = company.enrichment
+            if enrichment:
+                rows("enrichment")[i] = (
+                    enrichment.employee_count,
+                    enrichment.company_size.value,
+                    enrichment.founded_year,
+                    enrichment.industry,
+                )
+                
+                geo = enrichment.geographic_info
+                if geo:
+                    rows("geo")[i] = (geo.country, geo.city)
+                
+                funding = enrichment.funding_info
+                if funding:
+                    rows("funding")[i] = (funding.stage.value, funding.total_funding)
+                
+                hiring = enrichment.hiring_intent
+                if hiring:
+                    rows("hiring")[i] = (hiring.total_open_positions, hiring.is_hiring)
+                
+                tech_stack = enrichment.tech_stack
+                if tech_stack:
+                    rows("tech_stack")[i] = (", ".join(tech_stack.all_technologies()[:10]),)
             
-            if self.enrichment.tech_stack:
-                flat["technologies"] = ", ".join(self.enrichment.tech_stack.all_technologies()[:10])
+            # Add scoring data
+            score = company.score
+            if score:
+                rows("score")[i] = (score.total_score, score.priority)
         
-        # Add scoring data
-        if self.score:
-            flat["total_score"] = self.score.total_score
-            flat["priority"] = self.score.priority
-        
-        return flat
+        columns = {}
+        for group, group_rows in groups.items():
+            names = FLAT_COLUMN_GROUPS[group]
+            missing = (None,) * len(names)
+            filled = [values or missing for values in group_rows]
+            for j, name in enumerate(names):
+                columns[name] = [values[j] for values in filled]
+        return columns
 
 
 class ScrapingResult(BaseModel):
@@ -252,11 +332,36 @@ class ScrapingResult(BaseModel):
     execution_time: float = 0.0
     source: DataSource = DataSource.OTHER
     
+    # Identity keys of companies added via add_unique_company
+    _seen: Set[Tuple[str, str, Optional[str]]] = PrivateAttr(default_factory=set)
+    
     def add_company(self, company: Company):
         """Add a company to results."""
         self.companies.append(company)
         self.total_scraped += 1
     
+    def add_unique_company(self, company: Company) -> bool:
+        """
+        Add a company unless one with the same identity was already added.
+        
+        Identity is (source, normalized name, domain), so repeats across
+        pages or overlapping categories are dropped before enrichment.
+        
+        Returns:
+            True if the company was added, False if it was a duplicate
+        """
+        url = company.website or company.source_url
+        key = (
+            company.source.value,
+            clean_company_name(company.name).lower(),
+            extract_domain(str(url)) if url else None
+        )
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self.add_company(company)
+        return True
+    
     def add_error(self, error: str):
         """Add an error message."""
         self.errors.append(error)
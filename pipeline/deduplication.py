@@ -4,8 +4,11 @@
 Deduplicate companies based on domain, name similarity, and other attributes.
 """
 
-from typing import List, Set
-from difflib import SequenceMatcher
+import copy
+from typing import List, Set, Dict, Optional
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from models.schemas import Company
 from utils.logger import get_logger
@@ -14,6 +17,32 @@ from utils.helpers import extract_domain, clean_company_name
 logger = get_logger(__name__)
 
 
+class _UnionFind:
+    """Disjoint sets over 0..n-1; each set's root is its smallest member."""
+    
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+    
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(self, i: int, j: int):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+    
+    def groups(self) -> List[List[int]]:
+        """Members of each set, sets ordered by their first member."""
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self.parent)):
+            groups.setdefault(self.find(i), []).append(i)
+        return list(groups.values())
+
+
 class CompanyDeduplicator:
     """
     Deduplicate companies using multiple strategies.
@@ -22,16 +51,50 @@ class CompanyDeduplicator:
     1. Exact domain match
     2. Fuzzy company name matching
     3. Website URL matching
+    
+    Names are only compared within blocks: names sharing their first
+    BLOCK_PREFIX_LENGTH characters or their first word. Near-duplicates
+    (punctuation, suffixes, typos near the end) almost always share one
+    of the two, and each name is then scored against a short list
+    instead of every name seen so far.
+    
+    Batches of LSH_MIN_COMPANIES or more use a MinHash LSH index over
+    character shingles instead when datasketch is installed, which finds
+    candidates in roughly constant time however large the batch and
+    does not depend on the start of the name.
     """
     
-    def __init__(self, name_similarity_threshold: float = 0.85):
+    BLOCK_PREFIX_LENGTH = 3
+    
+    # Below this many companies building MinHashes costs more than it saves
+    LSH_MIN_COMPANIES = 500
+    LSH_NUM_PERM = 64
+    SHINGLE_SIZE = 3
+    # Jaccard similarity of the shingle sets; looser than the name threshold
+    # because one typo changes up to SHINGLE_SIZE shingles, and candidates
+    # are re-scored with fuzz.ratio anyway
+    LSH_JACCARD_THRESHOLD = 0.5
+    
+    # Similarity matrix rows scored per cdist call in deduplicate_batch();
+    # bounds its memory at BATCH_ROWS x N bytes
+    BATCH_ROWS = 1024
+    
+    def __init__(
+        self,
+        name_similarity_threshold: float = 0.85,
+        trust_domain_uniqueness: bool = False
+    ):
         """
         Initialize deduplicator.
         
         Args:
             name_similarity_threshold: Threshold for fuzzy name matching (0-1)
+            trust_domain_uniqueness: Keep companies with a not-yet-seen domain
+                without comparing their names (similar names on different
+                domains are then treated as different companies)
         """
         self.name_similarity_threshold = name_similarity_threshold
+        self.trust_domain_uniqueness = trust_domain_uniqueness
         logger.info(f"Initialized CompanyDeduplicator (threshold={name_similarity_threshold})")
     
     def deduplicate(self, companies: List[Company]) -> List[Company]:
@@ -49,45 +112,65 @@ class CompanyDeduplicator:
         
         logger.info(f"Deduplicating {len(companies)} companies")
         
+        lsh_index, empty_minhash = None, None
+        if len(companies) >= self.LSH_MIN_COMPANIES:
+            lsh_index, empty_minhash = self._create_lsh_index()
+        
         unique_companies = []
         seen_domains: Set[str] = set()
         seen_names: List[str] = []
+        seen_by_block: Dict[str, List[str]] = {}
         
         for company in companies:
-            # Extract domain
-            domain = None
-            if company.domain:
-                domain = company.domain.lower()
-            elif company.website:
-                domain = extract_domain(str(company.website))
-            
-            # Check domain-based deduplication
+            # Check domain-based deduplication first; duplicates caught here
+            # never have their name cleaned
+            domain = self._company_domain(company)
             if domain and domain in seen_domains:
-                logger.debug(f"Duplicate domain: {domain} ({company.name})")
+                logger.debug("Duplicate domain: %s (%s)", domain, company.name)
                 continue
             
-            # Check name-based deduplication
+            # Check name-based deduplication (the 1-vs-all scan runs in C++);
+            # clean_company_name() is memoized, so repeated names are free
             clean_name = clean_company_name(company.name).lower()
-            is_duplicate = False
+            if lsh_index is not None:
+                minhash = empty_minhash.copy()
+                minhash.update_batch(self._shingles(clean_name))
+                candidates = [seen_names[key] for key in lsh_index.query(minhash)]
+            else:
+                block_keys = self._block_keys(clean_name)
+                candidates = [
+                    seen_name
+                    for key in block_keys
+                    for seen_name in seen_by_block.get(key, ())
+                ]
             
-            for seen_name in seen_names:
-                similarity = self._calculate_similarity(clean_name, seen_name)
-                if similarity >= self.name_similarity_threshold:
-                    logger.debug(
-                        f"Duplicate name: {company.name} ~ {seen_name} "
-                        f"(similarity: {similarity:.2f})"
-                    )
-                    is_duplicate = True
-                    break
+            match = None
+            if not (domain and self.trust_domain_uniqueness):
+                match = process.extractOne(
+                    clean_name,
+                    candidates,
+                    scorer=fuzz.ratio,
+                    score_cutoff=self.name_similarity_threshold * 100
+                )
             
-            if is_duplicate:
+            if match:
+                seen_name, similarity, _ = match
+                logger.debug(
+                    "Duplicate name: %s ~ %s (similarity: %.2f)",
+                    company.name, seen_name, similarity / 100
+                )
                 continue
             
             # Add to unique companies
             unique_companies.append(company)
             if domain:
                 seen_domains.add(domain)
-            seen_names.append(clean_name)
+            if lsh_index is not None:
+                lsh_index.insert(len(seen_names), minhash)
+                seen_names.append(clean_name)
+            else:
+                for key in block_keys:
+                    seen_by_block.setdefault(key, []).append(clean_name)
         
         logger.info(
             f"Deduplication complete: {len(unique_companies)}/{len(companies)} unique companies "
@@ -96,33 +179,223 @@ class CompanyDeduplicator:
         
         return unique_companies
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
+    def deduplicate_batch(self, companies: List[Company]) -> List[Company]:
         """
-        Calculate similarity between two strings.
+        Deduplicate companies as one batch by clustering similar ones.
+        
+        Unlike deduplicate(), which keeps a company unless it matches one
+        already kept, this scores every pair of names with RapidFuzz's
+        multithreaded cdist (upper triangle only) and groups companies
+        transitively: A ~ B and B ~ C puts all three together, as do
+        shared domains. The first company of each group is kept.
         
         Args:
-            str1: First string
-            str2: Second string
+            companies: List of companies
         
         Returns:
-            Similarity score (0-1)
+            Deduplicated list, in original order
         """
-        return SequenceMatcher(None, str1, str2).ratio()
+        if not companies:
+            return []
+        
+        logger.info(f"Batch deduplicating {len(companies)} companies")
+        
+        clusters = self._union_domains(companies)
+        names = [clean_company_name(company.name).lower() for company in companies]
+        for start in range(0, len(names), self.BATCH_ROWS):
+            # Scores below the cutoff come back as 0
+            scores = process.cdist(
+                names[start:start + self.BATCH_ROWS],
+                names[start:],
+                scorer=fuzz.ratio,
+                score_cutoff=self.name_similarity_threshold * 100,
+                dtype=np.uint8,
+                workers=-1
+            )
+            rows, cols = np.nonzero(scores)
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                clusters.union(start + row, start + col)
+        
+        unique_companies = [companies[group[0]] for group in clusters.groups()]
+        
+        logger.info(
+            f"Batch deduplication complete: {len(unique_companies)}/{len(companies)} unique companies "
+            f"({len(companies) - len(unique_companies)} duplicates removed)"
+        )
+        
+        return unique_companies
+    
+    def group_duplicates(self, companies: List[Company]) -> List[List[Company]]:
+        """
+        Group companies that are duplicates of each other.
+        
+        Every pair of names the blocks (or the MinHash LSH index, on large
+        batches) propose is scored, and pairs above the threshold are
+        joined with a union-find, together with companies sharing a
+        domain. Unlike deduplicate() the grouping does not depend on which
+        company came first.
+        
+        Args:
+            companies: List of companies
+        
+        Returns:
+            Groups of companies, each in original order, ordered by their
+            first company
+        """
+        clusters = self._union_domains(companies)
+        
+        lsh_index, empty_minhash = None, None
+        if len(companies) >= self.LSH_MIN_COMPANIES:
+            lsh_index, empty_minhash = self._create_lsh_index()
+        
+        names: List[str] = []
+        by_block: Dict[str, List[int]] = {}
+        
+        for i, company in enumerate(companies):
+            clean_name = clean_company_name(company.name).lower()
+            names.append(clean_name)
+            
+            if lsh_index is not None:
+                minhash = empty_minhash.copy()
+                minhash.update_batch(self._shingles(clean_name))
+                candidates = lsh_index.query(minhash)
+                lsh_index.insert(i, minhash)
+            else:
+                block_keys = self._block_keys(clean_name)
+                candidates = list({j for key in block_keys for j in by_block.get(key, ())})
+                for key in block_keys:
+                    by_block.setdefault(key, []).append(i)
+            
+            matches = process.extract(
+                clean_name,
+                [names[j] for j in candidates],
+                scorer=fuzz.ratio,
+                score_cutoff=self.name_similarity_threshold * 100,
+                limit=None
+            )
+            for _, _, position in matches:
+                clusters.union(candidates[position], i)
+        
+        return [[companies[i] for i in group] for group in clusters.groups()]
+    
+    def _union_domains(self, companies: List[Company]) -> _UnionFind:
+        """Union-find over company indices with shared domains joined."""
+        clusters = _UnionFind(len(companies))
+        first_by_domain: Dict[str, int] = {}
+        for i, company in enumerate(companies):
+            domain = self._company_domain(company)
+            if domain:
+                clusters.union(first_by_domain.setdefault(domain, i), i)
+        return clusters
+    
+    @staticmethod
+    def _company_domain(company: Company) -> Optional[str]:
+        """Lowercased domain of a company, falling back to its website."""
+        if company.domain:
+            return company.domain.lower()
+        if company.website:
+            return extract_domain(str(company.website))
+        return None
+    
+    def _block_keys(self, clean_name: str) -> Set[str]:
+        """
+        Blocking keys for a cleaned name: its prefix and its first word.
+        
+        Args:
+            clean_name: Cleaned, lowercased company name
+        
+        Returns:
+            Set of block keys
+        """
+        keys = {clean_name[:self.BLOCK_PREFIX_LENGTH]}
+        words = clean_name.split(maxsplit=1)
+        if words:
+            keys.add(words[0])
+        return keys
+    
+    def _create_lsh_index(self) -> tuple:
+        """
+        Create an empty MinHash LSH index and an empty MinHash.
+        
+        datasketch is optional; without it every batch uses blocking.
+        Copying the empty MinHash reuses its hash permutations, which
+        are most of the cost of creating one.
+        
+        Returns:
+            (index, empty_minhash), or (None, None) if datasketch is unavailable
+        """
+        try:
+            from datasketch import MinHash, MinHashLSH
+        except ImportError:
+            logger.debug("datasketch not installed, using blocked name matching")
+            return None, None
+        
+        index = MinHashLSH(threshold=self.LSH_JACCARD_THRESHOLD, num_perm=self.LSH_NUM_PERM)
+        return index, MinHash(num_perm=self.LSH_NUM_PERM)
+    
+    def _shingles(self, clean_name: str) -> Set[bytes]:
+        """Character SHINGLE_SIZE-grams of a name (the name itself if shorter)."""
+        size = self.SHINGLE_SIZE
+        return {
+            clean_name[i:i + size].encode()
+            for i in range(max(len(clean_name) - size + 1, 1))
+        }
     
     def merge_duplicates(self, companies: List[Company]) -> List[Company]:
         """
         Merge duplicate companies instead of removing them.
         Combines data from duplicates into a single record.
         
+        Each group from group_duplicates() becomes a copy of its richest
+        record (most non-empty export fields), with fields it lacks taken
+        from the other records in order.
+        
         Args:
             companies: List of companies
         
         Returns:
             List with merged companies
         """
-        # TODO: Implement merging logic
-        # For now, just deduplicate
-        return self.deduplicate(companies)
+        if not companies:
+            return []
+        
+        merged = []
+        for group in self.group_duplicates(companies):
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            
+            representative = max(group, key=self._richness)
+            company = representative.model_copy(deep=True)
+            for other in group:
+                if other is representative:
+                    continue
+                self._fill_missing(company, other)
+                if company.enrichment and other.enrichment:
+                    self._fill_missing(company.enrichment, other.enrichment)
+                company.extra_data = {**other.extra_data, **company.extra_data}
+            merged.append(company)
+        
+        logger.info(
+            f"Merge complete: {len(merged)}/{len(companies)} companies "
+            f"({len(companies) - len(merged)} duplicates merged)"
+        )
+        
+        return merged
+    
+    @staticmethod
+    def _richness(company: Company) -> int:
+        """Number of non-empty export fields of a company."""
+        return sum(value is not None for value in company.to_flat_dict().values())
+    
+    @staticmethod
+    def _fill_missing(target, source):
+        """Copy fields that are None on target (a pydantic model) from source."""
+        for field in type(target).model_fields:
+            if getattr(target, field) is None:
+                value = getattr(source, field)
+                if value is not None:
+                    setattr(target, field, copy.deepcopy(value))
 
 
 if __name__ == "__main__":
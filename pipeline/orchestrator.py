@@ -6,7 +6,9 @@ Coordinates scraping, enrichment, scoring, and export.
 """
 
 import time
-from typing import List, Optional, Dict, Any
+import asyncio
+import inspect
+from typing import List, Optional, Dict, Any, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
@@ -15,6 +17,8 @@ from utils.logger import get_logger
 from config import settings
 from pipeline.deduplication import CompanyDeduplicator
 from pipeline.output import DataExporter
+from enrichment.pipeline import enrich_companies
+from utils.http_client import aclose_async_http_client
 
 logger = get_logger(__name__)
 
@@ -36,7 +40,8 @@ class PipelineOrchestrator:
         enable_enrichment: bool = True,
         enable_scoring: bool = True,
         enable_deduplication: bool = True,
-        max_workers: int = 3
+        max_workers: int = 3,
+        enrichment_workers: int = 16
     ):
         """
         Initialize pipeline orchestrator.
@@ -46,11 +51,15 @@ class PipelineOrchestrator:
             enable_scoring: Enable lead scoring
             enable_deduplication: Enable deduplication
             max_workers: Maximum parallel workers for scraping
+            enrichment_workers: Maximum companies enriched at once, and threads
+                for sync-only enrichers (enrichment waits on the network, so
+                it tolerates more concurrency than scraping)
         """
         self.enable_enrichment = enable_enrichment
         self.enable_scoring = enable_scoring
         self.enable_deduplication = enable_deduplication
         self.max_workers = max_workers
+        self.enrichment_workers = enrichment_workers
         
         logger.info(
             f"Initialized PipelineOrchestrator "
@@ -137,6 +146,9 @@ class PipelineOrchestrator:
         """
         Scrape from all sources in parallel.
         
+        Scrapers with an async scrape method run together on one event
+        loop in this thread; the rest run in a thread pool meanwhile.
+        
         Args:
             scrapers: List of scraper instances
             configs: List of configuration dicts
@@ -146,32 +158,32 @@ class PipelineOrchestrator:
         """
         all_companies = []
         
-        # Use ThreadPoolExecutor for parallel scraping
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit scraping tasks
-            future_to_scraper = {
-                executor.submit(scraper.scrape, **config): scraper
-                for scraper, config in zip(scrapers, configs)
-            }
-            
-            # Collect results with progress bar
-            with tqdm(total=len(scrapers), desc="Scraping sources") as pbar:
+        async_jobs = []
+        sync_jobs = []
+        for scraper, config in zip(scrapers, configs):
+            scrape_async = self._async_scrape_method(scraper)
+            if scrape_async:
+                async_jobs.append((scraper, scrape_async, config))
+            else:
+                sync_jobs.append((scraper, config))
+        
+        with tqdm(total=len(scrapers), desc="Scraping sources") as pbar:
+            # Use ThreadPoolExecutor for parallel scraping
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Submit scraping tasks
+                future_to_scraper = {
+                    executor.submit(scraper.scrape, **config): scraper
+                    for scraper, config in sync_jobs
+                }
+                
+                if async_jobs:
+                    asyncio.run(self._scrape_async_sources(async_jobs, all_companies, pbar))
+                
+                # Collect results with progress bar
                 for future in as_completed(future_to_scraper):
                     scraper = future_to_scraper[future]
                     try:
-                        result: ScrapingResult = future.result()
-                        
-                        if result.success:
-                            all_companies.extend(result.companies)
-                            logger.info(
-                                f"{scraper.__class__.__name__}: "
-                                f"{result.total_scraped} companies in {result.execution_time:.2f}s"
-                            )
-                        else:
-                            logger.error(
-                                f"{scraper.__class__.__name__} failed: {result.errors}"
-                            )
-                    
+                        self._collect_result(scraper, future.result(), all_companies)
                     except Exception as e:
                         logger.exception(
                             f"Error scraping with {scraper.__class__.__name__}: {e}"
@@ -181,6 +193,57 @@ class PipelineOrchestrator:
         
         return all_companies
     
+    async def _scrape_async_sources(
+        self,
+        jobs: List[tuple],
+        all_companies: List[Company],
+        pbar: tqdm
+    ):
+        """
+        Run async scrapers concurrently, at most max_workers at a time.
+        
+        Args:
+            jobs: (scraper, async scrape method, config) tuples
+            all_companies: List the scraped companies are added to
+            pbar: Progress bar advanced as each scraper finishes
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def scrape_one(scraper: Any, scrape_async: Callable, config: Dict[str, Any]):
+            async with semaphore:
+                try:
+                    self._collect_result(scraper, await scrape_async(**config), all_companies)
+                except Exception as e:
+                    logger.exception(
+                        f"Error scraping with {scraper.__class__.__name__}: {e}"
+                    )
+            pbar.update(1)
+        
+        await asyncio.gather(*(scrape_one(*job) for job in jobs))
+    
+    @staticmethod
+    def _async_scrape_method(scraper: Any) -> Optional[Callable]:
+        """The scraper's coroutine scrape method (scrape or scrape_async), if any."""
+        for name in ('scrape', 'scrape_async'):
+            method = getattr(scraper, name, None)
+            if inspect.iscoroutinefunction(method):
+                return method
+        return None
+    
+    @staticmethod
+    def _collect_result(scraper: Any, result: ScrapingResult, all_companies: List[Company]):
+        """Add a scraper's companies to the combined list, or log its failure."""
+        if result.success:
+            all_companies.extend(result.companies)
+            logger.info(
+                f"{scraper.__class__.__name__}: "
+                f"{result.total_scraped} companies in {result.execution_time:.2f}s"
+            )
+        else:
+            logger.error(
+                f"{scraper.__class__.__name__} failed: {result.errors}"
+            )
+    
     def _deduplicate(self, companies: List[Company]) -> List[Company]:
         """
         Deduplicate companies based on domain and name.
@@ -204,6 +267,9 @@ class PipelineOrchestrator:
         """
         Enrich all companies with all enrichers.
         
+        Companies, and independent enrichers for each company, are
+        processed concurrently (see enrichment.pipeline).
+        
         Args:
             companies: List of companies
             enrichers: List of enricher instances
@@ -211,19 +277,29 @@ class PipelineOrchestrator:
         Returns:
             Enriched companies
         """
-        with tqdm(total=len(companies) * len(enrichers), desc="Enriching companies") as pbar:
-            for enricher in enrichers:
-                logger.info(f"Enriching with {enricher.__class__.__name__}")
-                
-                for company in companies:
-                    try:
-                        enricher.enrich_company(company)
-                    except Exception as e:
-                        logger.error(
-                            f"Error enriching {company.name} with "
-                            f"{enricher.__class__.__name__}: {e}"
-                        )
-                    pbar.update(1)
+        logger.info(
+            f"Enriching with {', '.join(e.__class__.__name__ for e in enrichers)}"
+        )
+        
+        async def run_enrichers(pbar: tqdm):
+            # Size the pool sync-only enrichers run in to match the
+            # concurrency, instead of the default min(32, cpus + 4)
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=self.enrichment_workers)
+            )
+            try:
+                await enrich_companies(
+                    companies,
+                    enrichers,
+                    concurrency=self.enrichment_workers,
+                    on_company_done=lambda company: pbar.update(1)
+                )
+            finally:
+                # The loop ends with asyncio.run(); close its pooled connections first
+                await aclose_async_http_client()
+        
+        with tqdm(total=len(companies), desc="Enriching companies") as pbar:
+            asyncio.run(run_enrichers(pbar))
         
         return companies
 
@@ -4,10 +4,12 @@
 Export data to various formats: CSV, JSON, Excel, Parquet.
 """
 
-import json
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Dict
 from datetime import datetime
 
 from models.schemas import Company
@@ -16,6 +18,23 @@ from config import settings
 
 logger = get_logger(__name__)
 
+# Parquet types for the flat columns that are not strings, so a column has
+# the same type in every export even when all of its values are missing
+PARQUET_COLUMN_TYPES = {
+    "employee_count": pa.int64(),
+    "founded_year": pa.int64(),
+    "total_funding": pa.float64(),
+    "open_positions": pa.int64(),
+    "is_hiring": pa.bool_(),
+    "total_score": pa.float64(),
+    # Low-cardinality labels, read back as pandas categoricals
+    "source": pa.dictionary(pa.int32(), pa.string()),
+    "company_size": pa.dictionary(pa.int32(), pa.string()),
+    "country": pa.dictionary(pa.int32(), pa.string()),
+    "funding_stage": pa.dictionary(pa.int32(), pa.string()),
+    "priority": pa.dictionary(pa.int32(), pa.string()),
+}
+
 
 class DataExporter:
     """
@@ -24,6 +43,7 @@ class DataExporter:
     Supported formats:
     - CSV: Simple tabular format
     - JSON: Nested structure with full data
+    - JSONL: One nested JSON record per line
     - Excel: Multiple sheets with formatting
     - Parquet: Efficient columnar format
     """
@@ -38,6 +58,10 @@ class DataExporter:
         self.output_dir = output_dir or settings.output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # (companies list, flat columns) while export_many() runs; None otherwise
+        self._columns_cache: Optional[tuple] = None
+        self._reuse_columns = False
+        
         logger.info(f"Initialized DataExporter (output_dir={self.output_dir})")
     
     def export(
@@ -51,15 +75,39 @@ class DataExporter:
         
         Args:
             companies: List of companies to export
-            format: Output format (csv, json, excel, parquet)
+            format: Output format (csv, json, jsonl, excel, parquet)
             filename: Custom filename (optional)
         
         Returns:
             Path to exported file
         """
+        paths = self.export_many(companies, [format], filename)
+        return paths[0] if paths else None
+    
+    def export_many(
+        self,
+        companies: List[Company],
+        formats: List[str],
+        filename: Optional[str] = None
+    ) -> List[Path]:
+        """
+        Export companies to several formats.
+        
+        The companies are converted to flat columns once and reused by every
+        tabular format in this call. Nothing is kept afterwards, since the
+        companies may be re-sorted or re-scored before the next export.
+        
+        Args:
+            companies: List of companies to export
+            formats: Output formats (csv, json, jsonl, excel, parquet)
+            filename: Custom filename (optional)
+        
+        Returns:
+            Paths to exported files, one per format
+        """
         if not companies:
             logger.warning("No companies to export")
-            return None
+            return []
         
         # Generate filename if not provided
         if not filename:
@@ -69,13 +117,23 @@ class DataExporter:
         # Remove extension if provided
         filename = Path(filename).stem
         
-        # Export based on format
+        self._reuse_columns = True
+        try:
+            return [self._export_format(companies, format, filename) for format in formats]
+        finally:
+            self._reuse_columns = False
+            self._columns_cache = None
+    
+    def _export_format(self, companies: List[Company], format: str, filename: str) -> Path:
+        """Export companies to one format."""
         format = format.lower()
         
         if format == "csv":
             return self.export_csv(companies, filename)
         elif format == "json":
             return self.export_json(companies, filename)
+        elif format == "jsonl":
+            return self.export_jsonl(companies, filename)
         elif format == "excel":
             return self.export_excel(companies, filename)
         elif format == "parquet":
@@ -89,32 +147,71 @@ class DataExporter:
         
         logger.info(f"Exporting {len(companies)} companies to CSV: {filepath}")
         
-        # Convert to flat dictionaries
-        data = [company.to_flat_dict() for company in companies]
+        # Convert to flat columns
+        columns = self._flat_columns(companies)
         
-        # Create DataFrame and export
-        df = pd.DataFrame(data)
+        # Build the DataFrame from columns rather than one dict per row;
+        # pandas writes the same bytes either way
+        df = pd.DataFrame(columns)
         df.to_csv(filepath, index=False, encoding='utf-8')
         
         logger.info(f"CSV export completed: {filepath}")
         return filepath
     
+    def _flat_columns(self, companies: List[Company]) -> Dict[str, list]:
+        """
+        Flat export columns for companies.
+        
+        Within export_many() the columns of the list being exported are
+        cached, so each format after the first reuses them.
+        
+        Args:
+            companies: Companies to convert
+        
+        Returns:
+            Dictionary mapping each column name to one value per company
+        """
+        if self._columns_cache is not None and self._columns_cache[0] is companies:
+            return self._columns_cache[1]
+        
+        columns = Company.to_flat_columns(companies)
+        if self._reuse_columns:
+            self._columns_cache = (companies, columns)
+        return columns
+    
     def export_json(self, companies: List[Company], filename: str) -> Path:
         """Export to JSON format."""
         filepath = self.output_dir / f"{filename}.json"
         
         logger.info(f"Exporting {len(companies)} companies to JSON: {filepath}")
         
-        # Convert to dictionaries
-        data = [company.to_dict() for company in companies]
-        
-        # Write JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write the array one record at a time (orjson emits UTF-8 bytes
+        # directly); nesting each record by one level gives the same bytes
+        # as dumping the whole list, without holding every dict at once
+        with open(filepath, 'wb') as f:
+            f.write(b"[")
+            for i, company in enumerate(companies):
+                record = orjson.dumps(company.to_dict(), option=orjson.OPT_INDENT_2)
+                f.write(b",\n  " if i else b"\n  ")
+                f.write(record.replace(b"\n", b"\n  "))
+            f.write(b"\n]")
         
         logger.info(f"JSON export completed: {filepath}")
         return filepath
     
+    def export_jsonl(self, companies: List[Company], filename: str) -> Path:
+        """Export to newline-delimited JSON, one company per line."""
+        filepath = self.output_dir / f"{filename}.jsonl"
+        
+        logger.info(f"Exporting {len(companies)} companies to JSONL: {filepath}")
+        
+        with open(filepath, 'wb') as f:
+            for company in companies:
+                f.write(orjson.dumps(company.to_dict(), option=orjson.OPT_APPEND_NEWLINE))
+        
+        logger.info(f"JSONL export completed: {filepath}")
+        return filepath
+    
     def export_excel(self, companies: List[Company], filename: str) -> Path:
         """Export to Excel format with multiple sheets."""
         filepath = self.output_dir / f"{filename}.xlsx"
@@ -123,17 +220,17 @@ class DataExporter:
         
         with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
             # Main sheet with all data
-            data = [company.to_flat_dict() for company in companies]
-            df_main = pd.DataFrame(data)
+            df_main = pd.DataFrame(self._flat_columns(companies))
             df_main.to_excel(writer, sheet_name='Companies', index=False)
             
+            # The other sheets are views of the main frame; a column is
+            # missing when no company has that data, so add it empty
+            flags = df_main.reindex(columns=['priority', 'is_hiring', 'technologies', 'funding_stage'])
+            priority_counts = flags['priority'].value_counts()
+            
             # High priority sheet
-            high_priority = [
-                c.to_flat_dict() for c in companies
-                if c.score and c.score.priority == 'high'
-            ]
-            if high_priority:
-                df_high = pd.DataFrame(high_priority)
+            df_high = df_main[flags['priority'] == 'high']
+            if not df_high.empty:
                 df_high.to_excel(writer, sheet_name='High Priority', index=False)
             
             # Summary sheet
@@ -149,12 +246,12 @@ class DataExporter:
                 ],
                 'Count': [
                     len(companies),
-                    len([c for c in companies if c.score and c.score.priority == 'high']),
-                    len([c for c in companies if c.score and c.score.priority == 'medium']),
-                    len([c for c in companies if c.score and c.score.priority == 'low']),
-                    len([c for c in companies if c.enrichment and c.enrichment.hiring_intent and c.enrichment.hiring_intent.is_hiring]),
-                    len([c for c in companies if c.enrichment and c.enrichment.tech_stack]),
-                    len([c for c in companies if c.enrichment and c.enrichment.funding_info])
+                    int(priority_counts.get('high', 0)),
+                    int(priority_counts.get('medium', 0)),
+                    int(priority_counts.get('low', 0)),
+                    int(flags['is_hiring'].eq(True).sum()),
+                    int(flags['technologies'].notna().sum()),
+                    int(flags['funding_stage'].notna().sum())
                 ]
             }
             df_summary = pd.DataFrame(summary_data)
@@ -169,12 +266,21 @@ class DataExporter:
         
         logger.info(f"Exporting {len(companies)} companies to Parquet: {filepath}")
         
-        # Convert to flat dictionaries
-        data = [company.to_flat_dict() for company in companies]
+        # Convert to flat columns
+        columns = self._flat_columns(companies)
         
-        # Create DataFrame and export
-        df = pd.DataFrame(data)
-        df.to_parquet(filepath, index=False, engine='pyarrow')
+        # Write the Arrow table directly; pandas only for columns Arrow
+        # cannot type. zstd and dictionary encoding keep repeated values
+        # like source and country small
+        schema = pa.schema([
+            (name, PARQUET_COLUMN_TYPES.get(name, pa.string())) for name in columns
+        ])
+        try:
+            pq.write_table(pa.table(columns, schema=schema), filepath, compression='zstd')
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.debug(f"Falling back to pandas for Parquet export: {e}")
+            df = pd.DataFrame(columns)
+            df.to_parquet(filepath, index=False, engine='pyarrow')
         
         logger.info(f"Parquet export completed: {filepath}")
         return filepath
@@ -5,12 +5,45 @@ Configurable lead scoring engine for prioritizing companies.
 Scores based on multiple factors: hiring intent, tech stack, funding, size, etc.
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+import numpy as np
+
 from models.schemas import Company, LeadScore, CompanySize, FundingStage
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fit score by company size (prefer growing startups and scale-ups)
+SIZE_SCORES = {
+    CompanySize.STARTUP: 70.0,
+    CompanySize.SMALL: 80.0,
+    CompanySize.MEDIUM: 90.0,
+    CompanySize.LARGE: 70.0,
+    CompanySize.ENTERPRISE: 50.0,
+    CompanySize.UNKNOWN: 40.0,
+}
+
+# Fit score by funding stage (prefer funded companies)
+FUNDING_SCORES = {
+    FundingStage.SEED: 60.0,
+    FundingStage.SERIES_A: 80.0,
+    FundingStage.SERIES_B: 90.0,
+    FundingStage.SERIES_C: 85.0,
+    FundingStage.SERIES_D_PLUS: 75.0,
+}
+
+# Lower-cased, matched case-insensitively against whole technology names
+# (TechStackDetector reports e.g. "Mongodb", "Postgresql")
+MODERN_FRAMEWORKS = frozenset({'react', 'vue', 'angular', 'svelte', 'next.js'})
+MODERN_DATABASES = frozenset({'mongodb', 'postgresql', 'redis'})
+
+# Points per flag in score_batch(), in the order _batch_signals() emits them:
+# has technologies, modern framework, cloud, modern database, analytics
+TECH_POINTS = np.array([40.0, 20.0, 15.0, 15.0, 10.0])
+# has website/domain, description, LinkedIn, Twitter, GitHub, Crunchbase
+ENGAGEMENT_POINTS = np.array([30.0, 20.0, 15.0, 10.0, 15.0, 10.0])
+
 
 class LeadScorer:
     """
@@ -24,6 +57,8 @@ class LeadScorer:
     - Engagement signals (website activity, social presence)
     """
     
+    __slots__ = ('weights',)
+    
     # Default scoring weights (0-1, must sum to 1.0)
     DEFAULT_WEIGHTS = {
         'intent': 0.35,      # Hiring intent and growth signals
@@ -76,15 +111,18 @@ class LeadScorer:
         # Determine priority
         priority = self._determine_priority(total_score)
         
-        lead_score = LeadScore(
-            total_score=total_score,
-            intent_score=intent_score,
-            fit_score=fit_score,
-            engagement_score=engagement_score,
+        # Every component is capped to 0-100 and the priority comes from
+        # _determine_priority(), so only the rounding that LeadScore's
+        # validators would apply is needed; model_construct() skips the rest
+        lead_score = LeadScore.model_construct(
+            total_score=round(total_score, 2),
+            intent_score=round(intent_score, 2),
+            fit_score=round(fit_score, 2),
+            engagement_score=round(engagement_score, 2),
             priority=priority
         )
         
-        logger.debug(f"Scored {company.name}: {total_score:.2f} ({priority})")
+        logger.debug("Scored %s: %.2f (%s)", company.name, total_score, priority)
         
         return lead_score
     
@@ -125,26 +163,11 @@ class LeadScorer:
         enrichment = company.enrichment
         
         # Company size (prefer growing startups and scale-ups)
-        size_scores = {
-            CompanySize.STARTUP: 70.0,
-            CompanySize.SMALL: 80.0,
-            CompanySize.MEDIUM: 90.0,
-            CompanySize.LARGE: 70.0,
-            CompanySize.ENTERPRISE: 50.0,
-            CompanySize.UNKNOWN: 40.0,
-        }
-        score = size_scores.get(enrichment.company_size, 50.0)
+        score = SIZE_SCORES.get(enrichment.company_size, 50.0)
         
         # Funding stage (prefer funded companies)
         if enrichment.funding_info:
-            funding_scores = {
-                FundingStage.SEED: 60.0,
-                FundingStage.SERIES_A: 80.0,
-                FundingStage.SERIES_B: 90.0,
-                FundingStage.SERIES_C: 85.0,
-                FundingStage.SERIES_D_PLUS: 75.0,
-            }
-            funding_score = funding_scores.get(enrichment.funding_info.stage, 0)
+            funding_score = FUNDING_SCORES.get(enrichment.funding_info.stage, 0)
             score = (score + funding_score) / 2
         
         # Employee count (prefer 20-500 employees)
@@ -171,8 +194,7 @@ class LeadScorer:
             score = 40.0
         
         # Modern frameworks (React, Vue, Angular, etc.)
-        modern_frameworks = ['React', 'Vue', 'Angular', 'Svelte', 'Next.js']
-        if any(tech in str(tech_stack.frameworks) for tech in modern_frameworks):
+        if not MODERN_FRAMEWORKS.isdisjoint(map(str.lower, tech_stack.frameworks)):
             score += 20.0
         
         # Cloud infrastructure
@@ -180,8 +202,7 @@ class LeadScorer:
             score += 15.0
         
         # Modern databases
-        modern_dbs = ['MongoDB', 'PostgreSQL', 'Redis']
-        if any(db in str(tech_stack.databases) for db in modern_dbs):
+        if not MODERN_DATABASES.isdisjoint(map(str.lower, tech_stack.databases)):
             score += 15.0
         
         # Analytics tools (shows data-driven culture)
@@ -192,30 +213,23 @@ class LeadScorer:
     
     def _calculate_engagement_score(self, company: Company) -> float:
         """Calculate engagement score based on online presence."""
-        score = 0.0
-        
-        # Has website
-        if company.website or company.domain:
-            score += 30.0
-        
-        # Has description
-        if company.description:
-            score += 20.0
+        enrichment = company.enrichment
+        profiles = enrichment.social_profiles if enrichment else None
         
-        if not company.enrichment:
-            return score
+        # Website and description
+        score = (
+            (30.0 if company.website or company.domain else 0.0) +
+            (20.0 if company.description else 0.0)
+        )
         
         # Social profiles
-        if company.enrichment.social_profiles:
-            profiles = company.enrichment.social_profiles
-            if profiles.linkedin:
-                score += 15.0
-            if profiles.twitter:
-                score += 10.0
-            if profiles.github:
-                score += 15.0
-            if profiles.crunchbase:
-                score += 10.0
+        if profiles:
+            score += (
+                (15.0 if profiles.linkedin else 0.0) +
+                (10.0 if profiles.twitter else 0.0) +
+                (15.0 if profiles.github else 0.0) +
+                (10.0 if profiles.crunchbase else 0.0)
+            )
         
         return min(score, 100.0)
     
@@ -236,6 +250,127 @@ class LeadScorer:
         else:
             return 'low'
     
+    def score_batch(self, companies: List[Company]) -> List[LeadScore]:
+        """
+        Vectorized score() over many companies.
+        
+        Each company's signals are read in one pass into a NumPy matrix
+        (one column per signal), and the four component scores are then
+        computed column-wise, instead of four method calls per company.
+        Results equal score() exactly.
+        
+        Args:
+            companies: Companies to score
+        
+        Returns:
+            LeadScore objects, one per company
+        """
+        if not companies:
+            return []
+        
+        signals = np.array(
+            [self._batch_signals(company) for company in companies], dtype=np.float64
+        )
+        
+        (is_hiring, open_positions, recent_postings, velocity,
+         size_score, funding_score, employee_count) = signals[:, :7].T
+        tech_flags = signals[:, 7:12]
+        engagement_flags = signals[:, 12:]
+        
+        # Negative counts add nothing, as in _calculate_intent_score()
+        intent = np.minimum(
+            30.0 * is_hiring
+            + np.clip(open_positions * 5, 0.0, 30.0)
+            + np.clip(recent_postings * 10, 0.0, 20.0)
+            + np.clip(velocity * 5, 0.0, 20.0),
+            100.0
+        )
+        
+        # NaN funding score means no funding info
+        fit = np.where(np.isnan(funding_score), size_score, (size_score + funding_score) / 2)
+        fit += np.where(
+            (employee_count >= 20) & (employee_count <= 500), 10.0,
+            np.where((employee_count < 20) & (employee_count != 0), 5.0, 0.0)
+        )
+        fit = np.minimum(fit, 100.0)
+        
+        tech = np.minimum(tech_flags @ TECH_POINTS, 100.0)
+        engagement = np.minimum(engagement_flags @ ENGAGEMENT_POINTS, 100.0)
+        
+        # Same summation order as score(), so totals match bit for bit
+        total = (
+            intent * self.weights['intent'] +
+            fit * self.weights['fit'] +
+            tech * self.weights['tech'] +
+            engagement * self.weights['engagement']
+        )
+        
+        return [
+            LeadScore.model_construct(
+                total_score=round(total_score, 2),
+                intent_score=round(intent_score, 2),
+                fit_score=round(fit_score, 2),
+                engagement_score=round(engagement_score, 2),
+                priority=self._determine_priority(total_score)
+            )
+            for total_score, intent_score, fit_score, engagement_score in zip(
+                total.tolist(), intent.tolist(), fit.tolist(), engagement.tolist()
+            )
+        ]
+    
+    @staticmethod
+    def _batch_signals(company: Company) -> Tuple[float, ...]:
+        """
+        Row of raw scoring signals for score_batch().
+        
+        Order: is_hiring, open positions, recent postings, hiring velocity,
+        size score, funding score (NaN without funding info), employee
+        count, the five tech flags and the six engagement flags.
+        """
+        engagement = (
+            bool(company.website or company.domain),
+            bool(company.description),
+        )
+        
+        enrichment = company.enrichment
+        if not enrichment:
+            return (0, 0, 0, 0.0, 50.0, np.nan, 0,
+                    False, False, False, False, False) + engagement + (False,) * 4
+        
+        hiring = enrichment.hiring_intent
+        if hiring:
+            intent = (hiring.is_hiring, hiring.total_open_positions,
+                      hiring.recent_postings, hiring.hiring_velocity)
+        else:
+            intent = (0, 0, 0, 0.0)
+        
+        funding_score = np.nan
+        if enrichment.funding_info:
+            funding_score = FUNDING_SCORES.get(enrichment.funding_info.stage, 0)
+        fit = (SIZE_SCORES.get(enrichment.company_size, 50.0), funding_score,
+               enrichment.employee_count or 0)
+        
+        tech_stack = enrichment.tech_stack
+        if tech_stack:
+            tech = (
+                bool(tech_stack.all_technologies()),
+                not MODERN_FRAMEWORKS.isdisjoint(map(str.lower, tech_stack.frameworks)),
+                bool(tech_stack.cloud_providers),
+                not MODERN_DATABASES.isdisjoint(map(str.lower, tech_stack.databases)),
+                bool(tech_stack.analytics),
+            )
+        else:
+            tech = (False,) * 5
+        
+        profiles = enrichment.social_profiles
+        if profiles:
+            social = (bool(profiles.linkedin), bool(profiles.twitter),
+                      bool(profiles.github), bool(profiles.crunchbase))
+        else:
+            social = (False,) * 4
+        
+        return intent + fit + tech + engagement + social
+    
     def score_companies(self, companies: List[Company]) -> List[Company]:
         """
         Score multiple companies and add scores to their objects.
@@ -246,10 +381,10 @@ class LeadScorer:
         Returns:
             List of companies with scores
         """
-        logger.info(f"Scoring {len(companies)} companies")
+        logger.info("Scoring %s companies", len(companies))
         
-        for company in companies:
-            company.score = self.score(company)
+        for company, lead_score in zip(companies, self.score_batch(companies)):
+            company.score = lead_score
         
         # Sort by score (highest first)
         companies.sort(key=lambda c: c.score.total_score if c.score else 0, reverse=True)
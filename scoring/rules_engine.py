@@ -5,38 +5,127 @@ Custom logic engine for scoring rules.
 Allows defining complex "if this then that" logic for lead prioritization.
 """
 
-from typing import List, Dict, Callable
-from models.schemas import Company
+from typing import List, Dict, Callable, Optional
+
+import numpy as np
+
+from models.schemas import Company, GeographicInfo
+from utils.geo import normalize_country, US_COUNTRY_CODE
+
+# Feature arrays (one entry per company) -> boolean array
+VectorRule = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+
+def country_code(geo: Optional[GeographicInfo]) -> Optional[int]:
+    """Numeric country code of a location, normalizing it if enrichment has not."""
+    if not geo:
+        return None
+    if geo.country_code is not None:
+        return geo.country_code
+    return normalize_country(geo.country)
+
+
+def extract_features(companies: List[Company]) -> Dict[str, np.ndarray]:
+    """
+    Read the fields vector rules check into arrays, in one pass.
+    
+    Args:
+        companies: Companies to read
+    
+    Returns:
+        Dictionary of feature name -> array with one entry per company
+        (framework_count, open_positions, country_code; -1 if unknown)
+    """
+    framework_count = []
+    open_positions = []
+    country_codes = []
+    for company in companies:
+        enrichment = company.enrichment
+        tech_stack = enrichment.tech_stack if enrichment else None
+        hiring = enrichment.hiring_intent if enrichment else None
+        framework_count.append(len(tech_stack.frameworks) if tech_stack else 0)
+        open_positions.append(hiring.total_open_positions if hiring else 0)
+        code = country_code(enrichment.geographic_info if enrichment else None)
+        country_codes.append(-1 if code is None else code)
+    
+    return {
+        'framework_count': np.array(framework_count, dtype=np.int64),
+        'open_positions': np.array(open_positions, dtype=np.int64),
+        'country_code': np.array(country_codes, dtype=np.int64),
+    }
+
 
 class RulesEngine:
     """
     Apply custom business rules to companies.
+    
+    A rule can also be given a vector form, which apply_batch() evaluates
+    once over feature arrays of the whole batch instead of once per company.
     """
     
+    __slots__ = ('rules', 'vector_rules')
+    
     def __init__(self):
         self.rules: List[Callable[[Company], bool]] = []
-        
-    def add_rule(self, rule_func: Callable[[Company], bool]):
+        self.vector_rules: List[Optional[VectorRule]] = []
+    
+    def add_rule(self, rule_func: Callable[[Company], bool], vector_func: Optional[VectorRule] = None):
         self.rules.append(rule_func)
-        
+        self.vector_rules.append(vector_func)
+    
     def apply(self, company: Company) -> Dict[str, bool]:
         """Apply all rules and return results."""
         results = {}
         for i, rule in enumerate(self.rules):
             results[f"rule_{i}"] = rule(company)
         return results
+    
+    def apply_batch(self, companies: List[Company]) -> Dict[str, np.ndarray]:
+        """
+        Apply all rules to many companies.
+        
+        Rules with a vector form run once on extract_features(); the
+        others run per company.
+        
+        Args:
+            companies: Companies to check
+        
+        Returns:
+            Dictionary of rule name -> boolean array, one entry per company
+        """
+        features = extract_features(companies) if any(self.vector_rules) else None
+        
+        results = {}
+        for i, (rule, vector_rule) in enumerate(zip(self.rules, self.vector_rules)):
+            if vector_rule is not None:
+                results[f"rule_{i}"] = np.asarray(vector_rule(features), dtype=bool)
+            else:
+                results[f"rule_{i}"] = np.fromiter(
+                    (bool(rule(company)) for company in companies),
+                    dtype=bool, count=len(companies)
+                )
+        return results
 
 # Example Rule
 def is_high_value_target(company: Company) -> bool:
     """Example: Tech company hiring > 5 people in the US."""
     if not company.enrichment: 
         return False
-        
+    
     is_tech = bool(company.enrichment.tech_stack and company.enrichment.tech_stack.frameworks)
     hiring = company.enrichment.hiring_intent and company.enrichment.hiring_intent.total_open_positions > 5
     
     # Check geo
     geo = company.enrichment.geographic_info
-    in_us = geo and geo.country in ['USA', 'US', 'United States']
+    in_us = country_code(geo) == US_COUNTRY_CODE
     
     return is_tech and hiring and in_us
+
+
+def is_high_value_target_batch(features: Dict[str, np.ndarray]) -> np.ndarray:
+    """Vector form of is_high_value_target() over extract_features() arrays."""
+    return (
+        (features['framework_count'] > 0)
+        & (features['open_positions'] > 5)
+        & (features['country_code'] == US_COUNTRY_CODE)
+    )
@@ -2,4 +2,4 @@
 Utility package for OpenLead Intelligence framework.
 """
 
-__all__ = ["logger", "helpers"]
+__all__ = ["logger", "helpers", "http_client", "geo"]
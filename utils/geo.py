@@ -0,0 +1,83 @@
+# OpenLead Intelligence - Country Normalization
+
+"""
+Maps the country spellings scrapers and GeoIP produce (names, ISO 3166
+alpha-2/alpha-3 codes) to ISO 3166-1 numeric codes, so country checks
+compare integers instead of lists of strings.
+"""
+
+from typing import Optional
+
+# ISO 3166-1 numeric code -> (alpha-2 code, other spellings (upper-case)).
+# Scraped "City, ST" locations put US state codes (CA, DE, IN, IL, ...) where
+# the country goes, so alpha-2 codes are only trusted from ISO sources.
+_COUNTRY_SPELLINGS = {
+    840: ("US", ("USA", "UNITED STATES", "UNITED STATES OF AMERICA", "US")),
+    124: ("CA", ("CANADA", "CAN")),
+    826: ("GB", ("UK", "UNITED KINGDOM", "GREAT BRITAIN", "GBR")),
+    276: ("DE", ("GERMANY", "DEU")),
+    250: ("FR", ("FRANCE", "FRA")),
+    528: ("NL", ("NETHERLANDS", "NLD")),
+    724: ("ES", ("SPAIN", "ESP")),
+    380: ("IT", ("ITALY", "ITA")),
+    372: ("IE", ("IRELAND", "IRL")),
+    752: ("SE", ("SWEDEN", "SWE")),
+    616: ("PL", ("POLAND", "POL")),
+    756: ("CH", ("SWITZERLAND", "CHE")),
+    356: ("IN", ("INDIA", "IND")),
+    36: ("AU", ("AUSTRALIA", "AUS")),
+    702: ("SG", ("SINGAPORE", "SGP")),
+    376: ("IL", ("ISRAEL", "ISR")),
+    76: ("BR", ("BRAZIL", "BRA")),
+    392: ("JP", ("JAPAN", "JPN")),
+}
+
+# Normalized (upper-case) spelling -> numeric code, built once at import;
+# "US" and "UK" are kept as free-text spellings (neither is a US state)
+_COUNTRY_CODES = {
+    spelling: code
+    for code, (_, spellings) in _COUNTRY_SPELLINGS.items()
+    for spelling in spellings
+}
+
+# ISO alpha-2 code -> numeric code, for values known to be ISO codes
+_ALPHA2_CODES = {
+    alpha2: code
+    for code, (alpha2, _) in _COUNTRY_SPELLINGS.items()
+}
+
+US_COUNTRY_CODE = 840
+
+
+def normalize_country(country: Optional[str], iso_alpha2: bool = False) -> Optional[int]:
+    """
+    Convert a country name or ISO code to its ISO 3166-1 numeric code.
+    
+    Args:
+        country: Country as scraped (any case, surrounding spaces allowed)
+        iso_alpha2: Also accept ISO alpha-2 codes; only set this for values
+            from ISO sources (GeoIP iso_code, Crunchbase country_code), as
+            in scraped text a 2-letter code is usually a US state
+    
+    Returns:
+        Numeric country code, or None if the country is unknown
+    
+    Examples:
+        >>> normalize_country("United States")
+        840
+        >>> normalize_country("DE")  # Delaware, not Germany
+        >>> normalize_country("de", iso_alpha2=True)
+        276
+    """
+    if not country:
+        return None
+    key = country.strip().upper()
+    if iso_alpha2 and key in _ALPHA2_CODES:
+        return _ALPHA2_CODES[key]
+    return _COUNTRY_CODES.get(key)
+
+
+if __name__ == "__main__":
+    for country in ["USA", "united states", "GB", "Germany", "DE", "Atlantis"]:
+        print(f"{country!r} -> {normalize_country(country)}")
+    print(f"'DE' (ISO) -> {normalize_country('DE', iso_alpha2=True)}")
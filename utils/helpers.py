@@ -7,16 +7,53 @@ Includes URL validation, domain extraction, retry decorators, and data cleaning.
 
 import re
 import time
+import random
+import asyncio
 import validators
-from functools import wraps
-from typing import Optional, Callable, Any
+from functools import wraps, lru_cache
+from typing import Optional, Callable, Any, Iterator
 from urllib.parse import urlparse, urljoin
 import requests
+import pandas as pd
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Legal-entity suffixes stripped by clean_company_name(s), applied in order
+COMPANY_SUFFIXES = [
+    r'\s+Inc\.?$', r'\s+LLC\.?$', r'\s+Ltd\.?$', r'\s+Limited$',
+    r'\s+Corp\.?$', r'\s+Corporation$', r'\s+Co\.?$', r'\s+Company$',
+    r'\s+GmbH$', r'\s+S\.A\.?$', r'\s+AG$', r'\s+PLC$'
+]
 
+# Compiled once at import; names are cleaned per company on every run
+_COMPANY_SUFFIX_PATTERNS = [re.compile(suffix, re.IGNORECASE) for suffix in COMPANY_SUFFIXES]
+# Final words the suffix patterns can match (casefolded, trailing dots
+# dropped); names not ending in one skip the substitutions
+_COMPANY_SUFFIX_WORDS = frozenset({
+    'inc', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company',
+    'gmbh', 's.a', 'ag', 'plc'
+})
+_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\-.,!?()&]')
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Plain http(s) URLs: dotted hostname, unreserved-character path and
+# key=value query. validators.url() accepts all of these, so they skip
+# its checks
+_SIMPLE_URL_PATTERN = re.compile(
+    r'^https?://(?=[a-z0-9.-]{1,253}(?:[/?]|$))'
+    r'(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}'
+    r'(?:/[a-z0-9\-._~%/]*)?'
+    r'(?:\?[a-z0-9\-._~%]+=[a-z0-9\-._~%]*(?:&[a-z0-9\-._~%]+=[a-z0-9\-._~%]*)*)?\Z',
+    re.IGNORECASE
+)
+# Simple phone pattern (can be improved)
+_PHONE_PATTERN = re.compile(
+    r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}'
+)
+
+
+# Sized for a full run's distinct URLs; extract_domain.cache_clear() resets it
+@lru_cache(maxsize=65536)
 def extract_domain(url: str) -> Optional[str]:
     """
     Extract domain from URL.
@@ -50,10 +87,15 @@ def extract_domain(url: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=1024)
 def validate_url(url: str) -> bool:
     """
     Validate URL format.
     
+    Results are memoized since scrapers re-validate the same URLs, and
+    common URLs are accepted by one precompiled match before falling
+    back to validators.url().
+    
     Args:
         url: URL to validate
     
@@ -67,6 +109,9 @@ def validate_url(url: str) -> bool:
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
     
+    if _SIMPLE_URL_PATTERN.match(url):
+        return True
+    
     return validators.url(url) is True
 
 
@@ -93,6 +138,7 @@ def normalize_url(url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=1024)  # inputs can be long descriptions
 def clean_text(text: str) -> str:
     """
     Clean and normalize text.
@@ -110,11 +156,12 @@ def clean_text(text: str) -> str:
     text = ' '.join(text.split())
     
     # Remove special characters (keep alphanumeric, spaces, and common punctuation)
-    text = re.sub(r'[^\w\s\-.,!?()&]', '', text)
+    text = _SPECIAL_CHARS_PATTERN.sub('', text)
     
     return text.strip()
 
 
+@lru_cache(maxsize=4096)
 def clean_company_name(name: str) -> str:
     """
     Clean and normalize company name.
@@ -128,16 +175,13 @@ def clean_company_name(name: str) -> str:
     if not name:
         return ""
     
-    # Remove common suffixes
-    suffixes = [
-        r'\s+Inc\.?$', r'\s+LLC\.?$', r'\s+Ltd\.?$', r'\s+Limited$',
-        r'\s+Corp\.?$', r'\s+Corporation$', r'\s+Co\.?$', r'\s+Company$',
-        r'\s+GmbH$', r'\s+S\.A\.?$', r'\s+AG$', r'\s+PLC$'
-    ]
-    
+    # Remove common suffixes; each is stripped in turn, so "Acme Co Inc"
+    # loses both. If the raw name does not end in one, none can match later
     cleaned = name
-    for suffix in suffixes:
-        cleaned = re.sub(suffix, '', cleaned, flags=re.IGNORECASE)
+    words = name.split()
+    if words and words[-1].rstrip('.').casefold() in _COMPANY_SUFFIX_WORDS:
+        for pattern in _COMPANY_SUFFIX_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
     
     # Clean text
     cleaned = clean_text(cleaned)
@@ -145,6 +189,29 @@ def clean_company_name(name: str) -> str:
     return cleaned
 
 
+def clean_company_names(names: pd.Series) -> pd.Series:
+    """
+    clean_company_name() over a Series of names.
+    
+    Runs the per-name path rather than column-wise str.replace(): that
+    applies all twelve suffix patterns to every row (through Python's re,
+    being case-insensitive), while clean_company_name() skips them for
+    names without a legal suffix and caches repeated names. Missing
+    values become empty strings.
+    
+    Args:
+        names: Series of raw company names
+    
+    Returns:
+        Series of cleaned company names
+    """
+    raw = names.fillna('').astype(str)
+    return pd.Series(
+        [clean_company_name(name) for name in raw.tolist()],
+        index=raw.index, name=raw.name, dtype=raw.dtype
+    )
+
+
 def extract_email(text: str) -> Optional[str]:
     """
     Extract email address from text.
@@ -158,8 +225,7 @@ def extract_email(text: str) -> Optional[str]:
     if not text:
         return None
     
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_PATTERN.search(text)
     
     return match.group(0) if match else None
 
@@ -177,18 +243,26 @@ def extract_phone(text: str) -> Optional[str]:
     if not text:
         return None
     
-    # Simple phone pattern (can be improved)
-    phone_pattern = r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}'
-    match = re.search(phone_pattern, text)
+    match = _PHONE_PATTERN.search(text)
     
     return match.group(0) if match else None
 
 
+def _backoff_delays(delay: float, backoff: float, max_delay: float, jitter: bool) -> Iterator[float]:
+    """Successive retry waits: exponential, capped at max_delay, optionally jittered."""
+    while True:
+        # +-50% jitter keeps workers that failed together from retrying together
+        yield delay * random.uniform(0.5, 1.5) if jitter else delay
+        delay = min(delay * backoff, max_delay)
+
+
 def retry_on_exception(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    max_delay: float = 60.0,
+    jitter: bool = True
 ) -> Callable:
     """
     Decorator to retry function on exception with exponential backoff.
@@ -198,6 +272,8 @@ def retry_on_exception(
         delay: Initial delay between retries in seconds
         backoff: Backoff multiplier for delay
         exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound for the delay between retries in seconds
+        jitter: Randomize each delay by +-50%
     
     Returns:
         Decorated function
@@ -210,7 +286,7 @@ def retry_on_exception(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            current_delay = delay
+            delays = _backoff_delays(delay, backoff, max_delay, jitter)
             last_exception = None
             
             for attempt in range(max_retries + 1):
@@ -220,12 +296,12 @@ def retry_on_exception(
                     last_exception = e
                     
                     if attempt < max_retries:
+                        current_delay = next(delays)
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {e}. "
                             f"Retrying in {current_delay:.1f}s..."
                         )
                         time.sleep(current_delay)
-                        current_delay *= backoff
                     else:
                         logger.error(
                             f"All {max_retries} retry attempts failed for {func.__name__}: {e}"
@@ -238,6 +314,62 @@ def retry_on_exception(
     return decorator
 
 
+def async_retry_on_exception(
+    max_retries: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    exceptions: tuple = (Exception,),
+    max_delay: float = 60.0,
+    jitter: bool = True
+) -> Callable:
+    """
+    Async variant of retry_on_exception() for coroutine functions.
+    
+    Waits with asyncio.sleep(), so the event loop keeps serving other
+    requests while one is backing off.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff: Backoff multiplier for delay
+        exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound for the delay between retries in seconds
+        jitter: Randomize each delay by +-50%
+    
+    Returns:
+        Decorated coroutine function
+    
+    Example:
+        @async_retry_on_exception(max_retries=3, exceptions=(httpx.HTTPError,))
+        async def fetch_data(client):
+            return await client.get("https://example.com")
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            delays = _backoff_delays(delay, backoff, max_delay, jitter)
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt >= max_retries:
+                        logger.error(
+                            f"All {max_retries} retry attempts failed for {func.__name__}: {e}"
+                        )
+                        raise
+                    
+                    current_delay = next(delays)
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {e}. "
+                        f"Retrying in {current_delay:.1f}s..."
+                    )
+                    await asyncio.sleep(current_delay)
+        
+        return wrapper
+    return decorator
+
+
 def rate_limit(calls: int = 1, period: float = 1.0) -> Callable:
     """
     Decorator to rate limit function calls.
@@ -337,6 +469,28 @@ def safe_get(dictionary: dict, *keys, default=None) -> Any:
     return current if current is not None else default
 
 
+def iter_chunks(lst: list, chunk_size: int) -> Iterator[list]:
+    """
+    Yield consecutive chunks of a list.
+    
+    Only the chunk being processed is held in memory, so prefer this over
+    chunk_list() when the chunks are just iterated.
+    
+    Args:
+        lst: List to split
+        chunk_size: Size of each chunk
+    
+    Yields:
+        Chunks of at most chunk_size items
+    
+    Example:
+        >>> list(iter_chunks([1, 2, 3, 4, 5], 2))
+        [[1, 2], [3, 4], [5]]
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
+
+
 def chunk_list(lst: list, chunk_size: int) -> list:
     """
     Split list into chunks.
@@ -352,7 +506,7 @@ def chunk_list(lst: list, chunk_size: int) -> list:
         >>> chunk_list([1, 2, 3, 4, 5], 2)
         [[1, 2], [3, 4], [5]]
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(iter_chunks(lst, chunk_size))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+# OpenLead Intelligence - Shared HTTP Clients
+
+"""
+Process-wide httpx clients with HTTP/2 and keep-alive connection pooling.
+Scripts and helpers that make ad-hoc requests outside a BaseScraper use
+these instead of one-off requests.get() calls, so connections (and their
+TLS handshakes) are reused.
+"""
+
+import atexit
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+
+from config import settings
+
+_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=200)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+# Async clients are bound to the event loop they first connect on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _client_options() -> dict:
+    """Options shared by the sync and async clients."""
+    headers = settings.get_headers()
+    # httpx advertises only the encodings it can decode
+    headers.pop('Accept-Encoding', None)
+    return {
+        'http2': True,
+        'headers': headers,
+        'timeout': settings.request_timeout,
+        'limits': _LIMITS,
+        'follow_redirects': True,
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the shared synchronous HTTP client, creating it on first use.
+    
+    Returns:
+        httpx.Client
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(**_client_options())
+        return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client for the running event loop.
+    
+    A separate client is kept per loop, since pooled connections cannot
+    be reused once the loop that opened them (e.g. an asyncio.run() call)
+    has finished.
+    
+    Returns:
+        httpx.AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(**_client_options())
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_http_client():
+    """
+    Close the running event loop's async client, if it has one.
+    
+    Await this before the loop finishes (e.g. at the end of the coroutine
+    passed to asyncio.run()); atexit cannot close connections of a loop
+    that has already been closed.
+    """
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@atexit.register
+def close_http_client():
+    """Close the shared synchronous client's connections at interpreter exit."""
+    if _client is not None:
+        _client.close()
+
+
+if __name__ == "__main__":
+    # Test shared client
+    print("Shared HTTP client")
+    print("\nExample usage:")
+    print("  from utils.http_client import get_http_client")
+    print("  resp = get_http_client().get('https://example.com')")
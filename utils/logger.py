@@ -12,9 +12,37 @@ from logging.handlers import RotatingFileHandler
 from typing import Optional
 import colorlog
 
+# Level names accepted by Logger; unknown names fall back to INFO
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+
+class _DeferredRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates its directory and file on first write."""
+    
+    def __init__(self, filename: Path, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 
 class Logger:
-    """Custom logger with file and console handlers."""
+    """
+    Custom logger with file and console handlers.
+    
+    Level methods accept %-style arguments, which logging only formats
+    when the record is actually emitted.
+    """
+    
+    __slots__ = ('name', 'log_dir', 'log_level', 'log_to_file', 'log_to_console',
+                 'logger', '_initialized')
     
     _instances = {}
     
@@ -24,6 +52,7 @@ class Logger:
         """Singleton pattern to avoid duplicate loggers."""
         if name not in cls._instances:
             instance = super().__new__(cls)
+            instance._initialized = False
             cls._instances[name] = instance
         return cls._instances[name]
     
@@ -41,12 +70,12 @@ class Logger:
             log_to_console: Enable console logging
         """
         # Avoid re-initialization
-        if hasattr(self, '_initialized'):
+        if self._initialized:
             return
         
         self.name = name
         self.log_dir = log_dir or Path("logs")
-        self.log_level = getattr(logging, log_level.upper())
+        self.log_level = _LEVEL_MAP.get(log_level.upper(), logging.INFO)
         self.log_to_file = log_to_file
         self.log_to_console = log_to_console
         
@@ -89,13 +118,16 @@ class Logger:
         self.logger.addHandler(console_handler)
     
     def _add_file_handler(self):
-        """Add rotating file handler."""
-        # Ensure log directory exists
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        """
+        Add rotating file handler.
         
+        Every module gets its own logger, so the log directory and file are
+        only created once a record is written; modules that never log at
+        the configured level leave no empty files or open handles behind.
+        """
         # Create rotating file handler (10MB per file, keep 5 backups)
         log_file = self.log_dir / f"{self.name}.log"
-        file_handler = RotatingFileHandler(
+        file_handler = _DeferredRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
@@ -112,35 +144,38 @@ class Logger:
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message."""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message."""
-        self.logger.error(message, **kwargs)
+        self.logger.error(message, *args, **kwargs)
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message."""
-        self.logger.critical(message, **kwargs)
+        self.logger.critical(message, *args, **kwargs)
     
-    def exception(self, message: str, **kwargs):
+    def exception(self, message: str, *args, **kwargs):
         """Log exception with traceback."""
-        self.logger.exception(message, **kwargs)
+        self.logger.exception(message, *args, **kwargs)
 
 
 def get_logger(name: str = "openlead", **kwargs) -> Logger:
     """
     Get or create a logger instance.
     
+    An existing logger is returned as is (its settings are fixed by the
+    first call), without going through Logger construction again.
+    
     Args:
         name: Logger name
         **kwargs: Additional arguments for Logger initialization
@@ -148,6 +183,9 @@ def get_logger(name: str = "openlead", **kwargs) -> Logger:
     Returns:
         Logger instance
     """
+    logger = Logger._instances.get(name)
+    if logger is not None:
+        return logger
     return Logger(name, **kwargs)
 
 